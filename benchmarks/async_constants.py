@@ -0,0 +1,40 @@
+"""Measure async resolution of a graph made mostly of constants and started singletons.
+
+Run:
+    python benchmarks/async_constants.py
+"""
+
+import asyncio
+import time
+
+import diject as di
+
+CONSTANTS = 500
+ITERATIONS = 2_000
+
+
+class MainContainer(di.Container):
+    settings = di.Dict({f"key_{i}": di.Object(i) for i in range(CONSTANTS)})
+    client = di.Singleton[dict]()
+    service = di.Transient[dict](settings=settings, client=client)
+
+
+async def measure(provider: object) -> float:
+    await di.aprovide(provider)
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await di.aprovide(provider)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    await MainContainer.astart()
+
+    for name in ("settings", "service"):
+        elapsed = await measure(getattr(MainContainer, name))
+        print(f"{name:>10}: {ITERATIONS / elapsed:12,.0f} resolutions/s ({CONSTANTS} constants)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
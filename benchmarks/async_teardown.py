@@ -0,0 +1,51 @@
+"""Measure latency of async handlers using many resources created by async generators.
+
+Run:
+    python benchmarks/async_teardown.py
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import diject as di
+
+RESOURCES = (1, 16, 64, 256)
+REQUESTS = 50
+RELEASE_DELAY = 0.001
+
+
+async def create_connection(index: int) -> AsyncIterator[int]:
+    yield index
+    # Returning a connection to the pool takes a network round trip
+    await asyncio.sleep(RELEASE_DELAY)
+
+
+def create_handler(resources: int) -> Callable[[], Awaitable[int]]:
+    connections: Any = di.List([di.Transient[create_connection](index=i) for i in range(resources)])
+
+    @di.inject
+    async def handler(values: list[int] = connections) -> int:
+        return len(values)
+
+    return handler
+
+
+async def measure(resources: int) -> float:
+    handler = create_handler(resources)
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await handler()
+    return (time.perf_counter() - start) / REQUESTS
+
+
+async def main() -> None:
+    for resources in RESOURCES:
+        elapsed = await measure(resources)
+        print(f"{resources:>5} resources: {elapsed * 1000:8.2f} ms/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
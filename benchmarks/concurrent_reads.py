@@ -0,0 +1,48 @@
+"""Measure throughput of resolving constant providers from many threads.
+
+Run:
+    python benchmarks/concurrent_reads.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import diject as di
+
+THREADS = 32
+ITERATIONS = 20_000
+
+
+class MainContainer(di.Container):
+    config = di.Object("value")
+    selector = di.Selector["a"](
+        a=di.Object("a"),
+        b=di.Object("b"),
+    )
+    singleton = di.Singleton[dict](key=config)
+
+
+def resolve(provider: object) -> None:
+    for _ in range(ITERATIONS):
+        di.provide(provider)
+
+
+def measure(provider: object) -> float:
+    di.provide(provider)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        for future in [executor.submit(resolve, provider) for _ in range(THREADS)]:
+            future.result()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for name in ("config", "selector", "singleton"):
+        elapsed = measure(getattr(MainContainer, name))
+        operations = THREADS * ITERATIONS
+        print(f"{name:>10}: {operations / elapsed:12,.0f} resolutions/s ({THREADS} threads)")
+
+
+if __name__ == "__main__":
+    main()
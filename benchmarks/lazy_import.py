@@ -0,0 +1,87 @@
+"""Compare import time of a container referencing factories directly and by import path.
+
+Run:
+    python benchmarks/lazy_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+FACTORIES = [
+    "http.server:HTTPServer",
+    "xml.dom.minidom:Document",
+    "email.mime.text:MIMEText",
+    "sqlite3:connect",
+    "decimal:Decimal",
+    "logging.handlers:RotatingFileHandler",
+    "tarfile:TarFile",
+    "zipfile:ZipFile",
+    "ssl:create_default_context",
+    "urllib.request:urlopen",
+    "xmlrpc.client:ServerProxy",
+    "smtplib:SMTP",
+    "pydoc:Helper",
+    "multiprocessing.managers:SyncManager",
+]
+
+REPEATS = 5
+
+
+def create_module(directory: Path, name: str, *, lazy: bool) -> None:
+    lines = ["import diject as di", ""]
+
+    if not lazy:
+        for i, factory in enumerate(FACTORIES):
+            module, _, attr = factory.partition(":")
+            lines.append(f"from {module} import {attr} as factory_{i}")
+        lines.append("")
+
+    lines.append("class MainContainer(di.Container):")
+    for i, factory in enumerate(FACTORIES):
+        callable = f'"{factory}"' if lazy else f"factory_{i}"
+        lines.append(f"    provider_{i} = di.Singleton[{callable}]()")
+
+    (directory / f"{name}.py").write_text("\n".join(lines) + "\n")
+
+
+def measure(directory: Path, name: str) -> float:
+    # diject is imported before measurement, so only importing of factories is compared
+    code = textwrap.dedent(f"""
+        import time
+        import diject
+        start = time.perf_counter()
+        import {name}
+        print(time.perf_counter() - start)
+    """)
+    timings = []
+    for _ in range(REPEATS):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(result.stdout))
+    return statistics.median(timings)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        create_module(directory, "eager_container", lazy=False)
+        create_module(directory, "lazy_container", lazy=True)
+
+        eager = measure(directory, "eager_container")
+        lazy = measure(directory, "lazy_container")
+
+    print(f"eager import: {eager * 1000:8.1f} ms")
+    print(f"lazy import:  {lazy * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare sequential and parallel resolution of a wide graph of slow synchronous factories.
+
+Run:
+    python benchmarks/wide_graph.py
+"""
+
+import time
+
+import diject as di
+
+WIDTH = 8
+LEAVES = 4
+DELAY = 0.02
+
+
+def create_client(*dependencies: object) -> tuple[object, ...]:
+    time.sleep(DELAY)
+    return dependencies
+
+
+def build_graph(*, parallel: bool) -> object:
+    # Every branch has its own leaves and all of them share one scoped connection
+    connection = di.Scoped[create_client]()
+    branches = [
+        di.Scoped[create_client](connection, *(di.Transient[create_client]() for _ in range(LEAVES)))
+        for _ in range(WIDTH)
+    ]
+    return di.Transient(parallel=parallel)[create_client](*branches)
+
+
+def measure(root: object) -> float:
+    start = time.perf_counter()
+    with di.inject():
+        di.provide(root)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for name, parallel in (("sequential", False), ("parallel", True)):
+        elapsed = measure(build_graph(parallel=parallel))
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms ({WIDTH * (LEAVES + 1) + 2} factories, {DELAY}s each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,57 +2,97 @@ from typing import Any
 
 from diject.container import Container
 from diject.functions import (
+    ainvalidate,
     alias,
     aprovide,
+    aprovide_keyed,
+    aprovide_many,
+    aprovide_n,
     ashutdown,
     astart,
+    astart_for,
+    aswitch,
     atravers,
+    create_task,
     inject,
+    invalidate,
+    map,  # noqa: A004
     patch,
     provide,
+    provide_keyed,
+    provide_many,
+    provide_n,
+    record,
     shutdown,
     start,
+    start_for,
     status,
+    submit,
+    switch,
     travers,
 )
 from diject.providers.collections.dict import DictPretenderBuilder
 from diject.providers.collections.list import ListPretenderBuilder
 from diject.providers.collections.tuple import TuplePretenderBuilder
-from diject.providers.creators.creator import CreatorPretenderBuilder
+from diject.providers.creators.creator import ConfiguredCreatorPretenderBuilder, CreatorPretenderBuilder
+from diject.providers.creators.keyed import KeyedPretenderBuilder
+from diject.providers.creators.loop_local import LoopLocalProvider
 from diject.providers.creators.scoped import ScopedProvider
 from diject.providers.creators.singleton import SingletonProvider
+from diject.providers.creators.thread_local import ThreadLocalPretenderBuilder
 from diject.providers.creators.transient import TransientProvider
 from diject.providers.object import ObjectPretenderBuilder
 from diject.providers.selector import SelectorPretenderBuilder
+from diject.tools.executor import ContextExecutor
 from diject.tools.partial import PartialPretenderBuilder
 
 __all__ = [
     "Container",
+    "ContextExecutor",
     "Dict",
+    "Keyed",
     "List",
+    "LoopLocal",
     "Object",
     "Partial",
     "Scoped",
     "Selector",
     "Singleton",
+    "ThreadLocal",
     "Transient",
     "Tuple",
     "__version__",
+    "ainvalidate",
     "alias",
     "aprovide",
+    "aprovide_keyed",
+    "aprovide_many",
+    "aprovide_n",
     "ashutdown",
     "astart",
+    "astart_for",
+    "aswitch",
     "atravers",
     "container",
+    "create_task",
     "exceptions",
     "functions",
     "inject",
+    "invalidate",
+    "map",
     "patch",
     "provide",
+    "provide_keyed",
+    "provide_many",
+    "provide_n",
     "providers",
+    "record",
     "shutdown",
     "start",
+    "start_for",
     "status",
+    "submit",
+    "switch",
     "tools",
     "travers",
     "utils",
@@ -61,33 +101,51 @@ __all__ = [
 __version__ = "0.8.0"
 
 Dict: DictPretenderBuilder
+Keyed: KeyedPretenderBuilder
 List: ListPretenderBuilder
+LoopLocal: CreatorPretenderBuilder[LoopLocalProvider]
 Object: ObjectPretenderBuilder
 Partial: PartialPretenderBuilder
-Scoped: CreatorPretenderBuilder[ScopedProvider]
+Scoped: ConfiguredCreatorPretenderBuilder[ScopedProvider]
 Selector: SelectorPretenderBuilder
-Singleton: CreatorPretenderBuilder[SingletonProvider]
-Transient: CreatorPretenderBuilder[TransientProvider]
+Singleton: ConfiguredCreatorPretenderBuilder[SingletonProvider]
+ThreadLocal: ThreadLocalPretenderBuilder
+Transient: ConfiguredCreatorPretenderBuilder[TransientProvider]
 Tuple: TuplePretenderBuilder
 
 
 def __getattr__(name: str) -> Any:
+    builder = _create_pretender_builder(name)
+    if builder is not None:
+        # Builders are stateless, cache them so next lookups skip module `__getattr__`
+        globals()[name] = builder
+    return builder
+
+
+def _create_pretender_builder(name: str) -> Any:
     match name:
         case "Dict":
             return DictPretenderBuilder()
+        case "Keyed":
+            return KeyedPretenderBuilder()
         case "List":
             return ListPretenderBuilder()
+        case "LoopLocal":
+            return CreatorPretenderBuilder(LoopLocalProvider)
         case "Object":
             return ObjectPretenderBuilder()
         case "Partial":
             return PartialPretenderBuilder()
         case "Scoped":
-            return CreatorPretenderBuilder(ScopedProvider)
+            return ConfiguredCreatorPretenderBuilder(ScopedProvider)
         case "Selector":
             return SelectorPretenderBuilder()
         case "Singleton":
-            return CreatorPretenderBuilder(SingletonProvider)
+            return ConfiguredCreatorPretenderBuilder(SingletonProvider)
+        case "ThreadLocal":
+            return ThreadLocalPretenderBuilder()
         case "Transient":
-            return CreatorPretenderBuilder(TransientProvider)
+            return ConfiguredCreatorPretenderBuilder(TransientProvider)
         case "Tuple":
             return TuplePretenderBuilder()
+    return None
@@ -1,14 +1,26 @@
 import asyncio
+import contextvars
+import os
 import warnings
 from abc import ABCMeta
-from collections.abc import AsyncIterator, Iterator
-from typing import Any, TypeVar, overload
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, ClassVar, TypeVar, overload
 
 from diject import functions
 from diject.exceptions import DIContainerError, DIErrorWrapper
+from diject.providers.collections.dict import DictProvider
+from diject.providers.collections.list import ListProvider
+from diject.providers.collections.tuple import TupleProvider
+from diject.providers.creators.creator import CreatorProvider
 from diject.providers.object import ObjectProvider
 from diject.providers.provider import Provider
+from diject.tools.profile import load_profile
 from diject.utils.cast import any_as_provider
+from diject.utils.deadline import deadline
+from diject.utils.graph import clear_dependents_index
+from diject.utils.teardown import get_teardown
 
 TProvider = TypeVar("TProvider", bound=Provider)
 
@@ -31,7 +43,21 @@ class MetaContainer(ABCMeta):
             if isinstance(_value, Provider):
                 _value.__alias__ = f"{name}.{_key}"
 
-        return super().__new__(cls, name, parents, attributes)
+        clear_dependents_index()
+
+        container = super().__new__(cls, name, parents, attributes)
+
+        timeout = getattr(container, "__timeout__", None)
+        collection_limit = getattr(container, "__collection_limit__", None)
+        if timeout is not None or collection_limit is not None:
+            _set_defaults(
+                name,
+                attributes.values(),
+                timeout=timeout,
+                collection_limit=collection_limit,
+            )
+
+        return container
 
     def __call__(cls) -> None:
         raise DIContainerError("Container cannot be instantiated")
@@ -56,6 +82,11 @@ class MetaContainer(ABCMeta):
 
 
 class Container(metaclass=MetaContainer):
+    # Default timeout of asynchronous creation of providers defined in the container body
+    __timeout__: ClassVar[float | None] = None
+    # Default number of elements of collections defined in the container body resolved at once
+    __collection_limit__: ClassVar[int | None] = None
+
     @classmethod
     @overload
     def travers(
@@ -232,10 +263,27 @@ class Container(metaclass=MetaContainer):
                     yield _name, _provider
 
     @classmethod
-    def start(cls) -> None:
-        """Start the providers."""
+    def start(
+        cls,
+        *,
+        profile: str | os.PathLike[str] | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Start the providers.
+
+        Args:
+            profile: Path to a profile saved by `di.record`. If given, only providers listed in
+                the profile are started (concurrently) instead of all public providers. If the
+                profile does not exist yet (e.g. on the first boot), all providers are started.
+            timeout: Deadline (in seconds) for starting all providers.
+
+        """
         try:
-            cls.__start__()
+            with deadline(timeout):
+                if profile is None or not cls.__has_profile(profile):
+                    cls.__start__()
+                else:
+                    cls.__start_profile__(profile)
         except DIErrorWrapper as exc:
             raise exc.origin from exc.caused_by
 
@@ -249,10 +297,40 @@ class Container(metaclass=MetaContainer):
                 obj.__start__()
 
     @classmethod
-    async def astart(cls) -> None:
-        """Start the providers asynchronously."""
+    def __start_profile__(cls, profile: str | os.PathLike[str]) -> None:
+        providers = cls.__profile_providers(profile)
+        if providers:
+            with ThreadPoolExecutor(max_workers=min(32, len(providers))) as executor:
+                futures = [
+                    # Deadline of the start is kept by context copied to the worker
+                    executor.submit(contextvars.copy_context().run, provider.__start__)
+                    for provider in providers
+                ]
+                for future in futures:
+                    future.result()
+
+    @classmethod
+    async def astart(
+        cls,
+        *,
+        profile: str | os.PathLike[str] | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Start the providers asynchronously.
+
+        Args:
+            profile: Path to a profile saved by `di.record`. If given, only providers listed in
+                the profile are started (concurrently) instead of all public providers. If the
+                profile does not exist yet (e.g. on the first boot), all providers are started.
+            timeout: Deadline (in seconds) for starting all providers.
+
+        """
         try:
-            await cls.__astart__()
+            with deadline(timeout):
+                if profile is None or not cls.__has_profile(profile):
+                    await cls.__astart__()
+                else:
+                    await cls.__astart_profile__(profile)
         except DIErrorWrapper as exc:
             raise exc.origin from exc.caused_by
 
@@ -269,9 +347,15 @@ class Container(metaclass=MetaContainer):
             ),
         )
 
+    @classmethod
+    async def __astart_profile__(cls, profile: str | os.PathLike[str]) -> None:
+        providers = cls.__profile_providers(profile)
+        await asyncio.gather(*(provider.__astart__() for provider in providers))
+
     @classmethod
     def shutdown(cls) -> None:
-        """Shutdown the providers."""
+        """Shutdown the providers, after closing contexts waiting for deferred teardown."""
+        get_teardown().flush()
         try:
             cls.__shutdown__()
         except DIErrorWrapper as exc:
@@ -288,7 +372,8 @@ class Container(metaclass=MetaContainer):
 
     @classmethod
     async def ashutdown(cls) -> None:
-        """Shutdown the providers asynchronously."""
+        """Shutdown the providers asynchronously, after closing contexts waiting for teardown."""
+        await get_teardown().aflush()
         try:
             await cls.__ashutdown__()
         except DIErrorWrapper as exc:
@@ -307,8 +392,121 @@ class Container(metaclass=MetaContainer):
             ),
         )
 
+    @classmethod
+    def update(cls, **values: Any) -> list[str]:
+        """Replace values of objects and rebuild only the singletons depending on them.
+
+        Args:
+            **values: New values of `di.Object` providers defined in the container.
+
+        Returns:
+            list[str]: Aliases of restarted singletons.
+
+        Raises:
+            DIContainerError: If a name does not refer to `di.Object` provider.
+
+        """
+        providers = cls.__update_objects(values)
+        return functions.invalidate(*providers)
+
+    @classmethod
+    async def aupdate(cls, **values: Any) -> list[str]:
+        """Replace values of objects and rebuild asynchronously the singletons depending on them.
+
+        Args:
+            **values: New values of `di.Object` providers defined in the container.
+
+        Returns:
+            list[str]: Aliases of restarted singletons.
+
+        Raises:
+            DIContainerError: If a name does not refer to `di.Object` provider.
+
+        """
+        providers = cls.__update_objects(values)
+        return await functions.ainvalidate(*providers)
+
+    @classmethod
+    def __update_objects(cls, values: dict[str, Any]) -> list[ObjectProvider]:
+        providers = []
+        for name, value in values.items():
+            provider = getattr(cls, name, None)
+            if not isinstance(provider, ObjectProvider):
+                raise DIContainerError(f"'{cls.__qualname__}.{name}' is not di.Object provider")
+            providers.append(provider)
+
+        for provider, value in zip(providers, values.values(), strict=True):
+            provider.__update__(value)
+
+        return providers
+
+    @classmethod
+    def __has_profile(cls, profile: str | os.PathLike[str]) -> bool:
+        if Path(profile).exists():
+            return True
+
+        warnings.warn(
+            f"Profile '{profile}' does not exist, all providers of {cls.__qualname__} are started",
+        )
+        return False
+
+    @classmethod
+    def __profile_providers(cls, profile: str | os.PathLike[str]) -> list[Provider]:
+        providers = {
+            alias: provider
+            for _, provider in cls.__travers__(
+                types=Provider,
+                recursive=True,
+                only_public=False,
+                only_selected=False,
+                cache=set(),
+            )
+            if (alias := provider.__alias__)
+        }
+
+        selected = []
+        for alias in load_profile(profile):
+            if alias in providers:
+                selected.append(providers[alias])
+            else:
+                warnings.warn(f"Provider '{alias}' from profile is not defined in {cls.__qualname__}")
+
+        return selected
+
     @classmethod
     def __iter(cls, *, only_public: bool = False) -> Iterator[tuple[str, Any]]:
         for name in list(vars(cls)):
             if not ((only_public and name.startswith("_")) or name.startswith("__")):
                 yield name, getattr(cls, name)
+
+
+def _set_defaults(
+    name: str,
+    objs: Iterable[Any],
+    *,
+    timeout: float | None,
+    collection_limit: int | None,
+) -> None:
+    # Nested providers are owned by the container as well, providers of other containers are not
+    stack = [obj for obj in objs if isinstance(obj, Provider)]
+    visited: set[Provider] = set()
+    while stack:
+        provider = stack.pop()
+        if provider in visited:
+            continue
+        visited.add(provider)
+
+        if isinstance(provider, CreatorProvider) and provider.__default_timeout__ is None:
+            provider.__default_timeout__ = timeout
+
+        if (
+            isinstance(provider, (ListProvider, TupleProvider, DictProvider))
+            and provider.__limit__ is None
+        ):
+            provider.__limit__ = collection_limit
+
+        stack.extend(
+            dependency
+            for _, dependency in provider.__travers__()
+            if dependency.__alias__.startswith(f"{name}.")
+        )
@@ -50,3 +50,11 @@ class DISelectorError(DIError):
 
 class DIObjectError(DIError):
     pass
+
+
+class DIProfileError(DIError):
+    pass
+
+
+class DITimeoutError(DIError):
+    pass
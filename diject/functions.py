@@ -1,14 +1,39 @@
 import asyncio
-from collections.abc import AsyncIterator, Callable, Iterator
-from typing import Any, ParamSpec, TypeVar, overload
+import os
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, TypeVar, overload
 from unittest import mock
 
 from diject.exceptions import DIErrorWrapper, DITypeError
 from diject.injector import Injector
+from diject.providers.creators.keyed import KeyedProvider
+from diject.providers.creators.singleton import SingletonProvider
+from diject.providers.creators.transient import TransientProvider
 from diject.providers.provider import Provider
 from diject.providers.selector import SelectorProvider
 from diject.tools.patch import Patch
+from diject.tools.profile import Recorder
+from diject.utils import propagate
+from diject.utils.batch import map_batches
+from diject.utils.deadline import deadline
+from diject.utils.graph import get_transitive_dependents
 from diject.utils.status import Status
+from diject.utils.tasks import aprovide_all
+from diject.utils.teardown import get_teardown
+
+if TYPE_CHECKING:
+    from diject.container import Container
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -295,112 +320,454 @@ async def atravers_provider(
 
 # PROVIDE ------------------------------------------------------------------------------------------
 @overload
-def provide(obj: Provider[T], /) -> T:
+def provide(obj: Provider[T], /, *, timeout: float | None = None) -> T:
     pass
 
 
 @overload
-def provide(obj: T, /) -> T:
+def provide(obj: T, /, *, timeout: float | None = None) -> T:
     pass
 
 
-def provide(obj: Any, /) -> Any:
+def provide(obj: Any, /, *, timeout: float | None = None) -> Any:
     """Provide a value from a Provider object.
 
     Args:
         obj (Any): Provider instance.
+        timeout: Deadline (in seconds) for creating the value and its dependencies.
 
     Returns:
         Any: Provided value.
 
     Raises:
         DITypeError: If the object is not an instance of Provider.
+        DITimeoutError: If the creation exceeds the timeout.
 
     """
     if not isinstance(obj, Provider):
         raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
 
     try:
-        return obj.__provide__()
+        with deadline(timeout):
+            return obj.__provide__()
     except DIErrorWrapper as exc:
         raise exc.origin from exc.caused_by
 
 
 @overload
-async def aprovide(obj: Provider[T], /) -> T:
+async def aprovide(obj: Provider[T], /, *, timeout: float | None = None) -> T:
     pass
 
 
 @overload
-async def aprovide(obj: T, /) -> T:
+async def aprovide(obj: T, /, *, timeout: float | None = None) -> T:
     pass
 
 
-async def aprovide(obj: Any, /) -> Any:
+async def aprovide(obj: Any, /, *, timeout: float | None = None) -> Any:
     """Provide a value from a Provider object asynchronously.
 
     Args:
         obj (Any): Provider instance.
+        timeout: Deadline (in seconds) for creating the value and its dependencies.
 
     Returns:
         Any: Provided value.
 
     Raises:
         DITypeError: If the object is not an instance of Provider.
+        DITimeoutError: If the creation exceeds the timeout.
 
     """
     if not isinstance(obj, Provider):
         raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
 
     try:
-        return await obj.__aprovide__()
+        with deadline(timeout):
+            return await obj.__aprovide__()
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+# PROVIDE MANY -------------------------------------------------------------------------------------
+@overload
+def provide_many(objs: Mapping[KT, Any], /, *, timeout: float | None = None) -> dict[KT, Any]:
+    pass
+
+
+@overload
+def provide_many(objs: Sequence[Any], /, *, timeout: float | None = None) -> tuple[Any, ...]:
+    pass
+
+
+def provide_many(objs: Any, /, *, timeout: float | None = None) -> Any:
+    """Provide values from several Provider objects within one shared context.
+
+    Scoped dependencies common to the providers are created once. Without an active injection
+    context, a temporary one is used only for this call.
+
+    Args:
+        objs: A sequence or a mapping of Provider instances.
+        timeout: Deadline (in seconds) for creating all values and their dependencies.
+
+    Returns:
+        tuple | dict: Provided values, in the same shape as the given providers.
+
+    Raises:
+        DITypeError: If any of the objects is not an instance of Provider.
+        DITimeoutError: If the creation exceeds the timeout.
+
+    Example:
+        database, cache = di.provide_many([MainContainer.database, MainContainer.cache])
+
+    """
+    providers = _get_many_providers(objs)
+
+    try:
+        with deadline(timeout), Injector.share_context():
+            values = [provider.__provide__() for provider in providers]
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+    return _pack_many(objs, values)
+
+
+@overload
+async def aprovide_many(objs: Mapping[KT, Any], /, *, timeout: float | None = None) -> dict[KT, Any]:
+    pass
+
+
+@overload
+async def aprovide_many(objs: Sequence[Any], /, *, timeout: float | None = None) -> tuple[Any, ...]:
+    pass
+
+
+async def aprovide_many(objs: Any, /, *, timeout: float | None = None) -> Any:
+    """Provide values from several Provider objects concurrently within one shared context.
+
+    Args:
+        objs: A sequence or a mapping of Provider instances.
+        timeout: Deadline (in seconds) for creating all values and their dependencies.
+
+    Returns:
+        tuple | dict: Provided values, in the same shape as the given providers.
+
+    Raises:
+        DITypeError: If any of the objects is not an instance of Provider.
+        DITimeoutError: If the creation exceeds the timeout.
+
+    """
+    providers = _get_many_providers(objs)
+
+    try:
+        with deadline(timeout), Injector.share_context():
+            values = await aprovide_all(providers)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+    return _pack_many(objs, values)
+
+
+def _get_many_providers(objs: Sequence[Any] | Mapping[Any, Any]) -> list[Provider]:
+    providers = list(objs.values()) if isinstance(objs, Mapping) else list(objs)
+    for obj in providers:
+        if not isinstance(obj, Provider):
+            raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
+    return providers
+
+
+def _pack_many(objs: Sequence[Any] | Mapping[Any, Any], values: list[Any]) -> Any:
+    if isinstance(objs, Mapping):
+        return dict(zip(objs, values, strict=True))
+    return tuple(values)
+
+
+# PROVIDE N ----------------------------------------------------------------------------------------
+def provide_n(obj: Any, /, n: int, *, parallel: bool = False, timeout: float | None = None) -> list[Any]:
+    """Provide many instances from a Transient provider, resolving its shared arguments once.
+
+    Arguments which do not depend on transient providers (e.g. singletons, scoped objects and
+    constants) are resolved once and shared by all instances, while transient arguments are
+    created again for each instance.
+
+    Args:
+        obj: The TransientProvider instance.
+        n: The number of instances.
+        parallel (bool, optional): Whether to create the instances on a shared thread pool.
+            Defaults to False.
+        timeout: Deadline (in seconds) for creating all instances and their dependencies.
+
+    Returns:
+        list: Provided instances.
+
+    Raises:
+        DITypeError: If the object is not an instance of TransientProvider.
+        ValueError: If the number of instances is negative.
+        DITimeoutError: If the creation exceeds the timeout.
+
+    Example:
+        consumers = di.provide_n(MainContainer.consumer, 8)
+
+    """
+    if not isinstance(obj, TransientProvider):
+        raise DITypeError(f"Object {type(obj).__qualname__} is not TransientProvider")
+    if n < 0:
+        raise ValueError("Number of instances cannot be negative")
+
+    try:
+        with deadline(timeout):
+            return obj.__provide_n__(n, parallel=parallel)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+async def aprovide_n(obj: Any, /, n: int, *, timeout: float | None = None) -> list[Any]:
+    """Provide many instances from a Transient provider concurrently, resolving shared arguments once.
+
+    Args:
+        obj: The TransientProvider instance.
+        n: The number of instances.
+        timeout: Deadline (in seconds) for creating all instances and their dependencies.
+
+    Returns:
+        list: Provided instances.
+
+    Raises:
+        DITypeError: If the object is not an instance of TransientProvider.
+        ValueError: If the number of instances is negative.
+        DITimeoutError: If the creation exceeds the timeout.
+
+    """
+    if not isinstance(obj, TransientProvider):
+        raise DITypeError(f"Object {type(obj).__qualname__} is not TransientProvider")
+    if n < 0:
+        raise ValueError("Number of instances cannot be negative")
+
+    try:
+        with deadline(timeout):
+            return await obj.__aprovide_n__(n)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+# PROVIDE KEYED ------------------------------------------------------------------------------------
+def provide_keyed(obj: Any, /, key: Hashable, *, timeout: float | None = None) -> Any:
+    """Provide a value from a Keyed provider for the given key.
+
+    Args:
+        obj: The KeyedProvider instance.
+        key: The key of the instance, passed as the first argument of the callable.
+        timeout: Deadline (in seconds) for creating the value and its dependencies.
+
+    Returns:
+        Any: Provided value.
+
+    Raises:
+        DITypeError: If the object is not an instance of KeyedProvider.
+        DITimeoutError: If the creation exceeds the timeout.
+
+    Example:
+        client = di.provide_keyed(MainContainer.tenant_client, "tenant-a")
+
+    """
+    if not isinstance(obj, KeyedProvider):
+        raise DITypeError(f"Object {type(obj).__qualname__} is not KeyedProvider")
+
+    try:
+        with deadline(timeout):
+            return obj.__provide_key__(key)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+async def aprovide_keyed(obj: Any, /, key: Hashable, *, timeout: float | None = None) -> Any:
+    """Provide a value from a Keyed provider for the given key asynchronously.
+
+    Args:
+        obj: The KeyedProvider instance.
+        key: The key of the instance, passed as the first argument of the callable.
+        timeout: Deadline (in seconds) for creating the value and its dependencies.
+
+    Returns:
+        Any: Provided value.
+
+    Raises:
+        DITypeError: If the object is not an instance of KeyedProvider.
+        DITimeoutError: If the creation exceeds the timeout.
+
+    """
+    if not isinstance(obj, KeyedProvider):
+        raise DITypeError(f"Object {type(obj).__qualname__} is not KeyedProvider")
+
+    try:
+        with deadline(timeout):
+            return await obj.__aprovide_key__(key)
     except DIErrorWrapper as exc:
         raise exc.origin from exc.caused_by
 
 
 # START --------------------------------------------------------------------------------------------
-def start(obj: Any, /) -> None:
+def start(obj: Any, /, *, timeout: float | None = None) -> None:
     """Start the providers.
 
     Args:
         obj: The Provider instance.
+        timeout: Deadline (in seconds) for creating the providers.
 
     Raises:
         DITypeError: If the object is not an instance of Provider.
+        DITimeoutError: If the creation exceeds the timeout.
 
     """
     if not isinstance(obj, Provider):
         raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
 
     try:
-        obj.__start__()
+        with deadline(timeout):
+            obj.__start__()
     except DIErrorWrapper as exc:
         raise exc.origin from exc.caused_by
 
 
-async def astart(obj: Any, /) -> None:
+async def astart(obj: Any, /, *, timeout: float | None = None) -> None:
     """Start the providers asynchronously.
 
     Args:
         obj: The Provider instance.
+        timeout: Deadline (in seconds) for creating the providers.
 
     Raises:
         DITypeError: If the object is not an instance of Provider.
+        DITimeoutError: If the creation exceeds the timeout.
 
     """
     if not isinstance(obj, Provider):
         raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
 
     try:
-        await obj.__astart__()
+        with deadline(timeout):
+            await obj.__astart__()
     except DIErrorWrapper as exc:
         raise exc.origin from exc.caused_by
 
 
+# START FOR ----------------------------------------------------------------------------------------
+def start_for(*objs: Any, container: "type[Container] | None" = None) -> list[str]:
+    """Start only the providers required by the given functions or providers.
+
+    Providers are taken from the parameters of functions decorated with `di.inject` (defaults and
+    `Annotated` metadata). They are started together with their dependencies; for selectors only
+    the selected option is started.
+
+    Args:
+        *objs: Functions or Provider instances to start providers for.
+        container: Container used to report singletons which were not started.
+
+    Returns:
+        list[str]: Aliases of singletons defined in the container which were skipped.
+
+    Raises:
+        DITypeError: If the object is neither a Provider nor a callable.
+
+    Example:
+        skipped = di.start_for(main, container=MainContainer)
+
+    """
+    providers = _get_start_providers(objs)
+
+    try:
+        for provider in providers:
+            provider.__start__()
+
+        required = set(providers)
+        for provider in providers:
+            for _, p in _travers(
+                provider=provider,
+                types=Provider,
+                recursive=True,
+                only_selected=True,
+                cache=set(),
+            ):
+                required.add(p)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+    return _get_skipped_singletons(container, required)
+
+
+async def astart_for(*objs: Any, container: "type[Container] | None" = None) -> list[str]:
+    """Start asynchronously only the providers required by the given functions or providers.
+
+    Args:
+        *objs: Functions or Provider instances to start providers for.
+        container: Container used to report singletons which were not started.
+
+    Returns:
+        list[str]: Aliases of singletons defined in the container which were skipped.
+
+    Raises:
+        DITypeError: If the object is neither a Provider nor a callable.
+
+    """
+    providers = _get_start_providers(objs)
+
+    try:
+        await asyncio.gather(*(provider.__astart__() for provider in providers))
+
+        required = set(providers)
+        for provider in providers:
+            async for _, p in _atravers(
+                provider=provider,
+                types=Provider,
+                recursive=True,
+                only_selected=True,
+                lock=asyncio.Lock(),
+                cache=set(),
+            ):
+                required.add(p)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+    return _get_skipped_singletons(container, required)
+
+
+def _get_start_providers(objs: tuple[Any, ...]) -> list[Provider]:
+    providers: dict[Provider, None] = {}
+    for obj in objs:
+        if isinstance(obj, Provider):
+            providers[obj] = None
+        elif callable(obj):
+            providers.update(dict.fromkeys(Injector.get_providers(obj).values()))
+        else:
+            raise DITypeError(f"Object {type(obj).__qualname__} is not Provider or callable")
+    return list(providers)
+
+
+def _get_skipped_singletons(
+    container: "type[Container] | None",
+    required: set[Provider],
+) -> list[str]:
+    if container is None:
+        return []
+
+    return [
+        provider.__alias__ or name
+        for name, provider in container.travers(
+            SingletonProvider,
+            recursive=True,
+            only_public=True,
+            only_selected=True,
+        )
+        if provider not in required
+    ]
+
+
 # SHUTDOWN -----------------------------------------------------------------------------------------
 def shutdown(obj: Any, /) -> None:
     """Shutdown the providers.
 
+    Contexts still waiting for deferred teardown are closed first.
+
     Args:
         obj: The Provider instance.
 
@@ -411,6 +778,8 @@ def shutdown(obj: Any, /) -> None:
     if not isinstance(obj, Provider):
         raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
 
+    get_teardown().flush()
+
     try:
         obj.__shutdown__()
     except DIErrorWrapper as exc:
@@ -420,6 +789,8 @@ def shutdown(obj: Any, /) -> None:
 async def ashutdown(obj: Any, /) -> None:
     """Shutdown the providers asynchronously.
 
+    Contexts still waiting for deferred teardown are closed first.
+
     Args:
         obj: The Provider instance.
 
@@ -430,26 +801,194 @@ async def ashutdown(obj: Any, /) -> None:
     if not isinstance(obj, Provider):
         raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
 
+    await get_teardown().aflush()
+
     try:
         await obj.__ashutdown__()
     except DIErrorWrapper as exc:
         raise exc.origin from exc.caused_by
 
 
+# INVALIDATE ---------------------------------------------------------------------------------------
+def invalidate(*objs: Any) -> list[str]:
+    """Rebuild running singletons which depend (directly or not) on the given providers.
+
+    Providers depending on the given ones are reset from the outermost dependent inwards (closing
+    their states), and singletons that were running are started again with new values. Other
+    providers are left untouched.
+
+    Args:
+        *objs: Provider instances whose values changed.
+
+    Returns:
+        list[str]: Aliases of restarted singletons.
+
+    Raises:
+        DITypeError: If the object is not an instance of Provider.
+
+    Example:
+        MainContainer.config.__update__({"debug": True})
+        di.invalidate(MainContainer.config)
+
+    """
+    try:
+        return _rebuild(_get_invalidated_providers(objs))
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+async def ainvalidate(*objs: Any) -> list[str]:
+    """Rebuild asynchronously running singletons which depend on the given providers.
+
+    Args:
+        *objs: Provider instances whose values changed.
+
+    Returns:
+        list[str]: Aliases of restarted singletons.
+
+    Raises:
+        DITypeError: If the object is not an instance of Provider.
+
+    """
+    try:
+        return await _arebuild(_get_invalidated_providers(objs))
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+def _rebuild(providers: list[Provider]) -> list[str]:
+    running = _get_running_singletons(providers)
+
+    for provider in providers:
+        provider.__reset__()
+
+    for provider in reversed(running):
+        provider.__start__()
+
+    return [provider.__alias__ for provider in reversed(running)]
+
+
+async def _arebuild(providers: list[Provider]) -> list[str]:
+    running = _get_running_singletons(providers)
+
+    for provider in providers:
+        await provider.__areset__()
+
+    for provider in reversed(running):
+        await provider.__astart__()
+
+    return [provider.__alias__ for provider in reversed(running)]
+
+
+def _get_invalidated_providers(objs: tuple[Any, ...]) -> list[Provider]:
+    for obj in objs:
+        if not isinstance(obj, Provider):
+            raise DITypeError(f"Object {type(obj).__qualname__} is not Provider")
+
+    return get_transitive_dependents(objs)
+
+
+def _get_running_singletons(providers: list[Provider]) -> list[Provider]:
+    return [
+        provider
+        for provider in providers
+        if isinstance(provider, SingletonProvider) and provider.__status__ is Status.RUNNING
+    ]
+
+
+# SWITCH -------------------------------------------------------------------------------------------
+def switch(obj: Any, /, option: str, *, timeout: float | None = 30.0) -> None:
+    """Switch the option of a selector (and all selectors within its group) at runtime.
+
+    The new option is started first, while requests are still served by the current option.
+    Then all selectors within the group are switched at once and running singletons depending on
+    them are rebuilt with the new option. Injection contexts which already use the previous option
+    keep using it until they are closed; the previous option is shut down after all of them are
+    finished.
+
+    Args:
+        obj: The SelectorProvider instance.
+        option: The option to switch to.
+        timeout: Maximum time in seconds to wait for contexts using the previous option. If it
+            elapses, the previous option is not shut down. `None` waits without limit.
+
+    Raises:
+        DITypeError: If the object is not an instance of SelectorProvider.
+
+    Example:
+        threading.Thread(target=di.switch, args=(Repositories.repository, "in_memory")).start()
+
+    """
+    if not isinstance(obj, SelectorProvider):
+        raise DITypeError(f"Object {type(obj).__qualname__} is not SelectorProvider")
+
+    try:
+        previous = obj.__switch__(option)
+        _rebuild(_get_invalidated_providers(tuple(obj.__group__)))
+        obj.__drain__(previous, timeout=timeout)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
+async def aswitch(obj: Any, /, option: str, *, timeout: float | None = 30.0) -> None:
+    """Switch the option of a selector (and all selectors within its group) asynchronously.
+
+    Args:
+        obj: The SelectorProvider instance.
+        option: The option to switch to.
+        timeout: Maximum time in seconds to wait for contexts using the previous option. If it
+            elapses, the previous option is not shut down. `None` waits without limit.
+
+    Raises:
+        DITypeError: If the object is not an instance of SelectorProvider.
+
+    Example:
+        asyncio.create_task(di.aswitch(Repositories.repository, "in_memory"))
+
+    """
+    if not isinstance(obj, SelectorProvider):
+        raise DITypeError(f"Object {type(obj).__qualname__} is not SelectorProvider")
+
+    try:
+        previous = await obj.__aswitch__(option)
+        await _arebuild(_get_invalidated_providers(tuple(obj.__group__)))
+        await obj.__adrain__(previous, timeout=timeout)
+    except DIErrorWrapper as exc:
+        raise exc.origin from exc.caused_by
+
+
 # INJECTOR -----------------------------------------------------------------------------------------
 @overload
 def inject(
-    func: Callable[P, T], *, reuse_context: bool = True,
+    func: Callable[P, T],
+    *,
+    reuse_context: bool = True,
+    parallel: bool = False,
+    defer_close: bool = False,
+    scope_items: int | None = None,
 ) -> Callable[P, T] | Callable[..., T]:
     pass
 
 
 @overload
-def inject(*, reuse_context: bool = True) -> Injector:
+def inject(
+    *,
+    reuse_context: bool = True,
+    parallel: bool = False,
+    defer_close: bool = False,
+    scope_items: int | None = None,
+) -> Injector:
     pass
 
 
-def inject(func: Any | None = None, *, reuse_context: bool = True) -> Any:
+def inject(
+    func: Any | None = None,
+    *,
+    reuse_context: bool = True,
+    parallel: bool = False,
+    defer_close: bool = False,
+    scope_items: int | None = None,
+) -> Any:
     """Dependency injection decorator or context creator.
 
     This function can be used either as:
@@ -467,18 +1006,143 @@ def inject(func: Any | None = None, *, reuse_context: bool = True) -> Any:
     Args:
         func (Any, optional): The target function to wrap. If None, returns an Injector instance.
         reuse_context (bool, optional): Whether to reuse the injection context. Defaults to True.
+        parallel (bool, optional): Whether to resolve parameters of a synchronous function
+            concurrently on a shared thread pool. Defaults to False.
+        defer_close (bool, optional): Whether to close the injection context in the background
+            instead of before returning. Pending contexts are closed on shutdown. Defaults to False.
+        scope_items (int | None, optional): Number of items yielded by an injected generator within
+            one nested scope, which is closed once they are consumed. Defaults to None (one scope
+            for the whole generator).
 
     Returns:
         Any: A decorated function or an Injector instance.
 
     """
-    injector = Injector(reuse_context=reuse_context)
+    injector = Injector(
+        reuse_context=reuse_context,
+        parallel=parallel,
+        defer_close=defer_close,
+        scope_items=scope_items,
+    )
 
     if func is None:
         return injector
     return injector(func)
 
 
+# PROPAGATE ----------------------------------------------------------------------------------------
+def submit(executor: Executor, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+    """Submit a function to the executor, running it within the current injection context.
+
+    Scoped objects of the current context are shared with the function, and the context is closed
+    once both the current request and the function are finished.
+
+    Args:
+        executor: The executor running the function (e.g. `ThreadPoolExecutor`).
+        func: The function to run.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Future: The future of the function result.
+
+    Example:
+        with ThreadPoolExecutor() as executor:
+            future = di.submit(executor, send_report, report_id)
+
+    """
+    return propagate.submit(executor, func, *args, **kwargs)
+
+
+def create_task(coro: Coroutine[Any, Any, T], /, *, name: str | None = None) -> asyncio.Task[T]:
+    """Create a task running within the current injection context.
+
+    Scoped objects of the current context are shared with the task, and the context is closed once
+    both the current request and the task are finished.
+
+    Args:
+        coro: The coroutine to run.
+        name (str | None, optional): The name of the task. Defaults to None.
+
+    Returns:
+        asyncio.Task: The created task.
+
+    Example:
+        di.create_task(send_report(report_id))
+
+    """
+    return propagate.create_task(coro, name=name)
+
+
+# MAP ----------------------------------------------------------------------------------------------
+def map(
+    func: Callable[..., T],
+    iterable: Iterable[Any],
+    /,
+    *,
+    batch_size: int = 100,
+    workers: int | None = None,
+    executor: Literal["thread", "process"] = "thread",
+) -> Generator[T, None, None]:
+    """Call the function for each item of the iterable in batches, each batch in its own scope.
+
+    Items are split into batches run on a pool of workers. Within a batch, injected parameters of
+    the function are resolved once (so scoped resources are reused) and closed once the batch is
+    finished. Results are yielded in order of items, while only a limited number of batches is
+    read ahead, so memory stays bounded for long iterables.
+
+    Args:
+        func: The function called with each item as its first argument.
+        iterable: Items to process.
+        batch_size (int, optional): Number of items sharing one scope. Defaults to 100.
+        workers (int | None, optional): Number of workers. Defaults to the number of CPUs.
+        executor (str, optional): Pool of workers, "thread" or "process". With "process", the
+            function has to be picklable and dependencies are resolved in worker processes.
+            Defaults to "thread".
+
+    Returns:
+        Generator: Results of the function in order of items. Closing it cancels pending batches.
+
+    Raises:
+        ValueError: If batch size or number of workers is not positive or the executor is unknown.
+
+    Example:
+        for row in di.map(transform, records, batch_size=500, workers=8):
+            ...
+
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size has to be a positive integer")
+
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers has to be a positive integer")
+
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Executor has to be 'thread' or 'process', not {executor!r}")
+
+    return _map(func, iterable, batch_size=batch_size, workers=workers, executor=executor)
+
+
+def _map(
+    func: Callable[..., T],
+    iterable: Iterable[Any],
+    *,
+    batch_size: int,
+    workers: int,
+    executor: Literal["thread", "process"],
+) -> Generator[T, None, None]:
+    pool: Executor
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="diject-map")
+
+    # Two batches per worker are read ahead, so workers do not wait for the consumer
+    with pool:
+        yield from map_batches(pool, func, iterable, batch_size=batch_size, window=2 * workers)
+
+
 # PATCH --------------------------------------------------------------------------------------------
 def patch(
     provider: Any,
@@ -513,3 +1177,37 @@ def patch(
         side_effect=side_effect,
         **mock_kwargs,
     )
+
+
+# RECORD -------------------------------------------------------------------------------------------
+def record(
+    path: str | os.PathLike[str],
+    *,
+    max_requests: int | None = None,
+    max_duration: float | None = None,
+) -> Recorder:
+    """Record which providers are resolved and save them as a warmup profile.
+
+    The saved profile can be passed to `Container.start(profile=path)` on the next boot to start
+    only the providers that were actually used.
+
+    Args:
+        path: Path to the file where the profile will be saved.
+        max_requests: Number of requests (new injection contexts) to record.
+        max_duration: Number of seconds to record.
+
+    Returns:
+        Recorder: A recorder that can be used as a context manager or started manually.
+
+    Example:
+        with di.record("warmup.json", max_requests=1000):
+            app.run()
+
+        MainContainer.start(profile="warmup.json")
+
+    """
+    return Recorder(
+        path=path,
+        max_requests=max_requests,
+        max_duration=max_duration,
+    )
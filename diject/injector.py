@@ -1,14 +1,19 @@
 import asyncio
+import contextlib
 import functools
 import inspect
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterator
 from contextvars import ContextVar, Token
 from types import TracebackType
 from typing import Annotated, Any, ParamSpec, TypeVar, get_args, get_origin, overload
 
 from diject.exceptions import DIErrorWrapper
 from diject.providers.provider import Provider
+from diject.tools.profile import Recorder
 from diject.utils.context import Context
+from diject.utils.pool import run_parallel
+from diject.utils.tasks import aprovide_all
+from diject.utils.teardown import get_teardown
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -17,11 +22,26 @@ P = ParamSpec("P")
 class Injector:
     _CONTEXT: ContextVar["Context | None"] = ContextVar("DIJECT_CONTEXT", default=None)
 
-    def __init__(self, *, reuse_context: bool = True, close_context: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        reuse_context: bool = True,
+        close_context: bool = True,
+        parallel: bool = False,
+        defer_close: bool = False,
+        scope_items: int | None = None,
+    ) -> None:
+        if scope_items is not None and scope_items < 1:
+            raise ValueError("Number of items within a scope has to be a positive integer")
+
         self._reuse_context = reuse_context
         self._close_context = close_context
+        self._parallel = parallel
+        self._defer_close = defer_close
+        self._scope_items = scope_items
         self._context: Context | None = None
         self._token: Token | None = None
+        self._recorder: Recorder | None = None
 
     @overload
     def __call__(self, func: Callable[P, T], /) -> Callable[P, T] | Callable[..., T]:
@@ -49,29 +69,30 @@ class Injector:
                 if param.name in bound_params.arguments:
                     if isinstance(value := bound_params.arguments[param.name], Provider):
                         providers[param.name] = value
-                elif param.default is not param.empty:
-                    if isinstance(default := param.default, Provider):
-                        providers[param.name] = default
-                elif get_origin(param.annotation) is Annotated:
-                    annot_args = get_args(param.annotation)
-                    if len(annot_args) == 2:
-                        _, annot_meta = annot_args
-                        if isinstance(annot_meta, Provider):
-                            providers[param.name] = annot_meta
+                elif (provider := self._get_parameter_provider(param)) is not None:
+                    providers[param.name] = provider
 
             return bound_params, providers
 
+        def provide_arguments(providers: dict[str, Provider]) -> dict[str, Any]:
+            if self._parallel:
+                # Independent parameters are resolved on the shared pool within the same context
+                values = run_parallel([provider.__provide__ for provider in providers.values()])
+                return dict(zip(providers, values, strict=True))
+            return {name: provider.__provide__() for name, provider in providers.items()}
+
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             bound_params, providers = prepare_arguments(*args, **kwargs)
 
-            with Injector():
+            with Injector(defer_close=self._defer_close):
                 try:
-                    for name, value in providers.items():
-                        bound_params.arguments[name] = value.__provide__()
+                    values = provide_arguments(providers)
                 except DIErrorWrapper as exc:
                     raise exc.origin from exc.caused_by
 
+                bound_params.arguments.update(values)
+
                 signature.bind(*bound_params.args, **bound_params.kwargs)
 
                 return func(*bound_params.args, **bound_params.kwargs)
@@ -80,9 +101,9 @@ class Injector:
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
             bound_params, providers = prepare_arguments(*args, **kwargs)
 
-            with Injector():
+            async with Injector(defer_close=self._defer_close):
                 try:
-                    values = await asyncio.gather(*(v.__aprovide__() for v in providers.values()))
+                    values = await aprovide_all(providers.values())
                 except DIErrorWrapper as exc:
                     raise exc.origin from exc.caused_by
 
@@ -97,24 +118,28 @@ class Injector:
         def sync_generator(*args: Any, **kwargs: Any) -> Any:
             bound_params, providers = prepare_arguments(*args, **kwargs)
 
-            with Injector():
+            with Injector(defer_close=self._defer_close):
                 try:
-                    for name, value in providers.items():
-                        bound_params.arguments[name] = value.__provide__()
+                    values = provide_arguments(providers)
                 except DIErrorWrapper as exc:
                     raise exc.origin from exc.caused_by
 
+                bound_params.arguments.update(values)
+
                 signature.bind(*bound_params.args, **bound_params.kwargs)
 
-                yield from func(*bound_params.args, **bound_params.kwargs)
+                generator = func(*bound_params.args, **bound_params.kwargs)
+                if self._scope_items is None:
+                    return (yield from generator)
+                return (yield from self._iter_scoped(generator, self._scope_items))
 
         @functools.wraps(func)
         async def async_generator(*args: Any, **kwargs: Any) -> Any:
             bound_params, providers = prepare_arguments(*args, **kwargs)
 
-            with Injector():
+            async with Injector(defer_close=self._defer_close):
                 try:
-                    values = await asyncio.gather(*(v.__aprovide__() for v in providers.values()))
+                    values = await aprovide_all(providers.values())
                 except DIErrorWrapper as exc:
                     raise exc.origin from exc.caused_by
 
@@ -123,8 +148,25 @@ class Injector:
 
                 signature.bind(*bound_params.args, **bound_params.kwargs)
 
-                async for result in func(*bound_params.args, **bound_params.kwargs):
-                    yield result
+                generator = func(*bound_params.args, **bound_params.kwargs)
+                if self._scope_items is not None:
+                    generator = self._aiter_scoped(generator, self._scope_items)
+                # Async generators cannot delegate with `yield from`, so values and exceptions are forwarded here
+                sent: Any = None
+                thrown: BaseException | None = None
+                async with contextlib.aclosing(generator):
+                    while True:
+                        try:
+                            item = await (generator.asend(sent) if thrown is None else generator.athrow(thrown))
+                        except StopAsyncIteration:
+                            return
+                        sent, thrown = None, None
+                        try:
+                            sent = yield item
+                        except GeneratorExit:
+                            raise
+                        except BaseException as exc:
+                            thrown = exc
 
         if inspect.iscoroutinefunction(func):
             return async_wrapper
@@ -144,13 +186,17 @@ class Injector:
         exc_tb: TracebackType | None,
     ) -> None:
         if self._context and self._close_context:
-            self._context.close()
+            self._finish(self._context)
             self._context = None
 
         if self._token:
             self._CONTEXT.reset(self._token)
             self._token = None
 
+        if self._recorder is not None:
+            self._recorder.count_request()
+            self._recorder = None
+
     async def __aenter__(self) -> Context | None:
         return self._create_context()
 
@@ -161,20 +207,150 @@ class Injector:
         exc_tb: TracebackType | None,
     ) -> None:
         if self._context and self._close_context:
-            await self._context.aclose()
+            await self._afinish(self._context)
             self._context = None
 
         if self._token:
             self._CONTEXT.reset(self._token)
             self._token = None
 
+        if self._recorder is not None:
+            self._recorder.count_request()
+            self._recorder = None
+
     @classmethod
     def get_context(cls) -> Context | None:
         return cls._CONTEXT.get()
 
+    @classmethod
+    @contextlib.contextmanager
+    def share_context(cls) -> Iterator[Context]:
+        """Share one context by several resolutions.
+
+        The current context is used if there is one. Otherwise a temporary context shares scoped
+        instances between the resolutions. Like resolution without a context, it does not accept
+        instances created by generators, because nothing would close them.
+        """
+        if (context := cls._CONTEXT.get()) is not None:
+            yield context
+            return
+
+        context = Context(managed=False)
+        token = cls._CONTEXT.set(context)
+        try:
+            yield context
+        finally:
+            cls._CONTEXT.reset(token)
+
+    @classmethod
+    def get_providers(cls, func: Callable[..., Any]) -> dict[str, Provider]:
+        """Return providers injected by default into parameters of the given function."""
+        providers = {}
+        for param in inspect.signature(func).parameters.values():
+            if (provider := cls._get_parameter_provider(param)) is not None:
+                providers[param.name] = provider
+        return providers
+
+    @staticmethod
+    def _get_parameter_provider(param: inspect.Parameter) -> Provider | None:
+        if param.default is not param.empty:
+            if isinstance(default := param.default, Provider):
+                return default
+        elif get_origin(param.annotation) is Annotated:
+            annot_args = get_args(param.annotation)
+            if len(annot_args) == 2:
+                _, annot_meta = annot_args
+                if isinstance(annot_meta, Provider):
+                    return annot_meta
+        return None
+
+    def _finish(self, context: Context) -> None:
+        # Context still used by threads or tasks of the request is closed by the last of them
+        if context.finish():
+            if self._defer_close:
+                get_teardown().submit(context)
+            else:
+                context.close()
+
+    async def _afinish(self, context: Context) -> None:
+        if context.finish(asyncio.get_running_loop()):
+            if self._defer_close:
+                await get_teardown().asubmit(context)
+            else:
+                await context.aclose()
+
+    def _iter_scoped(self, generator: Generator[T, Any, Any], items: int) -> Generator[T, Any, Any]:
+        # Items are produced within nested contexts, each of them is closed once its items are consumed,
+        # so a long-running generator does not accumulate dependencies.
+        # Values and exceptions passed to this generator are forwarded as `yield from` would do.
+        sent: Any = None
+        thrown: BaseException | None = None
+        while True:
+            context: Context = Context()
+            try:
+                for _ in range(items):
+                    token = self._CONTEXT.set(context)
+                    try:
+                        item = generator.send(sent) if thrown is None else generator.throw(thrown)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        self._CONTEXT.reset(token)
+                    sent, thrown = None, None
+                    try:
+                        sent = yield item
+                    except GeneratorExit:
+                        raise
+                    except BaseException as exc:
+                        thrown = exc
+            except GeneratorExit:
+                token = self._CONTEXT.set(context)
+                try:
+                    generator.close()
+                finally:
+                    self._CONTEXT.reset(token)
+                raise
+            finally:
+                self._finish(context)
+
+    async def _aiter_scoped(self, generator: AsyncGenerator[T, Any], items: int) -> AsyncGenerator[T, Any]:
+        sent: Any = None
+        thrown: BaseException | None = None
+        while True:
+            context: Context = Context()
+            try:
+                for _ in range(items):
+                    token = self._CONTEXT.set(context)
+                    try:
+                        item = await (generator.asend(sent) if thrown is None else generator.athrow(thrown))
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        self._CONTEXT.reset(token)
+                    sent, thrown = None, None
+                    try:
+                        sent = yield item
+                    except GeneratorExit:
+                        raise
+                    except BaseException as exc:
+                        thrown = exc
+            except GeneratorExit:
+                token = self._CONTEXT.set(context)
+                try:
+                    await generator.aclose()
+                finally:
+                    self._CONTEXT.reset(token)
+                raise
+            finally:
+                await self._afinish(context)
+
     def _create_context(self) -> Context | None:
         if not (self._reuse_context and self._CONTEXT.get()):
-            self._context = Context()
+            self._context = Context(detached=not self._close_context)
             self._token = self._CONTEXT.set(self._context)
 
+            if self._reuse_context and (recorder := Recorder.get_active()) is not None:
+                # The request is counted when it is finished, so its providers are recorded
+                self._recorder = recorder
+
         return self._context
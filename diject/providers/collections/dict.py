@@ -1,19 +1,30 @@
-import asyncio
 from collections.abc import Callable, Iterator
+from types import EllipsisType
 from typing import Generic, TypeVar
 
 from diject.providers.provider import Pretender, PretenderBuilder, Provider
 from diject.utils.cast import any_as_provider
+from diject.utils.pool import run_parallel
 from diject.utils.string import create_class_repr, to_safe_string
+from diject.utils.tasks import aprovide_all
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
 
 
 class DictProvider(Provider[dict[KT, VT]]):
-    def __init__(self, dictionary: dict[KT, VT]) -> None:
+    def __init__(
+        self,
+        dictionary: dict[KT, VT],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> None:
         super().__init__()
         self.__object = {key: any_as_provider(value) for key, value in dictionary.items()}
+        self.__limit = limit
+        self.__parallel = parallel
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
         return create_class_repr(self, self.__object)
@@ -22,20 +33,48 @@ class DictProvider(Provider[dict[KT, VT]]):
     def __object__(self) -> dict[KT, Provider[VT]]:
         return self.__object.copy()
 
+    @property
+    def __limit__(self) -> int | None:
+        return self.__limit
+
+    @__limit__.setter
+    def __limit__(self, limit: int | None) -> None:
+        self.__limit = limit
+
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield from ((to_safe_string(key), value) for key, value in self.__object.items())
 
     def __provide_dependency__(self) -> dict[KT, VT]:
+        if self.__parallel:
+            values = run_parallel(
+                [value.__provide__ for value in self.__object.values()],
+                limit=self.__limit,
+            )
+            return dict(zip(self.__object, values, strict=True))
         return {key: value.__provide__() for key, value in self.__object.items()}
 
+    def __provide_nowait_dependency__(self) -> dict[KT, VT] | EllipsisType:
+        values = {}
+        for key, provider in self.__object.items():
+            if (value := provider.__provide_nowait__()) is ...:
+                return ...
+            values[key] = value
+        return values
+
     async def __aprovide_dependency__(self) -> dict[KT, VT]:
-        values = await asyncio.gather(*(value.__aprovide__() for value in self.__object.values()))
+        values = await aprovide_all(self.__object.values(), limit=self.__limit)
         return dict(zip(self.__object, values, strict=True))
 
 
 class DictPretender(Pretender, Generic[KT, VT]):
-    def __call__(self, dictionary: dict[KT, VT]) -> dict[KT, VT]:
-        return DictProvider(dictionary)  # type: ignore[return-value]
+    def __call__(
+        self,
+        dictionary: dict[KT, VT],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> dict[KT, VT]:
+        return DictProvider(dictionary, limit=limit, parallel=parallel)  # type: ignore[return-value]
 
 
 class DictPretenderBuilder(PretenderBuilder[DictProvider]):
@@ -45,8 +84,14 @@ class DictPretenderBuilder(PretenderBuilder[DictProvider]):
     ) -> DictPretender[KT, VT]:
         return DictPretender()
 
-    def __call__(self, dictionary: dict[KT, VT]) -> dict[KT, VT]:
-        return DictProvider(dictionary)  # type: ignore[return-value]
+    def __call__(
+        self,
+        dictionary: dict[KT, VT],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> dict[KT, VT]:
+        return DictProvider(dictionary, limit=limit, parallel=parallel)  # type: ignore[return-value]
 
     @property
     def type(self) -> type[DictProvider]:
@@ -1,18 +1,29 @@
-import asyncio
 from collections.abc import Callable, Iterator
+from types import EllipsisType
 from typing import Generic, TypeVar
 
 from diject.providers.provider import Pretender, PretenderBuilder, Provider
 from diject.utils.cast import any_as_provider
+from diject.utils.pool import run_parallel
 from diject.utils.string import create_class_repr
+from diject.utils.tasks import aprovide_all
 
 T = TypeVar("T")
 
 
 class ListProvider(Provider[list[T]]):
-    def __init__(self, items: list[T]) -> None:
+    def __init__(
+        self,
+        items: list[T],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> None:
         super().__init__()
         self.__object = [any_as_provider(item) for item in items]
+        self.__limit = limit
+        self.__parallel = parallel
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
         return create_class_repr(self, self.__object)
@@ -21,27 +32,57 @@ class ListProvider(Provider[list[T]]):
     def __object__(self) -> list[Provider[T]]:
         return self.__object.copy()
 
+    @property
+    def __limit__(self) -> int | None:
+        return self.__limit
+
+    @__limit__.setter
+    def __limit__(self, limit: int | None) -> None:
+        self.__limit = limit
+
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield from ((str(i), v) for i, v in enumerate(self.__object))
 
     def __provide_dependency__(self) -> list[T]:
+        if self.__parallel:
+            return run_parallel([item.__provide__ for item in self.__object], limit=self.__limit)
         return [item.__provide__() for item in self.__object]
 
+    def __provide_nowait_dependency__(self) -> list[T] | EllipsisType:
+        values = []
+        for item in self.__object:
+            if (value := item.__provide_nowait__()) is ...:
+                return ...
+            values.append(value)
+        return values
+
     async def __aprovide_dependency__(self) -> list[T]:
-        return await asyncio.gather(*(item.__aprovide__() for item in self.__object))
+        return await aprovide_all(self.__object, limit=self.__limit)
 
 
 class ListPretender(Pretender, Generic[T]):
-    def __call__(self, items: list[T]) -> list[T]:
-        return ListProvider(items)  # type: ignore[return-value]
+    def __call__(
+        self,
+        items: list[T],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> list[T]:
+        return ListProvider(items, limit=limit, parallel=parallel)  # type: ignore[return-value]
 
 
 class ListPretenderBuilder(PretenderBuilder[ListProvider]):
     def __getitem__(self, list_type: Callable[..., T]) -> ListPretender[T]:
         return ListPretender()
 
-    def __call__(self, items: list[T]) -> list[T]:
-        return ListProvider(items)  # type: ignore[return-value]
+    def __call__(
+        self,
+        items: list[T],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> list[T]:
+        return ListProvider(items, limit=limit, parallel=parallel)  # type: ignore[return-value]
 
     @property
     def type(self) -> type[ListProvider]:
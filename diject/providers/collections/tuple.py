@@ -1,18 +1,29 @@
-import asyncio
 from collections.abc import Callable, Iterator
+from types import EllipsisType
 from typing import Generic, TypeVar
 
 from diject.providers.provider import Pretender, PretenderBuilder, Provider
 from diject.utils.cast import any_as_provider
+from diject.utils.pool import run_parallel
 from diject.utils.string import create_class_repr
+from diject.utils.tasks import aprovide_all
 
 T = TypeVar("T")
 
 
 class TupleProvider(Provider[tuple[T, ...]]):
-    def __init__(self, items: tuple[T, ...]) -> None:
+    def __init__(
+        self,
+        items: tuple[T, ...],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> None:
         super().__init__()
         self.__object = tuple(any_as_provider(item) for item in items)
+        self.__limit = limit
+        self.__parallel = parallel
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
         return create_class_repr(self, self.__object)
@@ -21,27 +32,58 @@ class TupleProvider(Provider[tuple[T, ...]]):
     def __object__(self) -> tuple[Provider[T], ...]:
         return self.__object
 
+    @property
+    def __limit__(self) -> int | None:
+        return self.__limit
+
+    @__limit__.setter
+    def __limit__(self, limit: int | None) -> None:
+        self.__limit = limit
+
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield from ((str(i), v) for i, v in enumerate(self.__object))
 
     def __provide_dependency__(self) -> tuple[T, ...]:
+        if self.__parallel:
+            values = run_parallel([item.__provide__ for item in self.__object], limit=self.__limit)
+            return tuple(values)
         return tuple(item.__provide__() for item in self.__object)
 
+    def __provide_nowait_dependency__(self) -> tuple[T, ...] | EllipsisType:
+        values = []
+        for item in self.__object:
+            if (value := item.__provide_nowait__()) is ...:
+                return ...
+            values.append(value)
+        return tuple(values)
+
     async def __aprovide_dependency__(self) -> tuple[T, ...]:
-        return tuple(await asyncio.gather(*(item.__aprovide__() for item in self.__object)))
+        return tuple(await aprovide_all(self.__object, limit=self.__limit))
 
 
 class TuplePretender(Pretender, Generic[T]):
-    def __call__(self, items: tuple[T, ...]) -> tuple[T, ...]:
-        return TupleProvider(items)  # type: ignore[return-value]
+    def __call__(
+        self,
+        items: tuple[T, ...],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> tuple[T, ...]:
+        return TupleProvider(items, limit=limit, parallel=parallel)  # type: ignore[return-value]
 
 
 class TuplePretenderBuilder(PretenderBuilder[TupleProvider]):
     def __getitem__(self, tuple_type: Callable[..., T]) -> TuplePretender[T]:
         return TuplePretender()
 
-    def __call__(self, items: tuple[T, ...]) -> tuple[T, ...]:
-        return TupleProvider(items)  # type: ignore[return-value]
+    def __call__(
+        self,
+        items: tuple[T, ...],
+        *,
+        limit: int | None = None,
+        parallel: bool = False,
+    ) -> tuple[T, ...]:
+        return TupleProvider(items, limit=limit, parallel=parallel)  # type: ignore[return-value]
 
     @property
     def type(self) -> type[TupleProvider]:
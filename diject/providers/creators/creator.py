@@ -1,27 +1,50 @@
 import asyncio
+import concurrent.futures
+import contextvars
+import warnings
 from abc import ABC
-from collections.abc import AsyncIterator, Callable, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import nullcontext
+from dataclasses import dataclass
 from typing import Any, Generic, ParamSpec, TypeVar, overload
 
-from diject.exceptions import DIAsyncError, DIContextError, DIErrorWrapper, DITypeError
+from diject.exceptions import (
+    DIAsyncError,
+    DIContextError,
+    DIErrorWrapper,
+    DITimeoutError,
+    DITypeError,
+)
 from diject.providers.collections.dict import DictProvider
 from diject.providers.collections.tuple import TupleProvider
 from diject.providers.object import ObjectProvider
 from diject.providers.provider import Pretender, PretenderBuilder, Provider
 from diject.tools.partial import Partial
-from diject.utils.state import State
+from diject.utils.deadline import get_timeout
+from diject.utils.imports import import_object
+from diject.utils.limiter import Limiter
+from diject.utils.pool import run_parallel
+from diject.utils.state import SharedState, State
 from diject.utils.string import create_class_repr
+from diject.utils.tasks import aprovide_all
+from diject.utils.watchdog import get_watchdog
 
 T = TypeVar("T")
 TCreatorProvider = TypeVar("TCreatorProvider", bound="CreatorProvider")
 TCallable = Callable[..., AsyncIterator[T] | Iterator[T] | T]
 P = ParamSpec("P")
+Arguments = tuple[tuple[Any, ...], dict[str, Any]]
 
 
 class CreatorProvider(Provider[T], ABC):
+    # Whether each provision creates a new value, so it is not shared by instances created at once
+    __fresh__ = False
+    # Whether instances are bound to the creating thread, so they are never created by a watchdog
+    __thread_affine__ = False
+
     def __init__(
         self,
-        callable: TCallable | ObjectProvider[TCallable] | Partial[T],
+        callable: TCallable | ObjectProvider[TCallable] | Partial[T] | str,
         /,
         *args: Any,
         **kwargs: Any,
@@ -39,13 +62,69 @@ class CreatorProvider(Provider[T], ABC):
             kwargs = {**callable.kwargs, **kwargs}
             callable = callable.callable
 
-        self.__callable = callable
+        self.__callable: TCallable | str = callable
         self.__args = TupleProvider(args)
         self.__kwargs = DictProvider(kwargs)
+        self.__limiter: Limiter | None = None
+        self.__coalesce = False
+        self.__timeout: float | None = None
+        self.__default_timeout: float | None = None
+        self.__parallel = False
+        self.__inflight: dict[asyncio.AbstractEventLoop, _Inflight] = {}
+        self.__args.__link_alias__(self, "")
+        self.__kwargs.__link_alias__(self, "")
+        self.__propagate_alias__()
 
     @property
     def __callable__(self) -> TCallable:
-        return self.__callable
+        if not isinstance(self.__callable, str):
+            return self.__callable
+
+        # Callable given as import path is imported on first use and cached
+        try:
+            callable = import_object(self.__callable)
+        except Exception as exc:
+            raise DIErrorWrapper(
+                origin=exc,
+                note=f"Error was encountered while importing '{self}'",
+            ) from exc
+
+        self.__callable = callable
+        return callable  # type: ignore[no-any-return]
+
+    @property
+    def __limiter__(self) -> Limiter | None:
+        return self.__limiter
+
+    @property
+    def __timeout__(self) -> float | None:
+        return self.__timeout
+
+    @__timeout__.setter
+    def __timeout__(self, timeout: float | None) -> None:
+        self.__timeout = timeout
+
+    @property
+    def __default_timeout__(self) -> float | None:
+        return self.__default_timeout
+
+    @__default_timeout__.setter
+    def __default_timeout__(self, timeout: float | None) -> None:
+        # Default of the container bounds only asynchronous creation, because it would move
+        # synchronous factories (which did not opt in with their own timeout) to other threads
+        self.__default_timeout = timeout
+
+    @property
+    def __parallel__(self) -> bool:
+        return self.__parallel
+
+    @__parallel__.setter
+    def __parallel__(self, parallel: bool) -> None:
+        self.__parallel = parallel
+
+    def __limit__(self, limit: int | None, *, coalesce: bool = False) -> None:
+        self.__limiter = None if limit is None else Limiter(limit)
+        self.__coalesce = coalesce
 
     @property
     def __args__(self) -> tuple[Provider, ...]:
@@ -62,79 +141,277 @@ class CreatorProvider(Provider[T], ABC):
         yield from self.__args.__travers__()
         yield from self.__kwargs.__travers__()
 
-    def __create__(self, *, allow_generator: bool = True) -> State:
-        args = self.__args.__provide__()
-        kwargs = self.__kwargs.__provide__()
-
+    def __create__(
+        self,
+        *,
+        allow_generator: bool = True,
+        extra_args: tuple[Any, ...] = (),
+        arguments: Arguments | None = None,
+    ) -> State:
+        callable = self.__callable__
+        if arguments is not None:
+            args, kwargs = arguments
+        elif self.__parallel:
+            args, kwargs = self.__provide_parallel()
+        else:
+            args, kwargs = self.__args.__provide__(), self.__kwargs.__provide__()
+        args = (*extra_args, *args)
+
+        timeout = get_timeout(self.__timeout)
+        if timeout == 0:
+            raise self.__timeout_error(None)
+        if timeout is None or self.__thread_affine__:
+            return self.__create_state(callable, args, kwargs, allow_generator=allow_generator)
+
+        # Blocking factory cannot be interrupted, so it is run by a watchdog thread and the caller
+        # stops waiting after the timeout (of the provider or the remaining deadline of the call)
+        future = get_watchdog().submit(
+            contextvars.copy_context().run,
+            self.__create_state,
+            callable,
+            args,
+            kwargs,
+            allow_generator=allow_generator,
+        )
         try:
-            obj = self.__callable(*args, **kwargs)
-        except Exception as exc:
-            raise DIErrorWrapper(
-                origin=exc,
-                note=f"Error was encountered while creating '{self}'",
-            ) from exc
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError as exc:
+            future.add_done_callback(_close_late_state)
+            raise self.__timeout_error(timeout) from exc
+
+    def __provide_parallel(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        # Independent arguments are resolved on the shared pool within the current context
+        args = self.__args.__object__
+        kwargs = self.__kwargs.__object__
+        values = run_parallel([provider.__provide__ for provider in (*args, *kwargs.values())])
+        return tuple(values[: len(args)]), dict(zip(kwargs, values[len(args) :], strict=True))
+
+    def __share_arguments__(self) -> Callable[[], Arguments]:
+        """Resolve arguments once for many instances.
+
+        Arguments which do not depend on transient providers are resolved now. The returned function
+        resolves the remaining ones for each instance.
+        """
+        providers = dict(self.__arguments())
+        shared = {key: provider.__provide__() for key, provider in providers.items() if not _is_fresh(provider)}
+
+        def resolve() -> Arguments:
+            return _split_arguments(
+                {
+                    key: shared[key] if key in shared else provider.__provide__()
+                    for key, provider in providers.items()
+                },
+            )
+
+        return resolve
+
+    async def __ashare_arguments__(self) -> Callable[[], Awaitable[Arguments]]:
+        providers = dict(self.__arguments())
+        shared_keys = [key for key, provider in providers.items() if not _is_fresh(provider)]
+        fresh_keys = [key for key in providers if key not in shared_keys]
+        shared = dict(zip(shared_keys, await aprovide_all([providers[key] for key in shared_keys]), strict=True))
+
+        async def resolve() -> Arguments:
+            values = await aprovide_all([providers[key] for key in fresh_keys])
+            fresh = dict(zip(fresh_keys, values, strict=True))
+            return _split_arguments({key: shared[key] if key in shared else fresh[key] for key in providers})
+
+        return resolve
+
+    def __arguments(self) -> Iterator[tuple[int | str, Provider]]:
+        yield from enumerate(self.__args.__object__)
+        yield from self.__kwargs.__object__.items()
+
+    def __timeout_error(self, timeout: float | None) -> DIErrorWrapper:
+        if timeout is None:
+            message = f"Deadline was reached before creation of '{self}'"
+        else:
+            message = f"Creation of '{self}' exceeded timeout of {timeout:g}s"
+
+        return DIErrorWrapper(
+            origin=DITimeoutError(message),
+            note=f"Timeout was reached while creating '{self}'",
+        )
 
-        match obj:
-            case AsyncIterator():
-                raise DIAsyncError("Object have to be created asynchronously")
-            case Iterator():
-                if not allow_generator:
-                    raise DIContextError(f"'{self}' has to be called within context")
-
-                try:
-                    instance = next(obj)
-                except Exception as exc:
-                    raise DIErrorWrapper(
-                        origin=exc,
-                        note=f"Error was encountered while creating '{self}'",
-                    ) from exc
-            case _:
-                instance = obj
+    def __create_state(
+        self,
+        callable: TCallable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        allow_generator: bool,
+    ) -> State:
+        with self.__limiter or nullcontext():
+            try:
+                obj = callable(*args, **kwargs)
+            except Exception as exc:
+                raise DIErrorWrapper(
+                    origin=exc,
+                    note=f"Error was encountered while creating '{self}'",
+                ) from exc
+
+            match obj:
+                case AsyncIterator():
+                    raise DIAsyncError("Object have to be created asynchronously")
+                case Iterator():
+                    if not allow_generator:
+                        raise DIContextError(f"'{self}' has to be called within context")
+
+                    try:
+                        instance = next(obj)
+                    except Exception as exc:
+                        raise DIErrorWrapper(
+                            origin=exc,
+                            note=f"Error was encountered while creating '{self}'",
+                        ) from exc
+                case _:
+                    instance = obj
 
         return State(
             object=obj,
             instance=instance,
         )
 
-    async def __acreate__(self, *, allow_generator: bool = True) -> State:
-        args, kwargs = await asyncio.gather(
-            self.__args.__aprovide__(),
-            self.__kwargs.__aprovide__(),
-        )
-
+    async def __acreate__(
+        self,
+        *,
+        allow_generator: bool = True,
+        extra_args: tuple[Any, ...] = (),
+        arguments: Arguments | None = None,
+        coalesce: bool = True,
+    ) -> State:
+        # Instances created at once on purpose (e.g. batch of transients) are not coalesced
+        if not (coalesce and self.__coalesce):
+            return await self.__acreate_timed(
+                allow_generator=allow_generator,
+                extra_args=extra_args,
+                arguments=arguments,
+            )
+
+        # Concurrent creations within one event loop wait for the first one and share its
+        # instance. The instance is owned by all of them and closed when the last one closes it.
+        loop = asyncio.get_running_loop()
+        if (inflight := self.__inflight.get(loop)) is not None:
+            inflight.followers += 1
+            try:
+                shared = await asyncio.shield(inflight.future)
+            except asyncio.CancelledError:
+                future = inflight.future
+                if not future.done():
+                    inflight.followers -= 1
+                    raise
+                if not future.cancelled() and future.exception() is None:
+                    await future.result().arelease()
+                    raise
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                # The first caller was cancelled, so the instance has to be created again
+                return await self.__acreate__(
+                    allow_generator=allow_generator,
+                    extra_args=extra_args,
+                    arguments=arguments,
+                )
+            return await shared.acquire()
+
+        inflight = self.__inflight[loop] = _Inflight(future=loop.create_future())
         try:
-            obj = self.__callable(*args, **kwargs)
-        except Exception as exc:
-            raise DIErrorWrapper(
-                origin=exc,
-                note=f"Error was encountered while creating '{self}'",
-            ) from exc
-
-        match obj:
-            case AsyncIterator():
-                if not allow_generator:
-                    raise DIContextError(f"'{self}' has to be called within context")
-
-                try:
-                    instance = await anext(obj)
-                except Exception as exc:
-                    raise DIErrorWrapper(
-                        origin=exc,
-                        note=f"Error was encountered while creating '{self}'",
-                    ) from exc
-            case Iterator():
-                if not allow_generator:
-                    raise DIContextError(f"'{self}' has to be called within context")
-
-                try:
-                    instance = next(obj)
-                except Exception as exc:
-                    raise DIErrorWrapper(
-                        origin=exc,
-                        note=f"Error was encountered while creating '{self}'",
-                    ) from exc
-            case _:
-                instance = obj
+            state = await self.__acreate_timed(
+                allow_generator=allow_generator,
+                extra_args=extra_args,
+                arguments=arguments,
+            )
+        except asyncio.CancelledError:
+            inflight.future.cancel()
+            raise
+        except BaseException as exc:
+            inflight.future.set_exception(exc)
+            inflight.future.exception()  # retrieved by waiting callers, if there are any
+            raise
+        finally:
+            del self.__inflight[loop]
+
+        if not inflight.followers:
+            inflight.future.cancel()
+            return state
+
+        shared = SharedState(state, owners=inflight.followers + 1)
+        inflight.future.set_result(shared)
+        return await shared.acquire()
+
+    async def __acreate_timed(
+        self,
+        *,
+        allow_generator: bool,
+        extra_args: tuple[Any, ...],
+        arguments: Arguments | None,
+    ) -> State:
+        own = self.__default_timeout if self.__timeout is None else self.__timeout
+        if (timeout := get_timeout(own)) is None:
+            return await self.__acreate_state(
+                allow_generator=allow_generator,
+                extra_args=extra_args,
+                arguments=arguments,
+            )
+
+        # Cancelled async generator is closed by the exception raised inside it
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.__acreate_state(
+                    allow_generator=allow_generator,
+                    extra_args=extra_args,
+                    arguments=arguments,
+                )
+        except TimeoutError as exc:
+            raise self.__timeout_error(timeout) from exc
+
+    async def __acreate_state(
+        self,
+        *,
+        allow_generator: bool,
+        extra_args: tuple[Any, ...],
+        arguments: Arguments | None,
+    ) -> State:
+        callable = self.__callable__
+        if arguments is not None:
+            args, kwargs = arguments
+        else:
+            args, kwargs = await aprovide_all((self.__args, self.__kwargs))
+
+        async with self.__limiter or nullcontext():
+            try:
+                obj = callable(*extra_args, *args, **kwargs)
+            except Exception as exc:
+                raise DIErrorWrapper(
+                    origin=exc,
+                    note=f"Error was encountered while creating '{self}'",
+                ) from exc
+
+            match obj:
+                case AsyncIterator():
+                    if not allow_generator:
+                        raise DIContextError(f"'{self}' has to be called within context")
+
+                    try:
+                        instance = await anext(obj)
+                    except Exception as exc:
+                        raise DIErrorWrapper(
+                            origin=exc,
+                            note=f"Error was encountered while creating '{self}'",
+                        ) from exc
+                case Iterator():
+                    if not allow_generator:
+                        raise DIContextError(f"'{self}' has to be called within context")
+
+                    try:
+                        instance = next(obj)
+                    except Exception as exc:
+                        raise DIErrorWrapper(
+                            origin=exc,
+                            note=f"Error was encountered while creating '{self}'",
+                        ) from exc
+                case _:
+                    instance = obj
 
         return State(
             object=obj,
@@ -142,11 +419,42 @@ class CreatorProvider(Provider[T], ABC):
         )
 
 
+def _is_fresh(provider: Provider) -> bool:
+    # Transient values are created again for each instance, while other creators reuse theirs
+    if isinstance(provider, CreatorProvider):
+        return provider.__fresh__
+    return any(_is_fresh(child) for _, child in provider.__travers__())
+
+
+def _split_arguments(values: dict[int | str, Any]) -> Arguments:
+    args = tuple(value for key, value in values.items() if isinstance(key, int))
+    kwargs = {key: value for key, value in values.items() if isinstance(key, str)}
+    return args, kwargs
+
+
+@dataclass
+class _Inflight:
+    future: "asyncio.Future[SharedState]"
+    followers: int = 0
+
+
+def _close_late_state(future: "concurrent.futures.Future[State]") -> None:
+    # State created after the timeout is not used by anyone, so it is closed immediately
+    if not future.cancelled() and future.exception() is None:
+        try:
+            future.result().close()
+        except Exception as exc:
+            warnings.warn(
+                f"State created after timeout closed incorrectly with {type(exc).__name__}: {exc}",
+                stacklevel=1,
+            )
+
+
 class CreatorPretender(Pretender, Generic[T, TCreatorProvider]):
     def __init__(
         self,
         provider_cls: type[TCreatorProvider],
-        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T],
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
     ) -> None:
         self._provider_cls = provider_cls
         self._callable = callable
@@ -158,6 +466,35 @@ class CreatorPretender(Pretender, Generic[T, TCreatorProvider]):
         return self._provider_cls(self._callable, *args, **kwargs)
 
 
+class ConfiguredCreatorPretender(CreatorPretender[T, TCreatorProvider]):
+    def __init__(
+        self,
+        provider_cls: type[TCreatorProvider],
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        *,
+        limit: int | None,
+        coalesce: bool,
+        timeout: float | None,
+        parallel: bool,
+        buffer: int | None,
+    ) -> None:
+        super().__init__(provider_cls, callable)
+        self._limit = limit
+        self._coalesce = coalesce
+        self._timeout = timeout
+        self._parallel = parallel
+        self._buffer = buffer
+
+    def __call__(self, *args: Any, **kwargs: Any) -> CreatorProvider:
+        provider = self._provider_cls(self._callable, *args, **kwargs)
+        provider.__limit__(self._limit, coalesce=self._coalesce)
+        provider.__timeout__ = self._timeout
+        provider.__parallel__ = self._parallel
+        if self._buffer is not None:
+            provider.__buffer_instances__(self._buffer)  # type: ignore[attr-defined]
+        return provider
+
+
 class CreatorPretenderBuilder(PretenderBuilder[TCreatorProvider]):
     def __init__(self, provider_cls: type[TCreatorProvider]) -> None:
         self._provider_cls = provider_cls
@@ -169,6 +506,10 @@ class CreatorPretenderBuilder(PretenderBuilder[TCreatorProvider]):
     def __getitem__(self, callable: Partial[T]) -> Partial[T]:
         pass
 
+    @overload
+    def __getitem__(self, callable: str) -> Callable[..., Any]:
+        pass
+
     @overload
     def __getitem__(  # type: ignore[overload-overlap]
         self,
@@ -185,6 +526,9 @@ class CreatorPretenderBuilder(PretenderBuilder[TCreatorProvider]):
         pass
 
     def __getitem__(self, callable: Any) -> Any:
+        return self.__create_pretender__(callable)
+
+    def __create_pretender__(self, callable: Any) -> CreatorPretender:
         return CreatorPretender(
             provider_cls=self._provider_cls,
             callable=callable,
@@ -193,3 +537,64 @@ class CreatorPretenderBuilder(PretenderBuilder[TCreatorProvider]):
     @property
     def type(self) -> type[TCreatorProvider]:
         return self._provider_cls
+
+
+class ConfiguredCreatorPretenderBuilder(CreatorPretenderBuilder[TCreatorProvider]):
+    def __init__(
+        self,
+        provider_cls: type[TCreatorProvider],
+        *,
+        limit: int | None = None,
+        coalesce: bool = False,
+        timeout: float | None = None,
+        parallel: bool = False,
+        buffer: int | None = None,
+    ) -> None:
+        super().__init__(provider_cls)
+
+        if buffer is not None and not provider_cls.__fresh__:
+            raise DITypeError(f"Only Transient provider can buffer instances, not {provider_cls.__qualname__}")
+
+        self._limit = limit
+        self._coalesce = coalesce
+        self._timeout = timeout
+        self._parallel = parallel
+        self._buffer = buffer
+
+    def __call__(
+        self,
+        *,
+        limit: int | None = None,
+        coalesce: bool = False,
+        timeout: float | None = None,
+        parallel: bool = False,
+        buffer: int | None = None,
+    ) -> "ConfiguredCreatorPretenderBuilder[TCreatorProvider]":
+        return ConfiguredCreatorPretenderBuilder(
+            self._provider_cls,
+            limit=limit,
+            coalesce=coalesce,
+            timeout=timeout,
+            parallel=parallel,
+            buffer=buffer,
+        )
+
+    def __create_pretender__(self, callable: Any) -> CreatorPretender:
+        if (
+            self._limit is None
+            and not self._coalesce
+            and self._timeout is None
+            and not self._parallel
+            and self._buffer is None
+        ):
+            return super().__create_pretender__(callable)
+
+        return ConfiguredCreatorPretender(
+            provider_cls=self._provider_cls,
+            callable=callable,
+            limit=self._limit,
+            coalesce=self._coalesce,
+            timeout=self._timeout,
+            parallel=self._parallel,
+            buffer=self._buffer,
+        )
@@ -0,0 +1,342 @@
+import asyncio
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Hashable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Concatenate, Generic, ParamSpec, TypeVar, overload
+
+from diject.exceptions import DIAsyncError, DIContextError, DITypeError
+from diject.injector import Injector
+from diject.providers.creators.creator import CreatorPretender, CreatorPretenderBuilder, CreatorProvider
+from diject.providers.provider import Provider
+from diject.utils.context import Context
+from diject.utils.lock import Lock
+from diject.utils.state import State
+from diject.utils.status import Status
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+T = TypeVar("T")
+P = ParamSpec("P")
+TKey = Provider[Hashable] | ContextVar[Hashable] | None
+
+
+@dataclass(eq=False)
+class KeyedItem(Generic[T]):
+    state: State[T] | None = None
+    context: Context[T] | None = None
+    lock: Lock = field(default_factory=Lock)
+    expires_at: float | None = None
+    # Loop of the instance created asynchronously, the sweeper closes the instance within it
+    loop: asyncio.AbstractEventLoop | None = None
+
+    def close(self) -> None:
+        if self.state is not None:
+            self.state.close()
+            self.state = None
+
+        if self.context is not None:
+            self.context.close()
+            self.context = None
+
+    async def aclose(self) -> None:
+        if self.state is not None:
+            await self.state.aclose()
+            self.state = None
+
+        if self.context is not None:
+            await self.context.aclose()
+            self.context = None
+
+
+class KeyedProvider(CreatorProvider[T]):
+    def __init__(
+        self,
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(callable, *args, **kwargs)
+        self.__key: TKey = None
+        self.__maxsize: int | None = 128
+        self.__ttl: float | None = None
+        self.__items: OrderedDict[Hashable, KeyedItem[T]] = OrderedDict()
+        # Guards only the mapping of keys, instances are created under lock of each key
+        self.__items_lock = threading.Lock()
+        # Timer evicting expired instances, so idle ones are closed without further lookups
+        self.__sweeper: threading.Timer | None = None
+
+    def __configure__(self, *, key: TKey, maxsize: int | None, ttl: float | None) -> None:
+        self.__key = key
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+
+        if isinstance(key, Provider):
+            key.__link_alias__(self, ".key")
+
+    @property
+    def __keys__(self) -> list[Hashable]:
+        with self.__items_lock:
+            return list(self.__items)
+
+    def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
+        if isinstance(self.__key, Provider):
+            yield "key", self.__key
+        yield from super().__travers_dependency__()
+
+    def __provide_dependency__(self) -> T:
+        if isinstance(self.__key, Provider):
+            return self.__provide_key__(self.__key.__provide__())
+        return self.__provide_key__(self.__get_key())
+
+    async def __aprovide_dependency__(self) -> T:
+        if isinstance(self.__key, Provider):
+            return await self.__aprovide_key__(await self.__key.__aprovide__())
+        return await self.__aprovide_key__(self.__get_key())
+
+    def __provide_key__(self, key: Hashable) -> T:
+        item, evicted = self.__get_item(key)
+
+        for evicted_item in evicted:
+            self.__close(evicted_item)
+
+        # Concurrent creation of the same key is coalesced by the lock of the key
+        with item.lock:
+            if item.state is None:
+                try:
+                    with Injector(reuse_context=False, close_context=False) as item.context:
+                        item.state = self.__create__(extra_args=(key,))
+                except BaseException:
+                    self.__discard(key, item)
+                    item.close()
+                    raise
+
+                if not self.__keep(key, item):
+                    # Provider was shut down meanwhile and the key was created again
+                    self.__close(item)
+                    return self.__provide_key__(key)
+
+        self.__status__ = Status.RUNNING
+        return item.state.instance
+
+    async def __aprovide_key__(self, key: Hashable) -> T:
+        item, evicted = self.__get_item(key)
+
+        await asyncio.gather(*(evicted_item.aclose() for evicted_item in evicted))
+
+        async with item.lock:
+            if item.state is None:
+                item.loop = asyncio.get_running_loop()
+                try:
+                    async with Injector(reuse_context=False, close_context=False) as item.context:
+                        item.state = await self.__acreate__(extra_args=(key,))
+                except BaseException:
+                    self.__discard(key, item)
+                    await item.aclose()
+                    raise
+
+                if not self.__keep(key, item):
+                    await item.aclose()
+                    return await self.__aprovide_key__(key)
+
+        self.__status__ = Status.RUNNING
+        return item.state.instance
+
+    def __shutdown_dependency__(self) -> None:
+        for item in self.__release_all():
+            item.close()
+
+    async def __ashutdown_dependency__(self) -> None:
+        await asyncio.gather(*(item.aclose() for item in self.__release_all()))
+
+    def __get_key(self) -> Hashable:
+        if isinstance(self.__key, ContextVar):
+            try:
+                return self.__key.get()
+            except LookupError:
+                raise DIContextError(f"Key of '{self}' is not set in {self.__key}") from None
+
+        raise DIContextError(f"'{self}' has to be provided with explicit key")
+
+    def __get_item(self, key: Hashable) -> tuple[KeyedItem[T], list[KeyedItem[T]]]:
+        now = time.monotonic()
+
+        with self.__items_lock:
+            item = self.__items.get(key)
+            if item is None:
+                item = self.__items[key] = KeyedItem()
+            else:
+                self.__items.move_to_end(key)
+
+            if self.__ttl is not None:
+                item.expires_at = now + self.__ttl
+
+            evicted = self.__evict(now, keep=item)
+            self.__schedule_sweep(now)
+
+        return item, evicted
+
+    def __evict(self, now: float, *, keep: KeyedItem[T] | None = None) -> list[KeyedItem[T]]:
+        evicted = []
+
+        # Items are ordered from the least recently used, so expired ones are at the beginning
+        for other_key, other in list(self.__items.items()):
+            if other is keep:
+                break
+            if other.state is None:
+                # Item is still being created, it is evicted once its instance exists
+                continue
+            if (
+                (self.__maxsize is not None and len(self.__items) > self.__maxsize)
+                or (other.expires_at is not None and other.expires_at <= now)
+            ):
+                del self.__items[other_key]
+                evicted.append(other)
+            else:
+                break
+
+        return evicted
+
+    def __schedule_sweep(self, now: float) -> None:
+        if self.__ttl is None or self.__sweeper is not None or not self.__items:
+            return
+
+        expires_at = next(iter(self.__items.values())).expires_at or now
+        # Item still being created after its expiration is checked again after `ttl`
+        delay = expires_at - now if expires_at > now else self.__ttl
+        self.__sweeper = threading.Timer(delay, self.__sweep)
+        self.__sweeper.daemon = True
+        self.__sweeper.start()
+
+    def __sweep(self) -> None:
+        now = time.monotonic()
+        with self.__items_lock:
+            self.__sweeper = None
+            evicted = self.__evict(now)
+            self.__schedule_sweep(now)
+
+        for item in evicted:
+            self.__expire(item)
+
+    def __expire(self, item: KeyedItem[T]) -> None:
+        if item.loop is not None and item.loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(item.aclose(), item.loop)
+            future.add_done_callback(self.__check_expired)
+            return
+
+        try:
+            self.__close(item)
+        except Exception as exc:
+            self.__warn_expired(exc)
+
+    def __check_expired(self, future: "concurrent.futures.Future[None]") -> None:
+        if not future.cancelled() and (exc := future.exception()) is not None:
+            self.__warn_expired(exc)
+
+    def __warn_expired(self, exc: BaseException) -> None:
+        warnings.warn(
+            f"Expired instance of {self} closed incorrectly with {type(exc).__name__}: {exc}",
+            stacklevel=1,
+        )
+
+    def __keep(self, key: Hashable, item: KeyedItem[T]) -> bool:
+        with self.__items_lock:
+            return self.__items.setdefault(key, item) is item
+
+    def __discard(self, key: Hashable, item: KeyedItem[T]) -> None:
+        with self.__items_lock:
+            if self.__items.get(key) is item:
+                del self.__items[key]
+
+    def __release_all(self) -> list[KeyedItem[T]]:
+        with self.__items_lock:
+            items = list(self.__items.values())
+            self.__items.clear()
+            if self.__sweeper is not None:
+                self.__sweeper.cancel()
+                self.__sweeper = None
+        return items
+
+    def __close(self, item: KeyedItem[T]) -> None:
+        try:
+            item.close()
+        except DIAsyncError:
+            warnings.warn(
+                f"Evicted instance of {self} was created asynchronously and cannot be closed "
+                f"synchronously, provide it asynchronously instead",
+                stacklevel=1,
+            )
+
+
+class KeyedPretender(CreatorPretender[T, KeyedProvider]):
+    def __init__(
+        self,
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        *,
+        key: TKey,
+        maxsize: int | None,
+        ttl: float | None,
+    ) -> None:
+        super().__init__(KeyedProvider, callable)
+        self._key = key
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def __call__(self, *args: Any, **kwargs: Any) -> KeyedProvider:
+        provider = KeyedProvider(self._callable, *args, **kwargs)
+        provider.__configure__(key=self._key, maxsize=self._maxsize, ttl=self._ttl)
+        return provider
+
+
+class KeyedPretenderBuilder(CreatorPretenderBuilder[KeyedProvider]):
+    def __init__(
+        self,
+        *,
+        key: Any = None,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+    ) -> None:
+        super().__init__(KeyedProvider)
+
+        if key is not None and not isinstance(key, (Provider, ContextVar)):
+            raise DITypeError("Key has to be Provider or ContextVar instance")
+
+        self._key = key
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def __call__(
+        self,
+        *,
+        key: Any = None,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+    ) -> "KeyedPretenderBuilder":
+        return KeyedPretenderBuilder(key=key, maxsize=maxsize, ttl=ttl)
+
+    # The key is passed as the first argument of the callable, so it is not given to the pretender
+    @overload  # type: ignore[override]
+    def __getitem__(self, callable: str) -> Callable[..., Any]:
+        pass
+
+    @overload
+    def __getitem__(  # type: ignore[overload-overlap]
+        self,
+        callable: Callable[Concatenate[Any, P], Iterator[T]],
+    ) -> Callable[P, T]:
+        pass
+
+    @overload
+    def __getitem__(self, callable: Callable[Concatenate[Any, P], T]) -> Callable[P, T]:
+        pass
+
+    def __getitem__(self, callable: Any) -> Any:
+        return self.__create_pretender__(callable)
+
+    def __create_pretender__(self, callable: Any) -> KeyedPretender:
+        return KeyedPretender(callable, key=self._key, maxsize=self._maxsize, ttl=self._ttl)
@@ -0,0 +1,227 @@
+import asyncio
+import contextlib
+import sys
+import threading
+import warnings
+import weakref
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from diject.exceptions import DIAsyncError
+from diject.injector import Injector
+from diject.providers.creators.creator import CreatorProvider
+from diject.utils.context import Context
+from diject.utils.state import State
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False)
+class LoopLocalItem(Generic[T]):
+    state: State[T] | None = None
+    context: Context[T] | None = None
+    async_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Async generator closing the item when the loop shuts down its async generators
+    guard: AsyncGenerator[None, None] | None = None
+    # Finalizer closing the item when its loop is collected without shutting it down
+    finalizer: weakref.finalize | None = None
+
+    def close(self) -> None:
+        if self.state is not None:
+            self.state.close()
+            self.state = None
+
+        if self.context is not None:
+            self.context.close()
+            self.context = None
+
+    async def aclose(self) -> None:
+        if self.state is not None:
+            await self.state.aclose()
+            self.state = None
+
+        if self.context is not None:
+            await self.context.aclose()
+            self.context = None
+
+
+class LoopLocalProvider(CreatorProvider[T]):
+    def __init__(
+        self,
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(callable, *args, **kwargs)
+        self.__items: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopLocalItem[T]] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Guards only the mapping of loops, it is never held while awaiting
+        self.__items_lock = threading.Lock()
+        # Tasks closing instances whose synchronous shutdown was deferred
+        self.__closing: set[asyncio.Task[None]] = set()
+
+    def __provide_dependency__(self) -> T:
+        item = self.__get_item(self.__get_loop())
+
+        if item.state is None:
+            try:
+                with Injector(reuse_context=False, close_context=False) as item.context:
+                    item.state = self.__create__()
+            except BaseException:
+                item.close()
+                raise
+
+        return item.state.instance
+
+    async def __aprovide_dependency__(self) -> T:
+        item = self.__get_item(self.__get_loop())
+
+        if item.state is None:
+            async with item.async_lock:
+                if item.state is None:
+                    try:
+                        async with Injector(reuse_context=False, close_context=False) as item.context:
+                            item.state = await self.__acreate__()
+                    except BaseException:
+                        await item.aclose()
+                        raise
+
+        return item.state.instance  # type: ignore[union-attr]
+
+    def __shutdown_dependency__(self) -> None:
+        # Failure of one instance does not stop closing of the others
+        errors = [error for loop, item in self.__release_all() if (error := self.__close(loop, item))]
+        if errors:
+            raise errors[0]
+
+    async def __ashutdown_dependency__(self) -> None:
+        aws: list[Awaitable[None]] = []
+        for loop, item in self.__release_all():
+            if loop.is_running() and not self.__is_current(loop):
+                # Instance has to be closed within the loop it was created in
+                future = asyncio.run_coroutine_threadsafe(item.aclose(), loop)
+                aws.append(asyncio.wrap_future(future))
+            else:
+                aws.append(item.aclose())
+        await asyncio.gather(*aws)
+
+    def __get_loop(self) -> asyncio.AbstractEventLoop:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            raise DIAsyncError(f"'{self}' has to be provided within running event loop") from None
+
+    def __get_item(self, loop: asyncio.AbstractEventLoop) -> LoopLocalItem[T]:
+        if (item := self.__items.get(loop)) is not None:
+            return item
+
+        with self.__items_lock:
+            if (item := self.__items.get(loop)) is None:
+                item = self.__items[loop] = LoopLocalItem()
+                item.guard = self.__guard(item)
+                # Loop shuts down its async generators (e.g. at the end of `asyncio.run`) while it
+                # still runs, so the guard closes the item within the loop. It is registered
+                # without a finalizer, which would keep the loop (the weak key) alive.
+                hooks = sys.get_asyncgen_hooks()
+                sys.set_asyncgen_hooks(firstiter=None, finalizer=None)
+                try:
+                    with contextlib.suppress(StopIteration):
+                        item.guard.asend(None).send(None)
+                finally:
+                    sys.set_asyncgen_hooks(*hooks)
+                if hooks.firstiter is not None:
+                    hooks.firstiter(item.guard)
+                # Loop closed without shutting down its async generators is only collected
+                item.finalizer = weakref.finalize(loop, self.__close_collected, item)
+
+        return item
+
+    async def __guard(self, item: LoopLocalItem[T]) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            if self.__release(item):
+                # Guard is being closed now, so only the finalizer is detached
+                item.guard = None
+                self.__detach(item)
+                await item.aclose()
+
+    def __close_collected(self, item: LoopLocalItem[T]) -> None:
+        self.__release(item)
+        self.__detach(item)
+        try:
+            item.close()
+        except DIAsyncError:
+            warnings.warn(
+                f"Instance of {self} created asynchronously cannot be closed after its loop "
+                f"is closed, use `di.shutdown` before closing the loop instead",
+                stacklevel=1,
+            )
+
+    def __release(self, item: LoopLocalItem[T]) -> bool:
+        with self.__items_lock:
+            for loop, value in list(self.__items.items()):
+                if value is item:
+                    del self.__items[loop]
+                    return True
+        return False
+
+    def __release_all(self) -> list[tuple[asyncio.AbstractEventLoop, LoopLocalItem[T]]]:
+        with self.__items_lock:
+            items = list(self.__items.items())
+            self.__items.clear()
+
+        for _, item in items:
+            self.__detach(item)
+
+        return items
+
+    def __close(self, loop: asyncio.AbstractEventLoop, item: LoopLocalItem[T]) -> Exception | None:
+        try:
+            if loop.is_running() and not self.__is_current(loop):
+                asyncio.run_coroutine_threadsafe(item.aclose(), loop).result()
+            else:
+                item.close()
+        except DIAsyncError:
+            self.__defer_close(loop, item)
+        except Exception as exc:
+            return exc
+        return None
+
+    def __defer_close(self, loop: asyncio.AbstractEventLoop, item: LoopLocalItem[T]) -> None:
+        if self.__is_current(loop):
+            # Instance is closed by a task of the loop as soon as the caller gives control back
+            task = loop.create_task(item.aclose())
+            self.__closing.add(task)
+            task.add_done_callback(self.__closing.discard)
+            reason = "its closing is deferred to the event loop"
+        else:
+            reason = "it is left to be finalized by its event loop"
+
+        warnings.warn(
+            f"Instance of {self} created asynchronously cannot be closed synchronously, {reason}. "
+            f"Use `di.ashutdown` instead.",
+            stacklevel=1,
+        )
+
+    @staticmethod
+    def __detach(item: LoopLocalItem[T]) -> None:
+        # Item is released already, so it is closed neither by the loop nor by the finalizer
+        if item.finalizer is not None:
+            item.finalizer.detach()
+            item.finalizer = None
+
+        if (guard := item.guard) is not None:
+            item.guard = None
+            with contextlib.suppress(StopIteration):
+                guard.aclose().send(None)
+
+    @staticmethod
+    def __is_current(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
@@ -1,3 +1,4 @@
+from types import EllipsisType
 from typing import TypeVar, cast
 
 from diject.injector import Injector
@@ -14,17 +15,23 @@ class ScopedProvider(CreatorProvider[T]):
         if context is None:
             return self.__create__(allow_generator=False).instance
 
-        if self in context.store:
-            data = cast("ContextItem", context.store[self])
-        else:
-            data = ContextItem()
-            context.store[self] = data
+        # Context may be shared by threads resolving arguments in parallel
+        data = cast("ContextItem", context.store.setdefault(self, ContextItem()))
 
-        if data.state is None:
-            data.state = self.__create__()
+        with data.lock:
+            if data.state is None:
+                data.state = context.push(self.__create__(allow_generator=context.managed))
 
         return data.state.instance
 
+    def __provide_nowait_dependency__(self) -> T | EllipsisType:
+        # Instance already created within the current context is returned inline
+        if (context := Injector.get_context()) is not None:
+            data = context.store.get(self)
+            if isinstance(data, ContextItem) and data.state is not None:
+                return data.state.instance
+        return ...
+
     async def __aprovide_dependency__(self) -> T:
         context = Injector.get_context()
 
@@ -32,15 +39,10 @@ class ScopedProvider(CreatorProvider[T]):
             obj = await self.__acreate__(allow_generator=False)
             return obj.instance
 
-        async with context.async_lock:
-            if self in context.store:
-                data = cast("ContextItem", context.store[self])
-            else:
-                data = ContextItem()
-                context.store[self] = data
+        data = cast("ContextItem", context.store.setdefault(self, ContextItem()))
 
         async with data.async_lock:
             if data.state is None:
-                data.state = await self.__acreate__()
+                data.state = context.push(await self.__acreate__(allow_generator=context.managed))
 
         return data.state.instance
@@ -1,4 +1,5 @@
 from collections.abc import AsyncIterator, Callable, Iterator
+from types import EllipsisType
 from typing import Any, TypeVar
 
 from diject.injector import Injector
@@ -12,7 +13,7 @@ T = TypeVar("T")
 class SingletonProvider(CreatorProvider[T]):
     def __init__(
         self,
-        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T],
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
         /,
         *args: Any,
         **kwargs: Any,
@@ -31,15 +32,29 @@ class SingletonProvider(CreatorProvider[T]):
             await self.__astart_dependency__()
             return self.__state.instance  # type: ignore[union-attr]
 
+    def __provide_nowait_dependency__(self) -> T | EllipsisType:
+        if (state := self.__state) is not None:
+            return state.instance
+        return ...
+
     def __start_dependency__(self) -> None:
         if self.__state is None:
-            with Injector(reuse_context=False, close_context=False) as self.__context:
-                self.__state = self.__create__()
+            try:
+                with Injector(reuse_context=False, close_context=False) as self.__context:
+                    self.__state = self.__create__()
+            except BaseException:
+                # Dependencies already created for the failed singleton are not left behind
+                self.__shutdown_dependency__()
+                raise
 
     async def __astart_dependency__(self) -> None:
         if self.__state is None:
-            async with Injector(reuse_context=False, close_context=False) as self.__context:
-                self.__state = await self.__acreate__()
+            try:
+                async with Injector(reuse_context=False, close_context=False) as self.__context:
+                    self.__state = await self.__acreate__()
+            except BaseException:
+                await self.__ashutdown_dependency__()
+                raise
 
     def __shutdown_dependency__(self) -> None:
         if self.__state is not None:
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import warnings
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from diject.exceptions import DIAsyncError
+from diject.injector import Injector
+from diject.providers.creators.creator import CreatorPretender, CreatorPretenderBuilder, CreatorProvider
+from diject.utils.context import Context
+from diject.utils.state import State
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ThreadLocalStats:
+    live: int
+    created: int
+    closed: int
+
+
+@dataclass(eq=False)
+class ThreadLocalItem(Generic[T]):
+    state: State[T] | None = None
+    context: Context[T] | None = None
+    async_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def close(self) -> None:
+        if self.state is not None:
+            self.state.close()
+            self.state = None
+
+        if self.context is not None:
+            self.context.close()
+            self.context = None
+
+    async def aclose(self) -> None:
+        if self.state is not None:
+            await self.state.aclose()
+            self.state = None
+
+        if self.context is not None:
+            await self.context.aclose()
+            self.context = None
+
+
+class ThreadLocalProvider(CreatorProvider[T]):
+    __thread_affine__ = True
+
+    def __init__(
+        self,
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(callable, *args, **kwargs)
+        self.__local = threading.local()
+        self.__items: dict[ThreadLocalItem[T], None] = {}
+        self.__items_lock = threading.Lock()
+        self.__close_on_thread_exit = False
+        self.__created = 0
+        self.__closed = 0
+
+    @property
+    def __close_on_thread_exit__(self) -> bool:
+        return self.__close_on_thread_exit
+
+    @__close_on_thread_exit__.setter
+    def __close_on_thread_exit__(self, value: bool) -> None:
+        self.__close_on_thread_exit = value
+
+    @property
+    def __stats__(self) -> ThreadLocalStats:
+        with self.__items_lock:
+            return ThreadLocalStats(
+                live=len(self.__items),
+                created=self.__created,
+                closed=self.__closed,
+            )
+
+    def __provide_dependency__(self) -> T:
+        # Instance is owned by the current thread, so no locking is required
+        item = self.__get_item()
+
+        if item.state is None:
+            try:
+                with Injector(reuse_context=False, close_context=False) as item.context:
+                    item.state = self.__create__()
+            except BaseException:
+                item.close()
+                raise
+            self.__register(item)
+
+        return item.state.instance
+
+    async def __aprovide_dependency__(self) -> T:
+        item = self.__get_item()
+
+        async with item.async_lock:
+            if item.state is None:
+                try:
+                    async with Injector(reuse_context=False, close_context=False) as item.context:
+                        item.state = await self.__acreate__()
+                except BaseException:
+                    await item.aclose()
+                    raise
+                self.__register(item)
+
+        return item.state.instance
+
+    def __shutdown_dependency__(self) -> None:
+        for item in self.__release_all():
+            item.close()
+
+    async def __ashutdown_dependency__(self) -> None:
+        await asyncio.gather(*(item.aclose() for item in self.__release_all()))
+
+    def __get_item(self) -> ThreadLocalItem[T]:
+        local = self.__local
+        item: ThreadLocalItem[T] | None = getattr(local, "item", None)
+
+        if item is None:
+            item = local.item = ThreadLocalItem()
+            if self.__close_on_thread_exit:
+                # Thread local data is dropped when the thread exits, which triggers finalizer
+                local.sentinel = sentinel = _Sentinel()
+                weakref.finalize(sentinel, self.__close_on_exit, item)
+
+        return item
+
+    def __register(self, item: ThreadLocalItem[T]) -> None:
+        with self.__items_lock:
+            self.__items[item] = None
+            self.__created += 1
+
+    def __release_all(self) -> list[ThreadLocalItem[T]]:
+        with self.__items_lock:
+            items = list(self.__items)
+            self.__items.clear()
+            self.__closed += len(items)
+            # Instances of all threads are closed, so each thread has to create a new one
+            self.__local = threading.local()
+        return items
+
+    def __close_on_exit(self, item: ThreadLocalItem[T]) -> None:
+        with self.__items_lock:
+            if item not in self.__items:
+                return
+            del self.__items[item]
+            self.__closed += 1
+
+        try:
+            item.close()
+        except DIAsyncError:
+            warnings.warn(
+                f"Instance of {self} created asynchronously cannot be closed on thread exit, "
+                f"use `di.shutdown` instead",
+                stacklevel=1,
+            )
+
+
+class _Sentinel:
+    pass
+
+
+class ThreadLocalPretender(CreatorPretender[T, ThreadLocalProvider]):
+    def __init__(
+        self,
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        *,
+        close_on_thread_exit: bool,
+    ) -> None:
+        super().__init__(ThreadLocalProvider, callable)
+        self._close_on_thread_exit = close_on_thread_exit
+
+    def __call__(self, *args: Any, **kwargs: Any) -> ThreadLocalProvider:
+        provider = ThreadLocalProvider(self._callable, *args, **kwargs)
+        provider.__close_on_thread_exit__ = self._close_on_thread_exit
+        return provider
+
+
+class ThreadLocalPretenderBuilder(CreatorPretenderBuilder[ThreadLocalProvider]):
+    def __init__(self, *, close_on_thread_exit: bool = False) -> None:
+        super().__init__(ThreadLocalProvider)
+        self._close_on_thread_exit = close_on_thread_exit
+
+    def __call__(self, *, close_on_thread_exit: bool = False) -> "ThreadLocalPretenderBuilder":
+        return ThreadLocalPretenderBuilder(close_on_thread_exit=close_on_thread_exit)
+
+    def __create_pretender__(self, callable: Any) -> ThreadLocalPretender:
+        return ThreadLocalPretender(callable, close_on_thread_exit=self._close_on_thread_exit)
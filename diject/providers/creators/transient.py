@@ -1,28 +1,50 @@
-from typing import TypeVar, cast
+import asyncio
+import warnings
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, TypeVar
 
+from diject.exceptions import DIAsyncError
 from diject.injector import Injector
 from diject.providers.creators.creator import CreatorProvider
-from diject.utils.context import ContextList
+from diject.utils.buffer import Buffer, BufferItem
+from diject.utils.pool import run_parallel
+from diject.utils.status import Status
+from diject.utils.tasks import gather
 
 T = TypeVar("T")
 
 
 class TransientProvider(CreatorProvider[T]):
+    __fresh__ = True
+
+    def __init__(
+        self,
+        callable: Callable[..., AsyncIterator[T] | Iterator[T] | T] | str,
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(callable, *args, **kwargs)
+        self.__buffer: Buffer[T] | None = None
+
+    @property
+    def __instance_buffer__(self) -> Buffer[T] | None:
+        return self.__buffer
+
+    def __buffer_instances__(self, size: int | None) -> None:
+        self.__buffer = None if size is None else Buffer(size, self.__create_item, self.__acreate_item)
+
     def __provide_dependency__(self) -> T:
         context = Injector.get_context()
 
         if context is None:
             return self.__create__(allow_generator=False).instance
 
-        if self in context.store:
-            data = cast("ContextList", context.store[self])
-        else:
-            data = ContextList()
-            context.store[self] = data
+        # Buffered instance is owned by the context, which closes it together with its dependencies
+        if self.__buffer is not None and context.managed and (item := self.__buffer.pop()) is not None:
+            return context.push(item).instance
 
-        obj = self.__create__()
-        data.states.append(obj)
-        return obj.instance
+        return context.push(self.__create__(allow_generator=context.managed)).instance
 
     async def __aprovide_dependency__(self) -> T:
         context = Injector.get_context()
@@ -31,13 +53,93 @@ class TransientProvider(CreatorProvider[T]):
             obj = await self.__acreate__(allow_generator=False)
             return obj.instance
 
-        async with context.async_lock:
-            if self in context.store:
-                data = cast("ContextList", context.store[self])
-            else:
-                data = ContextList()
-                context.store[self] = data
+        if self.__buffer is not None and context.managed and (item := await self.__buffer.apop()) is not None:
+            return context.push(item).instance
+
+        return context.push(await self.__acreate__(allow_generator=context.managed)).instance
+
+    def __start_dependency__(self) -> None:
+        super().__start_dependency__()
+        if self.__buffer is not None:
+            self.__buffer.fill()
+
+    async def __astart_dependency__(self) -> None:
+        await super().__astart_dependency__()
+        if self.__buffer is not None:
+            self.__buffer.afill()
+
+    def __shutdown_dependency__(self) -> None:
+        if self.__buffer is not None:
+            for item in self.__buffer.clear():
+                self.__close(item)
+
+    async def __ashutdown_dependency__(self) -> None:
+        if self.__buffer is not None:
+            await asyncio.gather(*(item.aclose() for item in self.__buffer.clear()))
+
+    def __provide_n__(self, n: int, *, parallel: bool = False) -> list[T]:
+        # Shared part of the argument tree is resolved once, transient arguments for each instance
+        context = Injector.get_context()
+        arguments = self.__share_arguments__()
+
+        def create() -> T:
+            state = self.__create__(
+                allow_generator=context is not None and context.managed,
+                arguments=arguments(),
+            )
+            if context is not None:
+                context.push(state)
+            return state.instance
+
+        instances = run_parallel([create] * n) if parallel else [create() for _ in range(n)]
+        self.__status__ = Status.RUNNING
+        return instances
+
+    async def __aprovide_n__(self, n: int) -> list[T]:
+        context = Injector.get_context()
+        arguments = await self.__ashare_arguments__()
+
+        async def create() -> T:
+            state = await self.__acreate__(
+                allow_generator=context is not None and context.managed,
+                arguments=await arguments(),
+                coalesce=False,
+            )
+            if context is not None:
+                context.push(state)
+            return state.instance
+
+        instances = list(await gather(*(create() for _ in range(n))))
+        self.__status__ = Status.RUNNING
+        return instances
+
+    def __create_item(self) -> BufferItem[T]:
+        # Dependencies of a buffered instance live in its own context, as it outlives the refill
+        item: BufferItem[T] = BufferItem()
+        try:
+            with Injector(reuse_context=False, close_context=False) as item.context:
+                item.state = self.__create__()
+        except BaseException:
+            item.close()
+            raise
+        return item
+
+    async def __acreate_item(self) -> BufferItem[T]:
+        item: BufferItem[T] = BufferItem()
+        try:
+            async with Injector(reuse_context=False, close_context=False) as item.context:
+                item.state = await self.__acreate__()
+        except BaseException:
+            await item.aclose()
+            raise
+        return item
 
-        obj = self.__create__()
-        data.states.append(obj)
-        return obj.instance
+    def __close(self, item: BufferItem[T]) -> None:
+        try:
+            item.close()
+        except DIAsyncError:
+            warnings.warn(
+                f"Buffered instance of {self} was created asynchronously and cannot be closed "
+                f"synchronously, shut it down asynchronously instead",
+                stacklevel=1,
+            )
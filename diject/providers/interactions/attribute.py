@@ -11,13 +11,14 @@ class AttributeProvider(Provider):
         super().__init__()
         self.__provider = provider
         self.__name = name
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
         return create_class_repr(self, self.__provider, self.__name)
 
-    def __propagate_alias__(self, alias: str) -> None:
-        for name, provider in self.__travers__():
-            provider.__alias__ = f"{alias}{name}"
+    def __propagate_alias__(self) -> None:
+        for name, provider in self.__travers_dependency__():
+            provider.__link_alias__(self, name)
 
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield f"{{{self.__name}}}", self.__provider
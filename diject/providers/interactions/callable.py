@@ -1,4 +1,3 @@
-import asyncio
 import itertools
 from collections.abc import Iterator
 from typing import Any
@@ -8,6 +7,7 @@ from diject.providers.collections.dict import DictProvider
 from diject.providers.collections.tuple import TupleProvider
 from diject.providers.provider import Provider
 from diject.utils.string import create_class_repr
+from diject.utils.tasks import aprovide_all
 
 
 class CallableProvider(Provider):
@@ -16,15 +16,18 @@ class CallableProvider(Provider):
         self.__callable = callable
         self.__args = TupleProvider(args)
         self.__kwargs = DictProvider(kwargs)
+        self.__args.__link_alias__(self, "")
+        self.__kwargs.__link_alias__(self, "")
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
         return create_class_repr(
             self, self.__callable, *self.__args.__object__, **self.__kwargs.__object__,
         )
 
-    def __propagate_alias__(self, alias: str) -> None:
-        for name, provider in self.__travers__():
-            provider.__alias__ = f"{alias}{name}"
+    def __propagate_alias__(self) -> None:
+        for name, provider in self.__travers_dependency__():
+            provider.__link_alias__(self, name)
 
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield "{()}", self.__callable
@@ -49,10 +52,8 @@ class CallableProvider(Provider):
             ) from exc
 
     async def __aprovide_dependency__(self) -> Any:
-        obj, args, kwargs = await asyncio.gather(
-            self.__callable.__aprovide__(),
-            self.__args.__aprovide__(),
-            self.__kwargs.__aprovide__(),
+        obj, args, kwargs = await aprovide_all(
+            (self.__callable, self.__args, self.__kwargs),
         )
         try:
             return obj(*args, **kwargs)
@@ -1,4 +1,3 @@
-import asyncio
 from collections.abc import Iterator
 from typing import Any
 
@@ -6,6 +5,7 @@ from diject.exceptions import DIErrorWrapper
 from diject.providers.provider import Provider
 from diject.utils.cast import any_as_provider
 from diject.utils.string import create_class_repr
+from diject.utils.tasks import aprovide_all
 
 
 class ItemProvider(Provider):
@@ -13,13 +13,14 @@ class ItemProvider(Provider):
         super().__init__()
         self.__provider = provider
         self.__item = any_as_provider(item)
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
         return create_class_repr(self, self.__provider, self.__item)
 
-    def __propagate_alias__(self, alias: str) -> None:
-        for name, provider in self.__travers__():
-            provider.__alias__ = f"{alias}{name}"
+    def __propagate_alias__(self) -> None:
+        for name, provider in self.__travers_dependency__():
+            provider.__link_alias__(self, name)
 
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield "{[]}", self.__provider
@@ -37,10 +38,7 @@ class ItemProvider(Provider):
             ) from exc
 
     async def __aprovide_dependency__(self) -> Any:
-        obj, item = await asyncio.gather(
-            self.__provider.__aprovide__(),
-            self.__item.__aprovide__(),
-        )
+        obj, item = await aprovide_all((self.__provider, self.__item))
         try:
             return obj[item]
         except Exception as exc:
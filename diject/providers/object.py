@@ -33,17 +33,32 @@ class ObjectProvider(Provider[T]):
             self.__object = obj
             self.__status__ = Status.RUNNING
 
+    def __update__(self, obj: T) -> None:
+        with self.__lock__:
+            self.__object = obj
+            self.__status__ = Status.RUNNING
+
     def __travers_dependency__(self) -> Iterator[tuple[str, Provider]]:
         yield from ()
 
     def __provide_dependency__(self) -> T:
+        # Already set object is returned without locking
+        if (obj := self.__object) is not ...:
+            return obj
+
         with self.__lock__:
             return self.__provide()
 
     async def __aprovide_dependency__(self) -> T:
+        if (obj := self.__object) is not ...:
+            return obj
+
         async with self.__lock__:
             return self.__provide()
 
+    def __provide_nowait_dependency__(self) -> T | EllipsisType:
+        return self.__object__
+
     def __provide(self) -> T:
         if self.__object is ...:
             if self.__origin is ...:
@@ -1,8 +1,10 @@
 import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from types import EllipsisType
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from diject.tools.profile import Recorder
 from diject.utils.lock import Lock
 from diject.utils.status import Status
 from diject.utils.string import create_class_repr, to_safe_string
@@ -19,6 +21,7 @@ class Provider(Generic[T], ABC):
     def __init__(self) -> None:
         self.__lock = Lock()
         self.__alias = ""
+        self.__alias_origin: tuple[Provider, str] | None = None
         self.__status = Status.IDLE
 
     def __str__(self) -> str:
@@ -30,10 +33,7 @@ class Provider(Generic[T], ABC):
         from diject.providers.interactions.callable import CallableProvider
 
         callable_provider = CallableProvider(self, *args, **kwargs)
-
-        if self.__alias__:
-            callable_provider.__alias__ = f"{self.__alias__}()"
-
+        callable_provider.__link_alias__(self, "()")
         return callable_provider
 
     def __getattr__(self, name: str) -> "AttributeProvider":
@@ -42,20 +42,14 @@ class Provider(Generic[T], ABC):
         from diject.providers.interactions.attribute import AttributeProvider
 
         attribute_provider = AttributeProvider(self, name)
-
-        if self.__alias__:
-            attribute_provider.__alias__ = f"{self.__alias__}.{name}"
-
+        attribute_provider.__link_alias__(self, f".{name}")
         return attribute_provider
 
     def __getitem__(self, key: Any) -> "ItemProvider":
         from diject.providers.interactions.item import ItemProvider
 
         item_provider = ItemProvider(self, key)
-
-        if self.__alias__:
-            item_provider.__alias__ = f"{self.__alias__}[{to_safe_string(key)}]"
-
+        item_provider.__link_alias__(self, f"[{to_safe_string(key)}]")
         return item_provider
 
     @property
@@ -64,13 +58,20 @@ class Provider(Generic[T], ABC):
 
     @property
     def __alias__(self) -> str:
+        if not self.__alias and self.__alias_origin is not None:
+            parent, suffix = self.__alias_origin
+            if parent_alias := parent.__alias__:
+                self.__alias = f"{parent_alias}{suffix}"
         return self.__alias
 
     @__alias__.setter
     def __alias__(self, alias: str) -> None:
-        if not self.__alias:
+        if not self.__alias__:
             self.__alias = alias
-            self.__propagate_alias__(alias)
+
+    @property
+    def __alias_origin__(self) -> "tuple[Provider, str] | None":
+        return self.__alias_origin
 
     @property
     def __status__(self) -> Status:
@@ -80,9 +81,28 @@ class Provider(Generic[T], ABC):
     def __status__(self, status: Status) -> None:
         self.__status = status
 
-    def __propagate_alias__(self, alias: str) -> None:
-        for name, provider in self.__travers__():
-            provider.__alias__ = f"{alias}.{name}"
+    def __link_alias__(self, parent: "Provider", suffix: str, /) -> None:
+        # The alias is resolved lazily from the parent. Dependencies of an internal collection
+        # (linked to its owner without suffix) are re-linked directly to that owner.
+        if self.__alias:
+            return
+
+        origin = self.__alias_origin
+        if origin is not None and origin[0].__alias_origin__ != (parent, ""):
+            return
+
+        ancestor: Provider | None = parent
+        while ancestor is not None:
+            if ancestor is self:
+                return
+            origin = ancestor.__alias_origin__
+            ancestor = origin[0] if origin is not None else None
+
+        self.__alias_origin = (parent, suffix)
+
+    def __propagate_alias__(self) -> None:
+        for name, provider in self.__travers_dependency__():
+            provider.__link_alias__(self, f".{name}")
 
     def __travers__(self) -> Iterator[tuple[str, "Provider"]]:
         try:
@@ -99,6 +119,8 @@ class Provider(Generic[T], ABC):
             raise
         else:
             self.__status = Status.RUNNING
+            if (recorder := Recorder.get_active()) is not None:
+                recorder.record(self)
             return dependency
 
     async def __aprovide__(self) -> T:
@@ -109,8 +131,25 @@ class Provider(Generic[T], ABC):
             raise
         else:
             self.__status = Status.RUNNING
+            if (recorder := Recorder.get_active()) is not None:
+                recorder.record(self)
             return dependency
 
+    def __provide_nowait__(self) -> T | EllipsisType:
+        # Value which is available without waiting (e.g. constant or started singleton) is
+        # returned inline by async resolution, otherwise `...` is returned
+        try:
+            dependency = self.__provide_nowait_dependency__()
+        except Exception:
+            self.__status = Status.CORRUPTED
+            raise
+
+        if dependency is not ...:
+            self.__status = Status.RUNNING
+            if (recorder := Recorder.get_active()) is not None:
+                recorder.record(self)
+        return dependency
+
     def __start__(self) -> None:
         with self.__lock:
             if self.__status is not Status.RUNNING:
@@ -147,6 +186,19 @@ class Provider(Generic[T], ABC):
                 await self.__ashutdown_dependency__()
                 self.__status = Status.IDLE
 
+    def __reset__(self) -> None:
+        # Unlike shutdown, dependencies of the provider are left running
+        with self.__lock:
+            if self.__status is not Status.IDLE:
+                self.__shutdown_dependency__()
+                self.__status = Status.IDLE
+
+    async def __areset__(self) -> None:
+        async with self.__lock:
+            if self.__status is not Status.IDLE:
+                await self.__ashutdown_dependency__()
+                self.__status = Status.IDLE
+
     @abstractmethod
     def __travers_dependency__(self) -> Iterator[tuple[str, "Provider"]]:
         pass
@@ -159,6 +211,9 @@ class Provider(Generic[T], ABC):
     async def __aprovide_dependency__(self) -> T:
         pass
 
+    def __provide_nowait_dependency__(self) -> T | EllipsisType:
+        return ...
+
     def __start_dependency__(self) -> None:
         for name, provider in self.__travers__():
             provider.__start__()
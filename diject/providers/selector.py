@@ -1,39 +1,170 @@
+import asyncio
+import functools
+import threading
+import time
+import warnings
 from collections.abc import AsyncIterator, Callable, Iterator
-from contextlib import contextmanager
-from types import TracebackType
+from contextlib import AsyncExitStack, ExitStack, contextmanager
+from contextvars import ContextVar
+from types import EllipsisType, TracebackType
 from typing import Any, Generic, TypeVar
 
 from diject.exceptions import DISelectorError, DITypeError
 from diject.injector import Injector
 from diject.providers.provider import Pretender, PretenderBuilder, Provider
 from diject.utils.cast import any_as_provider
+from diject.utils.context import Context, ContextLease
 from diject.utils.status import Status
 from diject.utils.string import create_class_repr
 
 T = TypeVar("T")
 
 
+class SelectorLeases:
+    """Count injection contexts which use each option of selectors within one group.
+
+    Counting takes no lock: a context is counted before it checks that the option is still
+    selected, so either a switch waits for the context or the context uses the new option.
+    """
+
+    def __init__(self) -> None:
+        # Contexts holding each option, appending to and popping from a list are atomic
+        self._holders: dict[str, list[None]] = {}
+        # Callbacks of drains waiting for options to be released
+        self._waiters: set[Callable[[], None]] = set()
+
+    def acquire(self, selector: "SelectorProvider[Any]") -> ContextLease | None:
+        while (option := selector.__option__) is not None:
+            holders = self._holders.setdefault(option, [])
+            holders.append(None)
+            if selector.__option__ == option:
+                return ContextLease(value=option, release=functools.partial(self._release, holders))
+            # Group was switched meanwhile, so the new option is leased instead
+            self._release(holders)
+
+        return None
+
+    def drain(self, options: set[str], timeout: float | None = None) -> bool:
+        """Wait until no context uses the options and return whether it happened in time."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        released = threading.Event()
+        self._waiters.add(released.set)
+        try:
+            while True:
+                released.clear()
+                if self._is_free(options):
+                    return True
+                if not released.wait(None if deadline is None else deadline - time.monotonic()):
+                    return self._is_free(options)
+        finally:
+            self._waiters.discard(released.set)
+
+    async def adrain(self, options: set[str], timeout: float | None = None) -> bool:
+        loop = asyncio.get_running_loop()
+        released = asyncio.Event()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(released.set)
+
+        self._waiters.add(notify)
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    released.clear()
+                    if self._is_free(options):
+                        return True
+                    await released.wait()
+        except TimeoutError:
+            return self._is_free(options)
+        finally:
+            self._waiters.discard(notify)
+
+    def _is_free(self, options: set[str]) -> bool:
+        return not any(self._holders.get(option) for option in options)
+
+    def _release(self, holders: list[None]) -> None:
+        holders.pop()
+        if not holders:
+            for notify in list(self._waiters):
+                notify()
+
+
 class SelectorProvider(Provider[T]):
-    def __init__(self, selector: Provider[str] | str, /, **providers: Provider[T] | T) -> None:
+    def __init__(
+        self,
+        selector: Provider[str] | ContextVar[str] | str,
+        /,
+        **providers: Provider[T] | T,
+    ) -> None:
         super().__init__()
+        # Option of dynamic selector is read from the context variable on each resolution
+        self.__variable = selector if isinstance(selector, ContextVar) else None
         self.__selector = any_as_provider(selector)
         self.__providers = {key: any_as_provider(provider) for key, provider in providers.items()}
+        self.__live: dict[str, None] = {}
         self.__option: str | None = None
+        self.__selected: Provider[T] | None = None
+        self.__group: set[SelectorProvider[T]] = {self}
+        self.__leases = SelectorLeases()
+        self.__propagate_alias__()
 
     def __repr__(self) -> str:
-        return create_class_repr(self, self.__selector, **self.__providers)
+        return create_class_repr(self, self.__variable or self.__selector, **self.__providers)
+
+    @property
+    def __option__(self) -> str | None:
+        return self.__option
+
+    @property
+    def __dynamic__(self) -> bool:
+        return self.__variable is not None
+
+    @property
+    def __group__(self) -> set["SelectorProvider[T]"]:
+        return self.__group
+
+    def __setgroup__(self, group: set["SelectorProvider[T]"], leases: SelectorLeases) -> None:
+        self.__group = group
+        self.__leases = leases
 
     def __getoptions__(self) -> set[str]:
         return set(self.__providers)
 
+    def __getoption__(self, option: str) -> Provider[T]:
+        return self.__providers[option]
+
     def __setoption__(self, option: str, provider: Provider[T] | T) -> None:
         self.__providers[option] = any_as_provider(provider)
+        self.__selected = None
+        self.__providers[option].__link_alias__(self, f"[{option}]")
+
+    def __propagate_alias__(self) -> None:
+        for name, provider in self.__travers_dependency__():
+            provider.__link_alias__(self, name)
+
+    def __dispatch(self, variable: ContextVar[str]) -> Provider[T]:
+        try:
+            option = variable.get()
+        except LookupError:
+            raise DISelectorError(f"Option of {self} is not set in {variable}") from None
+
+        try:
+            provider = self.__providers[option]
+        except KeyError:
+            raise DISelectorError(
+                f"Invalid option '{option}'. "
+                f"Available options for {self}: {', '.join(self.__providers)}",
+            ) from None
+
+        if option not in self.__live:
+            self.__live[option] = None
 
-    def __propagate_alias__(self, alias: str) -> None:
-        for name, provider in self.__travers__():
-            provider.__alias__ = f"{alias}{name}"
+        return provider
 
     def __selected__(self) -> Provider[T]:
+        if self.__variable is not None:
+            return self.__dispatch(self.__variable)
+
         if self.__option is None:
             try:
                 with Injector(reuse_context=False):
@@ -47,14 +178,19 @@ class SelectorProvider(Provider[T]):
                 raise DITypeError(f"Selector must be 'str' type; not '{type(option).__name__}'")
 
         try:
-            return self.__providers[self.__option]
+            self.__selected = self.__providers[self.__option]
         except KeyError:
             raise DISelectorError(
                 f"Invalid option '{self.__option}'. "
                 f"Available options for {self}: {', '.join(self.__providers)}",
             )
 
+        return self.__selected
+
     async def __aselected__(self) -> Provider[T]:
+        if self.__variable is not None:
+            return self.__dispatch(self.__variable)
+
         if self.__option is None:
             try:
                 async with Injector(reuse_context=False):
@@ -68,13 +204,15 @@ class SelectorProvider(Provider[T]):
                 raise DITypeError(f"Selector must be 'str' type; not '{type(option).__name__}'")
 
         try:
-            return self.__providers[self.__option]
+            self.__selected = self.__providers[self.__option]
         except KeyError:
             raise DISelectorError(
                 f"Invalid option '{self.__option}'. "
                 f"Available options for {self}: {', '.join(self.__providers)}",
             )
 
+        return self.__selected
+
     def __travers__(
         self,
         *,
@@ -103,6 +241,12 @@ class SelectorProvider(Provider[T]):
         *,
         only_selected: bool = False,
     ) -> Iterator[tuple[str, Provider]]:
+        if only_selected and self.__variable is not None:
+            # All options resolved so far are in use by dynamic selector
+            for option in list(self.__live):
+                yield f"[{option}]", self.__providers[option]
+            return
+
         if only_selected:
             with self.__lock__:
                 selected = self.__selected__()
@@ -111,13 +255,19 @@ class SelectorProvider(Provider[T]):
             for option, provider in self.__providers.items():
                 yield f"[{option}]", provider
 
-        yield "?", self.__selector
+        if self.__variable is None:
+            yield "?", self.__selector
 
     async def __atravers_dependency__(
         self,
         *,
         only_selected: bool = False,
     ) -> AsyncIterator[tuple[str, Provider]]:
+        if only_selected and self.__variable is not None:
+            for option in list(self.__live):
+                yield f"[{option}]", self.__providers[option]
+            return
+
         if only_selected:
             async with self.__lock__:
                 selected = await self.__aselected__()
@@ -126,42 +276,208 @@ class SelectorProvider(Provider[T]):
             for option, provider in self.__providers.items():
                 yield f"[{option}]", provider
 
-        yield "?", self.__selector
+        if self.__variable is None:
+            yield "?", self.__selector
 
     def __provide_dependency__(self) -> T:
-        with self.__lock__:
-            selected = self.__selected__()
+        # Dispatch of dynamic selector is a single lookup, so it requires neither lock nor lease
+        if (variable := self.__variable) is not None:
+            return self.__dispatch(variable).__provide__()
+
+        # Lock is needed only until the option is selected
+        if (selected := self.__selected) is None:
+            with self.__lock__:
+                selected = self.__selected__()
+
+        if (context := Injector.get_context()) is not None:
+            selected = self.__lease(context, selected)
+
         return selected.__provide__()
 
     async def __aprovide_dependency__(self) -> T:
-        async with self.__lock__:
-            selected = await self.__aselected__()
+        if (variable := self.__variable) is not None:
+            return await self.__dispatch(variable).__aprovide__()
+
+        if (selected := self.__selected) is None:
+            async with self.__lock__:
+                selected = await self.__aselected__()
+
+        if (context := Injector.get_context()) is not None:
+            selected = self.__lease(context, selected)
+
         return await selected.__aprovide__()
 
+    def __provide_nowait_dependency__(self) -> T | EllipsisType:
+        if (variable := self.__variable) is not None:
+            return self.__dispatch(variable).__provide_nowait__()
+
+        if (selected := self.__selected) is None:
+            return ...
+
+        if (context := Injector.get_context()) is not None:
+            selected = self.__lease(context, selected)
+
+        return selected.__provide_nowait__()
+
+    def __lease(self, context: Context, selected: Provider[T]) -> Provider[T]:
+        # Context uses one option of the selector group until it is closed, even if the group
+        # is switched meanwhile, so the previous option can be drained before shutdown.
+        if context.detached or not context.managed:
+            # Context owned by a provider (e.g. singleton) is never closed by a request, so
+            # the provider is rebuilt on switch instead of holding the previous option. Temporary
+            # context (e.g. of `di.provide_many`) is never closed either, like no context at all.
+            return selected
+
+        lease = context.store.get(self.__leases)
+
+        if lease is None:
+            if (lease := self.__leases.acquire(self)) is None:
+                return selected
+            context.store[self.__leases] = context.push(lease)
+
+        return self.__providers[lease.value]  # type: ignore[union-attr]
+
     def __start_dependency__(self) -> None:
+        if self.__variable is not None and self.__variable.get(None) is None:
+            return
+
         selected = self.__selected__()
         selected.__start__()
 
     async def __astart_dependency__(self) -> None:
+        if self.__variable is not None and self.__variable.get(None) is None:
+            return
+
         selected = await self.__aselected__()
         await selected.__astart__()
 
+    def __switch__(self, option: str) -> set[str]:
+        selectors = sorted(self.__group, key=id)
+
+        previous = {selector.__switch_prepare__(option) for selector in selectors} - {option}
+        for selector in selectors:
+            selector.__getoption__(option).__start__()
+
+        with ExitStack() as stack:
+            for selector in selectors:
+                stack.enter_context(selector.__lock__)
+
+            for selector in selectors:
+                selector.__switch_option__(option)
+
+        return previous
+
+    def __drain__(self, options: set[str], *, timeout: float | None = None) -> None:
+        if not self.__leases.drain(options, timeout=timeout):
+            warnings.warn(
+                f"Previous options ({', '.join(options)}) of {self} are still in use "
+                f"and will not be shut down",
+            )
+            return
+
+        for selector in sorted(self.__group, key=id):
+            for option in options:
+                selector.__getoption__(option).__shutdown__()
+
+    async def __aswitch__(self, option: str) -> set[str]:
+        selectors = sorted(self.__group, key=id)
+
+        previous = {await selector.__aswitch_prepare__(option) for selector in selectors} - {option}
+        await asyncio.gather(*(selector.__getoption__(option).__astart__() for selector in selectors))
+
+        async with AsyncExitStack() as stack:
+            for selector in selectors:
+                await stack.enter_async_context(selector.__lock__)
+
+            for selector in selectors:
+                selector.__switch_option__(option)
+
+        return previous
+
+    async def __adrain__(self, options: set[str], *, timeout: float | None = None) -> None:
+        if not await self.__leases.adrain(options, timeout=timeout):
+            warnings.warn(
+                f"Previous options ({', '.join(options)}) of {self} are still in use "
+                f"and will not be shut down",
+            )
+            return
+
+        await asyncio.gather(
+            *(
+                selector.__getoption__(option).__ashutdown__()
+                for selector in sorted(self.__group, key=id)
+                for option in options
+            ),
+        )
+
+    def __switch_prepare__(self, option: str) -> str:
+        if self.__variable is not None:
+            raise DISelectorError(f"Option of dynamic {self} cannot be switched")
+
+        if option not in self.__providers:
+            raise DISelectorError(
+                f"Invalid option '{option}'. "
+                f"Available options for {self}: {', '.join(self.__providers)}",
+            )
+
+        with self.__lock__:
+            self.__selected__()
+            return self.__option  # type: ignore[return-value]
+
+    async def __aswitch_prepare__(self, option: str) -> str:
+        if self.__variable is not None:
+            raise DISelectorError(f"Option of dynamic {self} cannot be switched")
+
+        if option not in self.__providers:
+            raise DISelectorError(
+                f"Invalid option '{option}'. "
+                f"Available options for {self}: {', '.join(self.__providers)}",
+            )
+
+        async with self.__lock__:
+            await self.__aselected__()
+            return self.__option  # type: ignore[return-value]
+
+    def __switch_option__(self, option: str) -> None:
+        self.__option = option
+        self.__selected = self.__providers[option]
+        self.__status__ = Status.RUNNING
+
+    def __shutdown_dependency__(self) -> None:
+        self.__selected = None
+        self.__option = None
+        self.__live.clear()
+
+    async def __ashutdown_dependency__(self) -> None:
+        self.__selected = None
+        self.__option = None
+        self.__live.clear()
+
     def __shutdown__(self) -> None:
         with self.__lock__:
             if self.__status__ is not Status.IDLE:
                 if self.__option is not None:
+                    self.__selected = None
                     if self.__option in self.__providers:
                         self.__providers[self.__option].__shutdown__()
                     self.__option = None
+                for option in self.__live:
+                    self.__providers[option].__shutdown__()
+                self.__live.clear()
                 self.__status__ = Status.IDLE
 
     async def __ashutdown__(self) -> None:
         async with self.__lock__:
             if self.__status__ is not Status.IDLE:
                 if self.__option is not None:
+                    self.__selected = None
                     if self.__option in self.__providers:
                         await self.__providers[self.__option].__ashutdown__()
                     self.__option = None
+                await asyncio.gather(
+                    *(self.__providers[option].__ashutdown__() for option in self.__live),
+                )
+                self.__live.clear()
                 self.__status__ = Status.IDLE
 
 
@@ -191,10 +507,11 @@ class SelectorOption:
 
 
 class GroupSelector:
-    def __init__(self, selector: str) -> None:
+    def __init__(self, selector: ContextVar[str] | str) -> None:
         self._selector = selector
         self._closed = False
         self._available_selectors: set[SelectorProvider[Any]] = set()
+        self._leases = SelectorLeases()
 
     def __getitem__(self, selector_type: Callable[..., T]) -> Callable[[], T]:
         return self._create_empty_selector  # type: ignore[return-value]
@@ -234,12 +551,13 @@ class GroupSelector:
             raise DISelectorError("Cannot create selector outside context manager")
 
         selector: SelectorProvider[Any] = SelectorProvider(self._selector)
+        selector.__setgroup__(self._available_selectors, self._leases)
         self._available_selectors.add(selector)
         return selector
 
 
 class SelectorPretender(Pretender, Generic[T]):
-    def __init__(self, selector: str) -> None:
+    def __init__(self, selector: ContextVar[str] | str) -> None:
         self._selector = selector
         self._group_selector: GroupSelector | None = None
 
@@ -269,7 +587,7 @@ class SelectorPretender(Pretender, Generic[T]):
 
 
 class SelectorPretenderBuilder(PretenderBuilder[SelectorProvider]):
-    def __getitem__(self, selector: str) -> SelectorPretender:
+    def __getitem__(self, selector: ContextVar[str] | str) -> SelectorPretender:
         return SelectorPretender(selector)
 
     @property
@@ -0,0 +1,25 @@
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from typing import ParamSpec, TypeVar
+
+from diject.utils.propagate import submit
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+class ContextExecutor(Executor):
+    """Executor running submitted functions within the injection context of the caller.
+
+    Request-scoped objects are shared with the workers instead of being rebuilt, and the context
+    is closed once both the request and the submitted functions are finished.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+        return submit(self._executor, fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, ClassVar
+
+from diject.exceptions import DIProfileError
+
+if TYPE_CHECKING:
+    from diject.providers.provider import Provider
+
+
+class Recorder:
+    """Record aliases of providers resolved during the first requests of an application.
+
+    A request is counted each time an injection context created while recording is closed (e.g.
+    at the end of a call of function decorated with `di.inject`). Recording stops and the profile
+    is saved to the given path when `max_requests` requests are finished, `max_duration` (in
+    seconds) elapses - even if no more requests arrive - or when the recorder is stopped.
+    """
+
+    _ACTIVE: ClassVar["Recorder | None"] = None
+    _ACTIVE_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_requests: int | None = None,
+        max_duration: float | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._max_requests = max_requests
+        self._max_duration = max_duration
+        self._aliases: dict[str, None] = {}
+        self._requests = 0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Recorder":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    @property
+    def aliases(self) -> list[str]:
+        return list(self._aliases)
+
+    @classmethod
+    def get_active(cls) -> "Recorder | None":
+        return cls._ACTIVE
+
+    def start(self) -> None:
+        with self._ACTIVE_LOCK:
+            if Recorder._ACTIVE is not None:
+                raise DIProfileError("Another recorder is already active")
+
+            if self._max_duration is not None:
+                self._timer = threading.Timer(self._max_duration, self.stop)
+                self._timer.daemon = True
+                self._timer.start()
+
+            Recorder._ACTIVE = self
+
+    def stop(self) -> None:
+        with self._ACTIVE_LOCK:
+            if Recorder._ACTIVE is not self:
+                return
+
+            Recorder._ACTIVE = None
+
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.cancel()
+        self._timer = None
+
+        with self._lock:
+            save_profile(self._path, self._aliases)
+
+    def record(self, provider: "Provider") -> None:
+        if (alias := provider.__alias__) and alias not in self._aliases:
+            with self._lock:
+                self._aliases[alias] = None
+
+    def count_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+            requests = self._requests
+
+        if self._max_requests is not None and requests >= self._max_requests:
+            self.stop()
+
+
+def save_profile(path: str | os.PathLike[str], aliases: "dict[str, None] | list[str]") -> None:
+    Path(path).write_text(json.dumps({"providers": list(aliases)}, indent=2))
+
+
+def load_profile(path: str | os.PathLike[str]) -> list[str]:
+    try:
+        data = json.loads(Path(path).read_text())
+        return [str(alias) for alias in data["providers"]]
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise DIProfileError(f"Profile '{path}' cannot be loaded: {exc}") from exc
@@ -0,0 +1,51 @@
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from typing import Any, TypeVar
+
+from diject.exceptions import DIErrorWrapper
+from diject.injector import Injector
+
+T = TypeVar("T")
+
+
+def run_batch(func: Callable[..., T], items: list[Any]) -> list[T]:
+    """Call the function for each item within one new injection context.
+
+    Injected parameters are resolved once and shared by all items of the batch. The function is
+    defined at module level, so it can be sent to worker processes.
+    """
+    with Injector(reuse_context=False):
+        try:
+            values = {name: provider.__provide__() for name, provider in Injector.get_providers(func).items()}
+        except DIErrorWrapper as exc:
+            raise exc.origin from exc.caused_by
+
+        return [func(item, **values) for item in items]
+
+
+def map_batches(
+    executor: Executor,
+    func: Callable[..., T],
+    iterable: Iterable[Any],
+    *,
+    batch_size: int,
+    window: int,
+) -> Iterator[T]:
+    """Yield results of batches run by the executor in order, keeping at most `window` in flight."""
+    items = iter(iterable)
+    pending: deque[Future[list[T]]] = deque()
+
+    try:
+        while True:
+            while len(pending) < window and (batch := list(itertools.islice(items, batch_size))):
+                pending.append(executor.submit(run_batch, func, batch))
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
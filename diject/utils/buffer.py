@@ -0,0 +1,210 @@
+import asyncio
+import functools
+import threading
+import warnings
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from diject.exceptions import DIErrorWrapper
+from diject.utils.context import Context
+from diject.utils.pool import submit_to_pool
+from diject.utils.state import State
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BufferStats:
+    size: int
+    hits: int
+    misses: int
+
+
+@dataclass(eq=False)
+class BufferItem(Generic[T]):
+    state: State[T] | None = None
+    context: Context[T] | None = None
+
+    @property
+    def instance(self) -> T:
+        return self.state.instance  # type: ignore[union-attr]
+
+    def close(self) -> None:
+        if self.state is not None:
+            self.state.close()
+            self.state = None
+
+        if self.context is not None:
+            self.context.close()
+            self.context = None
+
+    async def aclose(self) -> None:
+        if self.state is not None:
+            await self.state.aclose()
+            self.state = None
+
+        if self.context is not None:
+            await self.context.aclose()
+            self.context = None
+
+
+@dataclass(eq=False)
+class _LoopBuffer(Generic[T]):
+    items: deque[BufferItem[T]] = field(default_factory=deque)
+    task: asyncio.Task | None = None
+
+
+class Buffer(Generic[T]):
+    """Bounded buffer of instances created in advance.
+
+    Instances provided synchronously are created by a worker of the shared pool, while instances
+    provided asynchronously are created by a task of the current event loop (each loop has its own
+    instances). Refill starts whenever an instance is taken, so the caller does not wait for it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        create: Callable[[], BufferItem[T]],
+        acreate: Callable[[], Awaitable[BufferItem[T]]],
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("Buffer size has to be a positive integer")
+
+        self._maxsize = maxsize
+        self._create = create
+        self._acreate = acreate
+        self._lock = threading.Lock()
+        self._items: deque[BufferItem[T]] = deque()
+        self._refilling = False
+        self._loop_buffers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBuffer[T]] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Incremented on clear, so instances created meanwhile are closed instead of kept
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def stats(self) -> BufferStats:
+        with self._lock:
+            size = len(self._items) + sum(len(buffer.items) for buffer in self._loop_buffers.values())
+            return BufferStats(size=size, hits=self._hits, misses=self._misses)
+
+    def pop(self) -> BufferItem[T] | None:
+        with self._lock:
+            item = self._items.popleft() if self._items else None
+            self._count(item)
+        self.fill()
+        return item
+
+    async def apop(self) -> BufferItem[T] | None:
+        buffer = self._loop_buffer
+        with self._lock:
+            item = buffer.items.popleft() if buffer.items else None
+            self._count(item)
+        self.afill()
+        return item
+
+    def fill(self) -> None:
+        with self._lock:
+            if self._refilling or len(self._items) >= self._maxsize:
+                return
+            self._refilling = True
+            generation = self._generation
+
+        submit_to_pool(functools.partial(self._refill, generation))
+
+    def afill(self) -> None:
+        buffer = self._loop_buffer
+        with self._lock:
+            if (buffer.task is not None and not buffer.task.done()) or len(buffer.items) >= self._maxsize:
+                return
+            buffer.task = asyncio.get_running_loop().create_task(self._arefill(buffer, self._generation))
+
+    def clear(self) -> list[BufferItem[T]]:
+        """Stop refilling and return instances which were not used."""
+        with self._lock:
+            self._generation += 1
+            items = list(self._items)
+            self._items.clear()
+            for buffer in self._loop_buffers.values():
+                items.extend(buffer.items)
+                buffer.items.clear()
+        return items
+
+    @property
+    def _loop_buffer(self) -> _LoopBuffer[T]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (buffer := self._loop_buffers.get(loop)) is None:
+                buffer = self._loop_buffers[loop] = _LoopBuffer()
+        return buffer
+
+    def _count(self, item: BufferItem[T] | None) -> None:
+        if item is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+
+    def _refill(self, generation: int) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if generation != self._generation or len(self._items) >= self._maxsize:
+                        return
+
+                try:
+                    item = self._create()
+                except Exception as exc:
+                    self._warn(exc)
+                    return
+
+                with self._lock:
+                    if generation == self._generation:
+                        self._items.append(item)
+                        continue
+                item.close()
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    async def _arefill(self, buffer: _LoopBuffer[T], generation: int) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if generation != self._generation or len(buffer.items) >= self._maxsize:
+                        return
+
+                try:
+                    item = await self._acreate()
+                except Exception as exc:
+                    self._warn(exc)
+                    return
+
+                with self._lock:
+                    if generation == self._generation:
+                        buffer.items.append(item)
+                        continue
+                await item.aclose()
+        finally:
+            # Finished task is dropped, so the buffer does not keep its event loop alive
+            with self._lock:
+                buffer.task = None
+
+    @staticmethod
+    def _warn(exc: Exception) -> None:
+        # Provision creates the instance directly when the buffer is empty, so it is not fatal
+        if isinstance(exc, DIErrorWrapper):
+            exc = exc.origin
+        warnings.warn(
+            f"Refill of instance buffer failed with {type(exc).__name__}: {exc}",
+            stacklevel=1,
+        )
@@ -1,20 +1,31 @@
+import functools
+from collections.abc import Callable
 from typing import Any
 
 from diject.providers.provider import Provider
 
 
 def any_as_provider(obj: Any) -> Provider:
+    if isinstance(obj, Provider):
+        return obj
+    return _provider_types().get(type(obj), _object_provider_type())(obj)
+
+
+@functools.cache
+def _provider_types() -> dict[type, Callable[[Any], Provider]]:
     from diject.providers.collections.dict import DictProvider
     from diject.providers.collections.list import ListProvider
     from diject.providers.collections.tuple import TupleProvider
+
+    return {
+        dict: DictProvider,
+        list: ListProvider,
+        tuple: TupleProvider,
+    }
+
+
+@functools.cache
+def _object_provider_type() -> Callable[[Any], Provider]:
     from diject.providers.object import ObjectProvider
 
-    if isinstance(obj, Provider):
-        return obj
-    if (obj_type := type(obj)) is dict:
-        return DictProvider(obj)
-    if obj_type is list:
-        return ListProvider(obj)
-    if obj_type is tuple:
-        return TupleProvider(obj)
-    return ObjectProvider(obj)
+    return ObjectProvider
@@ -1,53 +1,95 @@
 import asyncio
+import threading
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar
+from typing import Any, Generic, Protocol, TypeVar
 
-from diject.providers.provider import Provider
 from diject.utils.state import State
 
 T = TypeVar("T")
+TExit = TypeVar("TExit", bound="ContextExit")
+
+
+# Maximum number of states closed at the same time by an asynchronous context
+CLOSE_LIMIT = 64
+
+
+class ContextExit(Protocol):
+    def close(self) -> None: ...
+
+    async def aclose(self) -> None: ...
 
 
 @dataclass
 class ContextItem(Generic[T]):
     state: State[T] | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
     async_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
-    def close(self) -> None:
-        if self.state is not None:
-            self.state.close()
-            self.state = None
-
-    async def aclose(self) -> None:
-        if self.state is not None:
-            await self.state.aclose()
-            self.state = None
-
 
 @dataclass
-class ContextList(Generic[T]):
-    states: list[State[T]] = field(default_factory=list)
+class ContextLease:
+    value: Any
+    release: Callable[[], None]
 
     def close(self) -> None:
-        for data in self.states:
-            data.close()
-        self.states.clear()
+        self.release()
 
     async def aclose(self) -> None:
-        await asyncio.gather(*(data.aclose() for data in self.states))
-        self.states.clear()
+        self.release()
 
 
 @dataclass
 class Context(Generic[T]):
-    store: dict[Provider, ContextItem[T] | ContextList[T]] = field(default_factory=dict)
-    async_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    store: dict[Hashable, ContextItem[T] | ContextLease] = field(default_factory=dict)
+    # States and leases in order of creation, they are closed in reverse order
+    exits: list[ContextExit] = field(default_factory=list)
+    # Context kept by a provider for its own dependencies instead of being closed by a request
+    detached: bool = False
+    # Temporary context which is never closed, so it cannot hold instances created by generators
+    managed: bool = True
+    # Threads and tasks started by the request which still use the context after it is finished
+    holders: int = 0
+    finished: bool = False
+    # Loop of the request which finished asynchronously, the last holder closes the context in it
+    loop: asyncio.AbstractEventLoop | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def push(self, obj: TExit) -> TExit:
+        self.exits.append(obj)
+        return obj
+
+    def hold(self) -> None:
+        with self.lock:
+            self.holders += 1
+
+    def unhold(self) -> bool:
+        """Release the context by a holder and return whether it has to be closed by the caller."""
+        with self.lock:
+            self.holders -= 1
+            return self.finished and not self.holders
+
+    def finish(self, loop: asyncio.AbstractEventLoop | None = None) -> bool:
+        """Mark the request as finished and return whether it has to be closed by the caller."""
+        with self.lock:
+            self.finished = True
+            self.loop = loop
+            return not self.holders
 
     def close(self) -> None:
-        for data in self.store.values():
-            data.close()
+        while self.exits:
+            self.exits.pop().close()
         self.store.clear()
 
-    async def aclose(self) -> None:
-        await asyncio.gather(*(data.aclose() for data in self.store.values()))
+    async def aclose(self, *, limit: int = CLOSE_LIMIT) -> None:
+        exits = self.exits[::-1]
+        self.exits.clear()
+        slots = asyncio.Semaphore(limit)
+
+        async def close(obj: ContextExit) -> None:
+            async with slots:
+                await obj.aclose()
+
+        # Tasks take slots in order, so states start closing in reverse order of creation
+        await asyncio.gather(*(close(obj) for obj in exits))
         self.store.clear()
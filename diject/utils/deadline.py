@@ -0,0 +1,31 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_DEADLINE: ContextVar[float | None] = ContextVar("DIJECT_DEADLINE", default=None)
+
+
+@contextmanager
+def deadline(timeout: float | None) -> Iterator[None]:
+    """Bound all creations within the block (including nested ones) by the given timeout."""
+    if timeout is None:
+        yield
+        return
+
+    at = time.monotonic() + timeout
+    current = _DEADLINE.get()
+    token = _DEADLINE.set(at if current is None else min(current, at))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def get_timeout(timeout: float | None = None) -> float | None:
+    """Return time left for creation, taking into account the deadline of the current block."""
+    if (at := _DEADLINE.get()) is None:
+        return timeout
+
+    left = max(at - time.monotonic(), 0.0)
+    return left if timeout is None else min(timeout, left)
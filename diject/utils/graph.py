@@ -0,0 +1,74 @@
+import threading
+from collections.abc import Iterable, Iterator
+
+from diject.providers.provider import Provider
+
+_DEPENDENTS: dict[Provider, list[Provider]] | None = None
+_DEPENDENTS_LOCK = threading.Lock()
+
+
+def clear_dependents_index() -> None:
+    global _DEPENDENTS  # noqa: PLW0603
+    with _DEPENDENTS_LOCK:
+        _DEPENDENTS = None
+
+
+def get_dependents_index() -> dict[Provider, list[Provider]]:
+    """Return index of providers defined in all containers to their direct dependents.
+
+    The index is built on first use and cleared whenever a new container is defined.
+    """
+    global _DEPENDENTS  # noqa: PLW0603
+    with _DEPENDENTS_LOCK:
+        if _DEPENDENTS is None:
+            _DEPENDENTS = _build_dependents_index()
+        return _DEPENDENTS
+
+
+def get_transitive_dependents(providers: Iterable[Provider]) -> list[Provider]:
+    """Return all providers depending (directly or not) on given providers.
+
+    Dependents are ordered so that each provider is placed before providers it depends on.
+    """
+    index = get_dependents_index()
+    roots = set(providers)
+    visited: set[Provider] = set()
+    ordered: list[Provider] = []
+
+    for root in roots:
+        stack: list[tuple[Provider, Iterator[Provider]]] = [(root, iter(index.get(root, ())))]
+        while stack:
+            provider, dependents = stack[-1]
+            for dependent in dependents:
+                if dependent not in visited and dependent not in roots:
+                    visited.add(dependent)
+                    stack.append((dependent, iter(index.get(dependent, ()))))
+                    break
+            else:
+                stack.pop()
+                if provider is not root:
+                    ordered.append(provider)
+
+    return ordered
+
+
+def _build_dependents_index() -> dict[Provider, list[Provider]]:
+    from diject.container import Container
+
+    index: dict[Provider, list[Provider]] = {}
+    cache: set[Provider] = set()
+
+    containers = [Container]
+    while containers:
+        container = containers.pop()
+        containers.extend(container.__subclasses__())
+
+        for _, provider in container.travers(recursive=True):
+            if provider in cache:
+                continue
+            cache.add(provider)
+
+            for _, dependency in provider.__travers__():
+                index.setdefault(dependency, []).append(provider)
+
+    return index
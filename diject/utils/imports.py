@@ -0,0 +1,18 @@
+import importlib
+from typing import Any
+
+
+def import_object(path: str) -> Any:
+    """Import object by its path, e.g. 'package.module:Class' or 'package.module.Class'."""
+    if ":" in path:
+        module_name, _, qualname = path.partition(":")
+    else:
+        module_name, _, qualname = path.rpartition(".")
+
+    if not module_name or not qualname:
+        raise ImportError(f"Invalid import path '{path}'")
+
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
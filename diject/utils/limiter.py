@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from types import TracebackType
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    waiting: int
+    max_waiting: int
+    acquired: int
+    wait_time: float
+
+
+class Limiter:
+    """Limit the number of concurrent creations.
+
+    Threads share one semaphore, while coroutines are limited by a semaphore of their event loop,
+    so waiting for a slot never blocks the loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("Limit has to be a positive integer")
+
+        self._limit = limit
+        self._thread_semaphore = threading.BoundedSemaphore(limit)
+        self._loop_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats_lock = threading.Lock()
+        self._waiting = 0
+        self._max_waiting = 0
+        self._acquired = 0
+        self._wait_time = 0.0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def stats(self) -> LimiterStats:
+        with self._stats_lock:
+            return LimiterStats(
+                waiting=self._waiting,
+                max_waiting=self._max_waiting,
+                acquired=self._acquired,
+                wait_time=self._wait_time,
+            )
+
+    @property
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._stats_lock:
+            if (semaphore := self._loop_semaphores.get(loop)) is None:
+                # Semaphore which was waited for references its loop, so closed loops are dropped
+                for closed in [loop for loop in self._loop_semaphores if loop.is_closed()]:
+                    del self._loop_semaphores[closed]
+                semaphore = self._loop_semaphores[loop] = asyncio.Semaphore(self._limit)
+        return semaphore
+
+    def __enter__(self) -> None:
+        started = self._start_waiting()
+        self._thread_semaphore.acquire()
+        self._stop_waiting(started)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._thread_semaphore.release()
+
+    async def __aenter__(self) -> None:
+        started = self._start_waiting()
+        try:
+            await self._async_semaphore.acquire()
+        finally:
+            self._stop_waiting(started)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._async_semaphore.release()
+
+    def _start_waiting(self) -> float:
+        with self._stats_lock:
+            self._waiting += 1
+            self._max_waiting = max(self._max_waiting, self._waiting)
+        return time.perf_counter()
+
+    def _stop_waiting(self, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._waiting -= 1
+            self._acquired += 1
+            self._wait_time += elapsed
@@ -4,15 +4,22 @@ from types import TracebackType
 
 
 class Lock:
+    _INIT_LOCK = threading.Lock()
+
     def __init__(self) -> None:
         self._thread_lock = threading.Lock()
-        self._thread_data = threading.local()
+        self._thread_data: threading.local | None = None
 
     @property
     def _async_lock(self) -> asyncio.Lock:
+        if self._thread_data is None:
+            with self._INIT_LOCK:
+                if self._thread_data is None:
+                    self._thread_data = threading.local()
+
         if not hasattr(self._thread_data, "async_lock"):
             self._thread_data.async_lock = asyncio.Lock()
-        return self._thread_data.async_lock
+        return self._thread_data.async_lock  # type: ignore[no-any-return]
 
     def __enter__(self) -> None:
         self.acquire()
@@ -0,0 +1,101 @@
+import concurrent.futures
+import contextvars
+import functools
+import os
+import threading
+from collections.abc import Callable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Number of workers of the shared pool
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_WORKER = threading.local()
+
+
+@functools.cache
+def get_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the thread pool shared by parallel resolution of dependencies."""
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=MAX_WORKERS,
+        thread_name_prefix="diject-worker",
+    )
+
+
+def submit_to_pool(func: Callable[[], T]) -> "concurrent.futures.Future[T]":
+    """Run a function on the shared pool as its worker, so its parallel resolution is sequential."""
+    return get_pool().submit(_run_in_worker, func)
+
+
+def run_parallel(funcs: Sequence[Callable[[], T]], *, limit: int | None = None) -> list[T]:
+    """Run functions on the shared pool and return their results in order.
+
+    Each function runs with a copy of the current context, so it shares the injection context of
+    the caller. The calling thread runs functions as well and workers of the pool help it, so all
+    functions are run even if no worker is free (e.g. all of them wait for a lock held by the
+    caller). At most `limit` functions run at once, including the one run by the caller. Functions
+    called from a worker of the pool are run sequentially, so nested parallel resolution does not
+    flood the pool. Once a function fails, functions not started yet are skipped and the first
+    error is raised after the started ones are finished.
+    """
+    if len(funcs) < 2 or getattr(_WORKER, "active", False):
+        return [func() for func in funcs]
+
+    return _ParallelRun(funcs).run(min(len(funcs), limit or len(funcs)))
+
+
+class _ParallelRun(Generic[T]):
+    def __init__(self, funcs: Sequence[Callable[[], T]]) -> None:
+        self._funcs = funcs
+        self._contexts = [contextvars.copy_context() for _ in funcs]
+        self._results: list[T | None] = [None] * len(funcs)
+        self._error: BaseException | None = None
+        self._next = 0
+        self._running = 0
+        self._finished = threading.Condition()
+
+    def run(self, concurrency: int) -> list[T]:
+        # Workers which are not started before the caller takes all functions have nothing to do
+        helpers = [submit_to_pool(self._work) for _ in range(concurrency - 1)]
+        self._work()
+
+        with self._finished:
+            self._finished.wait_for(lambda: not self._running)
+
+        for helper in helpers:
+            helper.cancel()
+
+        if self._error is not None:
+            raise self._error
+
+        return self._results  # type: ignore[return-value]
+
+    def _work(self) -> None:
+        while True:
+            with self._finished:
+                if self._error is not None or self._next == len(self._funcs):
+                    return
+                index = self._next
+                self._next += 1
+                self._running += 1
+
+            try:
+                self._results[index] = self._contexts[index].run(self._funcs[index])
+            except BaseException as exc:
+                with self._finished:
+                    if self._error is None:
+                        self._error = exc
+            finally:
+                with self._finished:
+                    self._running -= 1
+                    if not self._running:
+                        self._finished.notify_all()
+
+
+def _run_in_worker(func: Callable[[], T]) -> T:
+    _WORKER.active = True
+    try:
+        return func()
+    finally:
+        _WORKER.active = False
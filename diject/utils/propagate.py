@@ -0,0 +1,55 @@
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Executor, Future
+from typing import Any, ParamSpec, TypeVar
+
+from diject.injector import Injector
+from diject.utils.context import Context
+from diject.utils.teardown import get_teardown
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+def submit(executor: Executor, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+    """Submit a function to the executor, running it within the current injection context."""
+    context = _hold()
+    try:
+        run = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        future = executor.submit(run)
+    except BaseException:
+        _release(context)
+        raise
+
+    # Released also when the future is cancelled before it starts
+    future.add_done_callback(lambda _: _release(context))
+    return future
+
+
+def create_task(coro: Coroutine[Any, Any, T], *, name: str | None = None) -> asyncio.Task[T]:
+    """Create a task running within the current injection context."""
+    context = _hold()
+    try:
+        task = asyncio.create_task(coro, name=name)
+    except BaseException:
+        _release(context)
+        raise
+
+    task.add_done_callback(lambda _: _release(context))
+    return task
+
+
+def _hold() -> Context | None:
+    context = Injector.get_context()
+    if context is None or context.detached:
+        # Detached context is never closed by a request, so it does not have to be held
+        return None
+    context.hold()
+    return context
+
+
+def _release(context: Context | None) -> None:
+    if context is not None and context.unhold():
+        get_teardown().submit_released(context)
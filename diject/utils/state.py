@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import warnings
 from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
@@ -73,3 +74,48 @@ class State(Generic[T]):
                         f"generator should yield only once",
                         stacklevel=1,
                     )
+
+
+class SharedState(Generic[T]):
+    """State shared by a fixed number of owners, it is closed when the last owner closes it."""
+
+    def __init__(self, state: State[T], owners: int) -> None:
+        self._state = state
+        self._owners = owners
+        self._lock = threading.Lock()
+
+    @property
+    def instance(self) -> T:
+        return self._state.instance
+
+    async def acquire(self) -> State[T]:
+        """Return state of one owner, closing it releases the shared state."""
+        match self._state.object:
+            case AsyncIterator():
+                async_lease = self._alease()
+                return State(object=async_lease, instance=await anext(async_lease))
+            case Iterator():
+                lease = self._lease()
+                return State(object=lease, instance=next(lease))
+            case _:
+                self._release()
+                return State(object=self._state.object, instance=self._state.instance)
+
+    async def arelease(self) -> None:
+        """Release ownership without acquiring the state."""
+        if self._release():
+            await self._state.aclose()
+
+    def _lease(self) -> Iterator[T]:
+        yield self._state.instance
+        if self._release():
+            self._state.close()
+
+    async def _alease(self) -> AsyncIterator[T]:
+        yield self._state.instance
+        await self.arelease()
+
+    def _release(self) -> bool:
+        with self._lock:
+            self._owners -= 1
+            return self._owners == 0
@@ -0,0 +1,103 @@
+import asyncio
+import builtins
+from collections.abc import Coroutine, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+if TYPE_CHECKING:
+    from diject.providers.provider import Provider
+
+T = TypeVar("T")
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+T3 = TypeVar("T3")
+
+
+@overload
+async def gather(
+    coro1: Coroutine[Any, Any, T1],
+    coro2: Coroutine[Any, Any, T2],
+    /,
+) -> tuple[T1, T2]:
+    pass
+
+
+@overload
+async def gather(
+    coro1: Coroutine[Any, Any, T1],
+    coro2: Coroutine[Any, Any, T2],
+    coro3: Coroutine[Any, Any, T3],
+    /,
+) -> tuple[T1, T2, T3]:
+    pass
+
+
+@overload
+async def gather(*coros: Coroutine[Any, Any, T]) -> tuple[T, ...]:
+    pass
+
+
+async def gather(*coros: Coroutine[Any, Any, Any]) -> tuple[Any, ...]:
+    """Run coroutines concurrently and return their results in order.
+
+    Unlike `asyncio.gather`, the remaining coroutines are cancelled (and awaited) as soon as one
+    of them fails, so none of them is left running in the background. The first error is raised
+    as is, instead of an exception group.
+    """
+    if len(coros) == 1:
+        return (await coros[0],)
+
+    error: BaseException | None = None
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except builtins.BaseExceptionGroup as exc_group:
+        error = _get_first_error(exc_group)
+
+    # Raised outside of `except` block, so the group is not attached as context of the error
+    if error is not None:
+        raise error
+
+    return tuple(task.result() for task in tasks)
+
+
+async def aprovide_all(
+    providers: Iterable["Provider[Any]"],
+    *,
+    limit: int | None = None,
+) -> list[Any]:
+    """Provide values of the providers concurrently and return them in order.
+
+    Values available without waiting (constants, started singletons) are taken inline, and only
+    providers which really have to wait are gathered, so no task is created for the others. At most
+    `limit` providers are resolved at once, if given.
+    """
+    values: list[Any] = []
+    pending: dict[int, Provider[Any]] = {}
+    for index, provider in enumerate(providers):
+        if (value := provider.__provide_nowait__()) is ...:
+            pending[index] = provider
+        values.append(value)
+
+    if pending:
+        if limit is None or len(pending) <= limit:
+            results = await gather(*(provider.__aprovide__() for provider in pending.values()))
+        else:
+            semaphore = asyncio.Semaphore(limit)
+            results = await gather(
+                *(_aprovide_bounded(provider, semaphore) for provider in pending.values()),
+            )
+        for index, value in zip(pending, results, strict=True):
+            values[index] = value
+
+    return values
+
+
+async def _aprovide_bounded(provider: "Provider[T]", semaphore: asyncio.Semaphore) -> T:
+    async with semaphore:
+        return await provider.__aprovide__()
+
+
+def _get_first_error(exc: BaseException) -> BaseException:
+    while isinstance(exc, builtins.BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return exc
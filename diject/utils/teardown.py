@@ -0,0 +1,145 @@
+import asyncio
+import atexit
+import contextlib
+import functools
+import queue
+import threading
+import warnings
+from dataclasses import dataclass, field
+
+from diject.utils.context import Context
+
+MAX_PENDING = 1024
+
+
+@dataclass
+class _LoopPending:
+    loop: asyncio.AbstractEventLoop
+    slots: asyncio.Semaphore
+    tasks: set[asyncio.Task] = field(default_factory=set)
+
+
+class Teardown:
+    """Close contexts in the background, off the critical path of requests.
+
+    Contexts closed synchronously are queued for a worker thread, while contexts closed
+    asynchronously are closed by tasks of the current event loop. At most `maxsize` contexts are
+    pending in the queue and in each loop; further submissions wait for a free slot.
+    """
+
+    def __init__(self, maxsize: int = MAX_PENDING) -> None:
+        if maxsize < 1:
+            raise ValueError("Max size has to be a positive integer")
+
+        self._maxsize = maxsize
+        self._queue: queue.Queue[Context] = queue.Queue(maxsize)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._thread_data = threading.local()
+
+    def submit(self, context: Context) -> None:
+        self._start_thread()
+        self._queue.put(context)
+
+    async def asubmit(self, context: Context) -> None:
+        pending = self._loop_pending
+        await pending.slots.acquire()
+        self._start_task(pending, context)
+
+    def submit_released(self, context: Context) -> None:
+        """Close a context released by the last thread or task using it.
+
+        A context of a request finished asynchronously is closed in the event loop of the request
+        (or in the current one), so states created by asynchronous generators can be closed.
+        """
+        running = None
+        with contextlib.suppress(RuntimeError):
+            running = asyncio.get_running_loop()
+
+        loop = context.loop or running
+        if loop is None or loop.is_closed():
+            self.submit(context)
+        elif loop is running:
+            # Released by a callback of the loop, which cannot wait for a free slot
+            pending = self._loop_pending
+            self._start_task(pending, context, slot=False)
+        else:
+            asyncio.run_coroutine_threadsafe(self.asubmit(context), loop)
+
+    def flush(self) -> None:
+        """Wait until all contexts queued for the worker thread are closed."""
+        self._queue.join()
+
+    async def aflush(self) -> None:
+        """Wait until all contexts of the current event loop and the worker thread are closed."""
+        pending = self._loop_pending
+        while pending.tasks:
+            await asyncio.wait(set(pending.tasks))
+
+        if self._queue.unfinished_tasks:
+            await asyncio.to_thread(self.flush)
+
+    def _start_task(self, pending: _LoopPending, context: Context, *, slot: bool = True) -> None:
+        task = pending.loop.create_task(self._aclose(context))
+        pending.tasks.add(task)
+
+        def on_done(task: asyncio.Task) -> None:
+            pending.tasks.discard(task)
+            if slot:
+                pending.slots.release()
+
+        task.add_done_callback(on_done)
+
+    @property
+    def _loop_pending(self) -> _LoopPending:
+        loop = asyncio.get_running_loop()
+        pending: _LoopPending | None = getattr(self._thread_data, "pending", None)
+        if pending is None or pending.loop is not loop:
+            # Only the loop running in this thread is kept, so closed loops are not held
+            pending = _LoopPending(loop=loop, slots=asyncio.Semaphore(self._maxsize))
+            self._thread_data.pending = pending
+        return pending
+
+    def _start_thread(self) -> None:
+        if self._thread is not None:
+            return
+
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="diject-teardown",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            context = self._queue.get()
+            try:
+                context.close()
+            except Exception as exc:
+                warnings.warn(
+                    f"Deferred teardown of a context failed with {type(exc).__name__}: {exc}",
+                    stacklevel=1,
+                )
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    async def _aclose(context: Context) -> None:
+        try:
+            await context.aclose()
+        except Exception as exc:
+            warnings.warn(
+                f"Deferred teardown of a context failed with {type(exc).__name__}: {exc}",
+                stacklevel=1,
+            )
+
+
+@functools.cache
+def get_teardown() -> Teardown:
+    """Return the teardown shared by injectors closing their contexts in the background."""
+    teardown = Teardown()
+    atexit.register(teardown.flush)
+    return teardown
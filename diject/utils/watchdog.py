@@ -0,0 +1,79 @@
+import concurrent.futures
+import functools
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Time (in seconds) after which an idle watchdog thread exits
+IDLE_TIMEOUT = 60.0
+
+_Task = tuple["concurrent.futures.Future[Any]", Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+class Watchdog:
+    """Run blocking functions on reusable daemon threads, so the caller can stop waiting for them.
+
+    A new thread is started only when no thread is idle, so functions which never return do not
+    delay other ones (as they would in a bounded pool). Threads idle for `idle_timeout` seconds exit.
+    """
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT) -> None:
+        self._idle_timeout = idle_timeout
+        self._queue: queue.SimpleQueue[_Task] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+
+    def submit(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> "concurrent.futures.Future[T]":
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+        with self._lock:
+            start = not self._idle
+            if not start:
+                # Idle thread is reserved for this function
+                self._idle -= 1
+
+        self._queue.put((future, func, args, kwargs))
+        if start:
+            threading.Thread(target=self._run, name="diject-watchdog", daemon=True).start()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            try:
+                future, func, args, kwargs = self._queue.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    # Thread exits only if it is not reserved by a function being submitted
+                    if self._idle:
+                        self._idle -= 1
+                        return
+                continue
+
+            if not future.set_running_or_notify_cancel():
+                self._set_idle()
+                continue
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                # Thread is idle before the caller is notified, so sequential calls reuse it
+                self._set_idle()
+                future.set_exception(exc)
+            else:
+                self._set_idle()
+                future.set_result(result)
+            finally:
+                del future, func, args, kwargs
+
+    def _set_idle(self) -> None:
+        with self._lock:
+            self._idle += 1
+
+
+@functools.cache
+def get_watchdog() -> Watchdog:
+    """Return the watchdog shared by creations bounded by a timeout."""
+    return Watchdog()
@@ -0,0 +1,30 @@
+from collections import OrderedDict
+from fractions import Fraction
+
+import pytest
+
+import diject as di
+
+
+def test_creator_provider__lazy_callable() -> None:
+    provider = di.Transient["collections:OrderedDict"](a=1)
+
+    actual = di.provide(provider)
+
+    assert isinstance(actual, OrderedDict)
+    assert actual == {"a": 1}
+
+
+def test_creator_provider__lazy_callable_dotted_path() -> None:
+    provider = di.Singleton["fractions.Fraction"](1, 2)
+
+    actual = di.provide(provider)
+
+    assert actual == Fraction(1, 2)
+
+
+def test_creator_provider__lazy_callable_invalid_path() -> None:
+    provider = di.Transient["not_existing_module:Class"]()
+
+    with pytest.raises(ModuleNotFoundError):
+        di.provide(provider)
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+import diject as di
+from diject.exceptions import DIContextError, DITimeoutError
+from diject.providers.provider import Provider
+
+
+def test_keyed_provider__one_instance_per_key() -> None:
+    provider = di.Keyed[lambda tenant: Mock(tenant=tenant)]()
+
+    a1 = di.provide_keyed(provider, "a")
+    a2 = di.provide_keyed(provider, "a")
+    b = di.provide_keyed(provider, "b")
+
+    assert a1 is a2
+    assert a1 is not b
+    assert b.tenant == "b"
+
+
+def test_keyed_provider__key_from_context_var() -> None:
+    tenant_var: ContextVar[str] = ContextVar("tenant")
+    provider = di.Keyed(key=tenant_var)[lambda tenant: Mock(tenant=tenant)]()
+
+    with pytest.raises(DIContextError):
+        di.provide(provider)
+
+    tenant_var.set("a")
+
+    assert di.provide(provider).tenant == "a"
+
+
+def test_keyed_provider__key_from_provider() -> None:
+    tenant = di.Object("a")
+    provider = di.Keyed(key=tenant)[lambda tenant: Mock(tenant=tenant)]()
+
+    assert di.provide(provider).tenant == "a"
+    assert [p for _, p in di.travers(provider, types=Provider)] == [tenant]
+
+
+def test_keyed_provider__evict_least_recently_used() -> None:
+    closed: list[str] = []
+
+    def create_client(tenant: str) -> Iterator[str]:
+        yield tenant
+        closed.append(tenant)
+
+    provider: Any = di.Keyed(maxsize=2)[create_client]()
+
+    di.provide_keyed(provider, "a")
+    di.provide_keyed(provider, "b")
+    di.provide_keyed(provider, "a")
+    di.provide_keyed(provider, "c")
+
+    assert closed == ["b"]
+    assert provider.__keys__ == ["a", "c"]
+
+    di.shutdown(provider)
+
+    assert sorted(closed) == ["a", "b", "c"]
+
+
+async def test_keyed_provider__evict_expired() -> None:
+    closed: list[str] = []
+
+    async def create_client(tenant: str) -> AsyncIterator[str]:
+        yield tenant
+        closed.append(tenant)
+
+    provider: Any = di.Keyed(ttl=0.01)[create_client]()
+
+    await di.aprovide_keyed(provider, "a")
+    await asyncio.sleep(0.02)
+    await di.aprovide_keyed(provider, "b")
+
+    assert closed == ["a"]
+    assert provider.__keys__ == ["b"]
+
+    await di.ashutdown(provider)
+
+
+def test_keyed_provider__evict_idle_without_lookups() -> None:
+    closed = threading.Event()
+
+    def create_client(tenant: str) -> Iterator[str]:
+        yield tenant
+        closed.set()
+
+    provider: Any = di.Keyed(ttl=0.01)[create_client]()
+
+    di.provide_keyed(provider, "a")
+
+    # Idle instance is closed by the sweeper, no further lookup is needed
+    assert closed.wait(5)
+    assert provider.__keys__ == []
+
+
+async def test_keyed_provider__evict_idle_async_within_loop() -> None:
+    closed = asyncio.Event()
+
+    async def create_client(tenant: str) -> AsyncIterator[str]:
+        yield tenant
+        closed.set()
+
+    provider: Any = di.Keyed(ttl=0.01)[create_client]()
+
+    await di.aprovide_keyed(provider, "a")
+
+    await asyncio.wait_for(closed.wait(), timeout=5)
+    assert provider.__keys__ == []
+
+
+def test_keyed_provider__timeout() -> None:
+    release = threading.Event()
+    provider: Any = di.Keyed[lambda _, wait: release.wait(wait)](5)
+
+    try:
+        with pytest.raises(DITimeoutError):
+            di.provide_keyed(provider, "a", timeout=0.01)
+    finally:
+        release.set()
+
+
+def test_keyed_provider__coalesce_concurrent_creation() -> None:
+    calls: list[str] = []
+
+    def create_client(tenant: str) -> str:
+        calls.append(tenant)
+        time.sleep(0.01)
+        return tenant
+
+    provider = di.Keyed[create_client]()
+
+    threads = [
+        threading.Thread(target=lambda: di.provide_keyed(provider, "a")) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["a"]
+
+
+def test_keyed_provider__close_item_created_during_eviction() -> None:
+    closed: list[str] = []
+    creating = threading.Event()
+
+    def create_client(tenant: str) -> Iterator[str]:
+        if tenant == "a":
+            creating.set()
+            time.sleep(0.05)
+        yield tenant
+        closed.append(tenant)
+
+    provider: Any = di.Keyed(maxsize=1)[create_client]()
+
+    thread = threading.Thread(target=lambda: di.provide_keyed(provider, "a"))
+    thread.start()
+    creating.wait()
+    di.provide_keyed(provider, "b")
+    thread.join()
+
+    di.shutdown(provider)
+
+    assert sorted(closed) == ["a", "b"]
@@ -0,0 +1,137 @@
+import asyncio
+import gc
+import weakref
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+import diject as di
+from diject.exceptions import DIAsyncError
+
+
+def test_loop_local_provider__one_instance_per_loop() -> None:
+    closed: list[object] = []
+
+    async def create_session() -> AsyncIterator[object]:
+        session = object()
+        try:
+            yield session
+        finally:
+            # Loop may finalize the generator before the provider closes it
+            closed.append(session)
+
+    provider = di.LoopLocal[create_session]()
+
+    async def main() -> tuple[object, object]:
+        return await di.aprovide(provider), await di.aprovide(provider)
+
+    first1, first2 = asyncio.run(main())
+    second1, _ = asyncio.run(main())
+
+    assert first1 is first2
+    assert first1 is not second1
+    assert closed == [first1, second1]
+
+
+async def test_loop_local_provider__ashutdown() -> None:
+    closed: list[object] = []
+
+    async def create_session() -> AsyncIterator[object]:
+        session = object()
+        yield session
+        closed.append(session)
+
+    provider = di.LoopLocal[create_session]()
+
+    session = await di.aprovide(provider)
+    await di.ashutdown(provider)
+
+    assert closed == [session]
+    assert await di.aprovide(provider) is not session
+
+
+def test_loop_local_provider__without_running_loop() -> None:
+    provider = di.LoopLocal[object]()
+
+    with pytest.raises(DIAsyncError):
+        di.provide(provider)
+
+
+def test_loop_local_provider__close_sync_instance_on_loop_shutdown() -> None:
+    closed: list[object] = []
+
+    def create_session() -> Iterator[object]:
+        session = object()
+        yield session
+        closed.append(session)
+
+    provider = di.LoopLocal[create_session]()
+
+    async def main() -> object:
+        session = await di.aprovide(provider)
+        # No task is left behind by the provider
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        return session
+
+    session = asyncio.run(main())
+
+    assert closed == [session]
+
+
+def test_loop_local_provider__shutdown_async_instances_synchronously() -> None:
+    closed: list[object] = []
+
+    async def create_session() -> AsyncIterator[object]:
+        session = object()
+        try:
+            yield session
+        finally:
+            closed.append(session)
+
+    provider = di.LoopLocal[create_session]()
+
+    stopped = asyncio.new_event_loop()
+    stopped_session = stopped.run_until_complete(di.aprovide(provider))
+
+    async def main() -> None:
+        session = await di.aprovide(provider)
+
+        # Neither instance can be closed synchronously, both of them are released anyway
+        with pytest.warns(UserWarning) as record:
+            di.shutdown(provider)
+
+        assert len(record) == 2
+        await asyncio.sleep(0)
+        assert closed == [session]
+        assert await di.aprovide(provider) is not session
+        await di.ashutdown(provider)
+
+    asyncio.run(main())
+
+    stopped.run_until_complete(stopped.shutdown_asyncgens())
+    stopped.close()
+
+    assert closed[-1] is stopped_session
+
+
+def test_loop_local_provider__release_closed_loop(caplog: pytest.LogCaptureFixture) -> None:
+    closed: list[object] = []
+
+    def create_session() -> Iterator[object]:
+        session = object()
+        yield session
+        closed.append(session)
+
+    provider = di.LoopLocal[create_session]()
+
+    loop = asyncio.new_event_loop()
+    session = loop.run_until_complete(di.aprovide(provider))
+    loop.close()
+
+    loop_ref = weakref.ref(loop)
+    del loop
+    gc.collect()
+
+    assert loop_ref() is None
+    assert closed == [session]
+    assert "destroyed" not in caplog.text
@@ -1,8 +1,15 @@
-from collections.abc import Iterator
+import asyncio
+import contextlib
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from typing import Any
 from unittest.mock import Mock
 
+import pytest
+
 import diject as di
 from diject import ScopedProvider
+from diject.utils.pool import MAX_WORKERS, get_pool
 
 
 class MockClass:
@@ -51,3 +58,180 @@ def test_scoped_provider__check_generators() -> None:
         service.assert_called_with("start")
 
     service.assert_called_with("shutdown")
+
+
+async def test_scoped_provider__coalesce_across_requests() -> None:
+    events: list[str] = []
+
+    async def create_client() -> AsyncIterator[Mock]:
+        await asyncio.sleep(0.01)
+        yield Mock()
+        events.append("closed")
+
+    provider: Any = di.Scoped(coalesce=True)[create_client]()
+
+    async def request(delay: float) -> Mock:
+        async with di.inject():
+            client = await di.aprovide(provider)
+            await asyncio.sleep(delay)
+            events.append("used")
+            return client
+
+    first, second = await asyncio.gather(request(0), request(0.05))
+
+    assert first is second
+    assert events == ["used", "used", "closed"]
+
+
+def test_scoped_provider__parallel_arguments() -> None:
+    created: list[str] = []
+    # Every creation waits for the others, so sequential resolution would break the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def create_client(name: str) -> str:
+        created.append(name)
+        barrier.wait()
+        return threading.current_thread().name
+
+    client: Any = di.Scoped[create_client](name="client")
+    provider: Any = di.Transient(parallel=True)[lambda *args, **kwargs: (args, kwargs)](
+        client,
+        di.Transient[create_client](name="a"),
+        b=client,
+        c=di.Transient[create_client](name="c"),
+    )
+
+    with di.inject():
+        args, kwargs = di.provide(provider)
+
+    assert args[0] == kwargs["b"]
+    assert len({args[0], args[1], kwargs["c"]}) == 3
+    assert sorted(created) == ["a", "c", "client"]
+
+
+def test_scoped_provider__parallel_arguments_with_busy_pool() -> None:
+    release = threading.Event()
+    # Workers are busy (e.g. waiting for a lock held by the caller), so the caller runs everything
+    busy = [get_pool().submit(release.wait, 5) for _ in range(MAX_WORKERS)]
+
+    provider: Any = di.Transient(parallel=True)[lambda *args: args](
+        di.Scoped[threading.get_ident](),
+        di.Transient[threading.get_ident](),
+    )
+
+    try:
+        with di.inject():
+            assert di.provide(provider) == (threading.get_ident(), threading.get_ident())
+    finally:
+        release.set()
+        for future in busy:
+            future.result()
+
+
+def test_scoped_provider__parallel_injection() -> None:
+    @di.inject(parallel=True)
+    def handler(
+        first: str = MockContainer.scoped1.value,
+        second: str = MockContainer.scoped2.value,
+        same: str = MockContainer.scoped1.value,
+    ) -> tuple[str, str, str]:
+        return first, second, same
+
+    assert handler() == ("scoped1", "scoped2", "scoped1")
+
+
+def test_scoped_provider__nested_scope_per_generator_items() -> None:
+    events: list[str] = []
+
+    def create_session() -> Iterator[int]:
+        events.append("opened")
+        yield len(events)
+        events.append("closed")
+
+    provider: Any = di.Scoped[create_session]()
+
+    @di.inject(scope_items=2)
+    def stream() -> Iterator[int]:
+        for _ in range(5):
+            yield di.provide(provider)
+
+    sessions = []
+    for session in stream():
+        sessions.append(session)
+        assert events.count("opened") - events.count("closed") == 1
+
+    assert len(set(sessions)) == 3
+    assert sessions[0] == sessions[1] != sessions[2] == sessions[3] != sessions[4]
+    assert events.count("closed") == 3
+
+
+async def test_scoped_provider__nested_scope_per_async_generator_item() -> None:
+    events: list[str] = []
+
+    async def create_session() -> AsyncIterator[int]:
+        events.append("opened")
+        yield len(events)
+        events.append("closed")
+
+    provider: Any = di.Scoped[create_session]()
+
+    @di.inject(scope_items=1)
+    async def stream() -> AsyncGenerator[int, None]:
+        while True:
+            yield await di.aprovide(provider)
+
+    sessions = []
+    async with contextlib.aclosing(stream()) as sessions_stream:
+        async for session in sessions_stream:
+            sessions.append(session)
+            if len(sessions) == 3:
+                break
+
+    assert len(set(sessions)) == 3
+    assert events.count("closed") == 3
+
+
+def test_scoped_provider__nested_scope_forwards_send_and_throw() -> None:
+    provider: Any = di.Scoped[object]()
+
+    @di.inject(scope_items=1)
+    def stream() -> Generator[object, int, str]:
+        sent = yield di.provide(provider)
+        try:
+            yield di.provide(provider)
+        except ValueError:
+            yield di.provide(provider)
+        return f"sent={sent}"
+
+    generator = stream()
+    first = next(generator)
+    second = generator.send(4)
+    third = generator.throw(ValueError())
+    with pytest.raises(StopIteration) as exc_info:
+        next(generator)
+
+    assert len({id(first), id(second), id(third)}) == 3
+    assert exc_info.value.value == "sent=4"
+
+
+async def test_scoped_provider__nested_scope_forwards_asend_and_athrow() -> None:
+    provider: Any = di.Scoped[object]()
+    received: list[object] = []
+
+    @di.inject(scope_items=1)
+    async def stream() -> AsyncGenerator[object, int]:
+        received.append((yield await di.aprovide(provider)))
+        try:
+            yield await di.aprovide(provider)
+        except ValueError as exc:
+            received.append(exc)
+            yield await di.aprovide(provider)
+
+    async with contextlib.aclosing(stream()) as generator:
+        first = await anext(generator)
+        second = await generator.asend(4)
+        error = ValueError()
+        third = await generator.athrow(error)
+
+    assert len({id(first), id(second), id(third)}) == 3
+    assert received == [4, error]
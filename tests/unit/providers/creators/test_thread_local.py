@@ -0,0 +1,64 @@
+import gc
+import threading
+from collections.abc import Callable, Iterator
+from unittest.mock import Mock
+
+import diject as di
+from diject.providers.creators.thread_local import ThreadLocalProvider, ThreadLocalStats
+
+
+def _run_in_thread(func: Callable[[], None]) -> None:
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+def test_thread_local_provider__one_instance_per_thread() -> None:
+    provider = di.ThreadLocal[lambda: Mock()]()
+    instances: list[Mock] = []
+
+    _run_in_thread(lambda: instances.extend([di.provide(provider), di.provide(provider)]))
+    instances.append(di.provide(provider))
+
+    assert instances[0] is instances[1]
+    assert instances[0] is not instances[2]
+    assert provider.__stats__ == ThreadLocalStats(live=2, created=2, closed=0)
+
+
+def test_thread_local_provider__shutdown_all_threads() -> None:
+    closed: list[int] = []
+
+    def create_cursor() -> Iterator[int]:
+        ident = threading.get_ident()
+        yield ident
+        closed.append(ident)
+
+    provider = di.ThreadLocal[create_cursor]()
+    idents: list[int] = []
+
+    _run_in_thread(lambda: idents.append(di.provide(provider)))
+    idents.append(di.provide(provider))
+
+    di.shutdown(provider)
+
+    assert sorted(closed) == sorted(idents)
+    assert provider.__stats__ == ThreadLocalStats(live=0, created=2, closed=2)  # type: ignore[attr-defined]
+    assert di.provide(provider) == threading.get_ident()
+
+
+def test_thread_local_provider__close_on_thread_exit() -> None:
+    closed: list[int] = []
+
+    def create_cursor() -> Iterator[int]:
+        ident = threading.get_ident()
+        yield ident
+        closed.append(ident)
+
+    provider = di.ThreadLocal(close_on_thread_exit=True)[create_cursor]()
+    assert isinstance(provider, ThreadLocalProvider)
+
+    _run_in_thread(lambda: di.provide(provider))
+    gc.collect()
+
+    assert len(closed) == 1
+    assert provider.__stats__ == ThreadLocalStats(live=0, created=1, closed=1)
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+import diject as di
+from diject.exceptions import DITimeoutError
+from diject.utils.status import Status
+
+
+def test_timeout__sync_creation_per_call() -> None:
+    release = threading.Event()
+    provider = di.Singleton[release.wait](5)
+
+    try:
+        # Blocking factory is abandoned once the deadline of the call elapses
+        with pytest.raises(DITimeoutError, match="Creation of"):
+            di.provide(provider, timeout=0.05)
+    finally:
+        release.set()
+
+    assert di.status(provider) is Status.CORRUPTED
+
+
+def test_timeout__sync_creation_reuses_watchdog_thread() -> None:
+    provider = di.Transient(timeout=1)[threading.current_thread]()
+
+    first = di.provide(provider)
+    second = di.provide(provider)
+
+    assert first is second
+    assert first.name == "diject-watchdog"
+
+
+def test_timeout__thread_local_stays_in_caller_thread() -> None:
+    provider = di.ThreadLocal[threading.get_ident]()
+
+    assert di.provide(provider, timeout=1) == threading.get_ident()
+
+
+def test_timeout__sync_creation_provider_option() -> None:
+    closed = threading.Event()
+
+    def create_client() -> Iterator[str]:
+        time.sleep(0.05)
+        yield "client"
+        closed.set()
+
+    provider = di.Singleton(timeout=0.01)[create_client]()
+
+    with pytest.raises(DITimeoutError, match="Creation of"):
+        di.provide(provider)
+
+    assert di.status(provider) is Status.CORRUPTED
+    # State created after the timeout is closed by the watchdog
+    assert closed.wait(1)
+
+
+def test_timeout__hung_creations_do_not_block_others() -> None:
+    release = threading.Event()
+    hung = di.Transient(timeout=0.001)[release.wait]()
+    quick = di.Transient(timeout=0.5)[lambda: 1]()
+
+    for _ in range(40):
+        with pytest.raises(DITimeoutError):
+            di.provide(hung)
+
+    try:
+        assert di.provide(quick) == 1
+    finally:
+        release.set()
+
+
+async def test_timeout__async_creation_provider_option() -> None:
+    closed: list[str] = []
+
+    async def create_client() -> AsyncIterator[str]:
+        try:
+            await asyncio.sleep(1)
+            yield "client"
+        finally:
+            closed.append("client")
+
+    provider = di.Transient(timeout=0.01)[create_client]()
+
+    async with di.inject():
+        with pytest.raises(DITimeoutError, match="Creation of"):
+            await di.aprovide(provider)
+
+    assert closed == ["client"]
+
+
+async def test_timeout__container_default() -> None:
+    async def create_slow() -> AsyncIterator[str]:
+        await asyncio.sleep(0.05)
+        yield "slow"
+
+    def collect(*values: object) -> list[object]:
+        return list(values)
+
+    class Container(di.Container):
+        __timeout__ = 0.01
+
+        slow = di.Singleton[create_slow]()
+        nested = di.Singleton[collect](di.Transient[create_slow]())
+        patient = di.Singleton(timeout=1)[create_slow]()
+        sync: int = di.Singleton[threading.get_ident]()
+
+    with pytest.raises(DITimeoutError):
+        await di.aprovide(Container.slow)
+
+    with pytest.raises(DITimeoutError):
+        await di.aprovide(Container.nested)
+
+    assert await di.aprovide(Container.patient) == "slow"
+    # Synchronous factory is not moved to a watchdog thread by the default of the container
+    assert di.provide(Container.sync) == threading.get_ident()
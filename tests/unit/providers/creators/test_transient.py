@@ -1,7 +1,14 @@
-from collections.abc import Iterator
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
 from unittest.mock import Mock
 
+import pytest
+
 import diject as di
+from diject.exceptions import DITypeError
 
 
 class MockClass:
@@ -44,3 +51,237 @@ def test_transient_provider__check_generators() -> None:
         service.assert_called_with("start")
 
     service.assert_called_with("shutdown")
+
+
+def test_transient_provider__limit_concurrent_creation() -> None:
+    active: list[int] = []
+    peak: list[int] = []
+    lock = threading.Lock()
+
+    def create_client() -> Mock:
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        return Mock()
+
+    provider: Any = di.Transient(limit=2)[create_client]()
+
+    threads = [threading.Thread(target=lambda: di.provide(provider)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = provider.__limiter__.stats
+    assert max(peak) == 2
+    assert stats.acquired == 6
+    assert stats.waiting == 0
+    assert stats.max_waiting >= 3
+
+
+def test_transient_provider__limit_async_creation_per_loop() -> None:
+    async def create_client() -> AsyncIterator[Mock]:
+        await asyncio.sleep(0.01)
+        yield Mock()
+
+    provider: Any = di.Transient(limit=1)[create_client]()
+
+    async def provide_concurrently() -> None:
+        async with di.inject():
+            await asyncio.gather(di.aprovide(provider), di.aprovide(provider))
+
+    # Each loop (e.g. one per test) waits for its own semaphore
+    asyncio.run(provide_concurrently())
+    asyncio.run(provide_concurrently())
+
+    assert provider.__limiter__.stats.acquired == 4
+
+
+async def test_transient_provider__coalesce_async_creation() -> None:
+    calls: list[int] = []
+
+    async def create_client() -> AsyncIterator[Mock]:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        yield Mock()
+
+    provider = di.Transient(coalesce=True)[create_client]()
+
+    async with di.inject():
+        first, second = await asyncio.gather(di.aprovide(provider), di.aprovide(provider))
+        third = await di.aprovide(provider)
+
+    assert first is second
+    assert third is not first
+    assert calls == [1, 1]
+
+
+async def test_transient_provider__close_async_generators_in_reverse_order() -> None:
+    events: list[str] = []
+
+    async def create_client(name: str, *_: str) -> AsyncIterator[str]:
+        yield name
+        events.append(f"closing {name}")
+        await asyncio.sleep(0.01)
+        events.append(f"closed {name}")
+
+    config: Any = di.Transient[create_client]("config")
+    session: Any = di.Transient[create_client]("session", config)
+    provider: Any = di.Transient[create_client]("client", session)
+
+    @di.inject
+    async def handler(client: str = provider) -> str:
+        return client
+
+    assert await handler() == "client"
+    assert events[:3] == ["closing client", "closing session", "closing config"]
+    assert sorted(events[3:]) == ["closed client", "closed config", "closed session"]
+
+
+def test_transient_provider__provide_n_resolve_shared_arguments_once() -> None:
+    calls: list[str] = []
+
+    def create(name: str, *_: Any, **__: Any) -> str:
+        calls.append(name)
+        return threading.current_thread().name
+
+    config: Any = di.Scoped[create]("config")
+    buffer: Any = di.Transient[create]("buffer")
+    provider: Any = di.Transient[create]("worker", config, buffers=[buffer])
+
+    assert len(di.provide_n(provider, 3)) == 3
+    assert sorted(calls) == ["buffer"] * 3 + ["config"] + ["worker"] * 3
+
+    calls.clear()
+    with di.inject():
+        threads = di.provide_n(provider, 4, parallel=True)
+
+    assert calls.count("config") == 1
+    assert calls.count("buffer") == 4
+    # Caller creates instances as well as workers of the pool
+    caller = threading.current_thread().name
+    assert all(thread == caller or thread.startswith("diject-worker") for thread in threads)
+
+
+async def test_transient_provider__aprovide_n() -> None:
+    calls: list[str] = []
+    # Every worker waits for the others, so sequential creation would time out
+    barrier = asyncio.Barrier(4)
+
+    async def create(name: str, *_: Any) -> AsyncIterator[str]:
+        calls.append(name)
+        if name == "worker":
+            await asyncio.wait_for(barrier.wait(), 5)
+        yield name
+        calls.append(f"closed {name}")
+
+    config: Any = di.Scoped[create]("config")
+    provider: Any = di.Transient[create]("worker", config)
+
+    async with di.inject():
+        workers = await di.aprovide_n(provider, 4)
+
+    assert workers == ["worker"] * 4
+    assert calls.count("config") == 1
+    assert calls.count("closed worker") == 4
+
+
+async def test_transient_provider__aprovide_n_without_coalescing() -> None:
+    async def create_client() -> AsyncIterator[Mock]:
+        await asyncio.sleep(0.01)
+        yield Mock()
+
+    provider: Any = di.Transient(coalesce=True)[create_client]()
+
+    async with di.inject():
+        clients = await di.aprovide_n(provider, 5)
+
+    assert len({id(client) for client in clients}) == 5
+
+
+def _wait_for_buffer(provider: Any, size: int) -> None:
+    deadline = time.monotonic() + 5
+    while provider.__instance_buffer__.stats.size < size and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_transient_provider__buffer_instances() -> None:
+    events: list[str] = []
+
+    def create_client() -> Iterator[Mock]:
+        events.append("created")
+        yield Mock()
+        events.append("closed")
+
+    provider: Any = di.Transient(buffer=2)[create_client]()
+
+    with di.inject():
+        di.provide(provider)
+    _wait_for_buffer(provider, 2)
+
+    with di.inject():
+        di.provide(provider)
+        assert events.count("closed") == 1
+    _wait_for_buffer(provider, 2)
+
+    stats = provider.__instance_buffer__.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 2)
+
+    di.shutdown(provider)
+
+    assert events.count("created") == 4
+    assert events.count("closed") == 4
+
+
+def test_transient_provider__buffer_instances_with_parallel_arguments() -> None:
+    def current_thread() -> str:
+        time.sleep(0.01)
+        return threading.current_thread().name
+
+    provider: Any = di.Transient(buffer=1, parallel=True)[lambda *threads: set(threads)](
+        di.Transient[current_thread](),
+        di.Transient[current_thread](),
+    )
+
+    di.start(provider)
+    _wait_for_buffer(provider, 1)
+
+    # Refill runs as a worker of the pool, so it does not submit nested work to the pool
+    with di.inject():
+        (thread,) = di.provide(provider)
+    assert thread.startswith("diject-worker")
+
+    di.shutdown(provider)
+
+
+async def test_transient_provider__buffer_instances_async() -> None:
+    events: list[str] = []
+
+    async def create_client() -> AsyncIterator[Mock]:
+        events.append("created")
+        yield Mock()
+        events.append("closed")
+
+    provider: Any = di.Transient(buffer=3)[create_client]()
+    await di.astart(provider)
+    await asyncio.sleep(0.01)
+
+    async with di.inject():
+        await asyncio.gather(*(di.aprovide(provider) for _ in range(3)))
+
+    stats = provider.__instance_buffer__.stats
+    assert (stats.hits, stats.misses) == (3, 0)
+
+    await asyncio.sleep(0.01)
+    await di.ashutdown(provider)
+
+    assert events.count("created") == 6
+    assert events.count("closed") == 6
+
+
+def test_transient_provider__buffer_only_fresh_instances() -> None:
+    with pytest.raises(DITypeError):
+        di.Singleton(buffer=2)
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from typing import Any
+
+import diject as di
+
+
+async def test_list_provider__limit_async_fan_out() -> None:
+    running = 0
+    max_running = 0
+
+    async def create_client(shard: int) -> AsyncIterator[int]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        yield shard
+
+    provider: Any = di.List([di.Transient[create_client](shard=i) for i in range(10)], limit=3)
+
+    async with di.inject():
+        clients = await di.aprovide(provider)
+
+    assert clients == list(range(10))
+    assert max_running == 3
+
+
+def test_dict_provider__parallel_sync_resolution() -> None:
+    # Every creation waits for the others, so sequential resolution would break the barrier
+    barrier = threading.Barrier(4, timeout=5)
+
+    def create_client() -> str:
+        barrier.wait()
+        return threading.current_thread().name
+
+    provider: Any = di.Dict(
+        {i: di.Transient[create_client]() for i in range(4)},
+        parallel=True,
+    )
+
+    threads = di.provide(provider)
+
+    assert list(threads) == [0, 1, 2, 3]
+    assert len(set(threads.values())) == 4
+
+
+def test_collections__container_default_limit() -> None:
+    class Container(di.Container):
+        __collection_limit__ = 4
+
+        clients = di.List([di.Transient[object]()])
+        limited = di.Dict({"a": di.Transient[object]()}, limit=2)
+
+    provider: Any = Container.clients
+    limited: Any = Container.limited
+
+    assert provider.__limit__ == 4
+    assert limited.__limit__ == 2
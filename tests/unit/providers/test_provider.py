@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock, Mock
+
+import diject as di
+from diject.providers.provider import Provider
+
+
+def test_provider__alias_of_nested_providers() -> None:
+    class Container(di.Container):
+        singleton = di.Singleton[MagicMock](1, dep=di.Transient[Mock](items=[2]))
+        callable = singleton(3, key=4)
+
+    aliases = {
+        di.alias(provider)
+        for _, provider in di.travers(Container.singleton, types=Provider, recursive=True)
+    }
+
+    assert aliases == {
+        "Container.singleton.0",
+        "Container.singleton.dep",
+        "Container.singleton.dep.items",
+        "Container.singleton.dep.items.0",
+    }
+    assert di.alias(Container.callable) == "Container.callable"
+    assert di.alias(Container.singleton.attr) == "Container.singleton.attr"
+    assert di.alias(Container.singleton["key"]) == "Container.singleton[key]"
+
+
+def test_provider__alias_resolved_after_definition() -> None:
+    dependency = di.Transient[Mock]()
+    provider = di.Singleton[Mock](dep=dependency)
+
+    assert di.alias(dependency) == ""
+
+    class Container(di.Container):
+        singleton = provider
+
+    assert di.alias(dependency) == "Container.singleton.dep"
+
+
+def test_provider__alias_first_definition_wins() -> None:
+    class Container(di.Container):
+        first = di.Singleton[Mock]()
+        second = first
+
+    assert di.alias(Container.second) == "Container.first"
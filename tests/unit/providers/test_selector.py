@@ -1,6 +1,15 @@
+import asyncio
+import threading
+import warnings
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar, copy_context
+from typing import Any
 from unittest.mock import Mock
 
+import pytest
+
 import diject as di
+from diject.exceptions import DISelectorError
 
 
 def test_selector() -> None:
@@ -28,3 +37,193 @@ def test_selector__start() -> None:
 
     mock_a.assert_called()
     mock_b.assert_not_called()
+
+
+def test_selector__select_again_after_shutdown() -> None:
+    class Container(di.Container):
+        option = di.Object("opt_a")
+        selector_provider = di.Selector[option](
+            opt_a="A",
+            opt_b="B",
+        )
+
+    assert di.provide(Container.selector_provider) == "A"
+
+    Container.shutdown()
+    Container.option = "opt_b"
+
+    assert di.provide(Container.selector_provider) == "B"
+
+
+def test_selector__switch_group() -> None:
+    mock_a = Mock()
+    mock_b = Mock()
+
+    class Container(di.Container):
+        with di.Selector["opt_a"] as GroupSelector:
+            first = GroupSelector[str]()
+            second = GroupSelector[Mock]()
+
+        with GroupSelector == "opt_a" as Option:
+            Option[first] = "A"
+            Option[second] = di.Singleton[mock_a]()
+
+        with GroupSelector == "opt_b" as Option:
+            Option[first] = "B"
+            Option[second] = di.Singleton[mock_b]()
+
+    assert di.provide(Container.first) == "A"
+
+    di.switch(Container.first, "opt_b")
+
+    assert di.provide(Container.first) == "B"
+    assert di.provide(Container.second) is mock_b.return_value
+
+
+def test_selector__switch_after_context_is_closed() -> None:
+    def _service(name: str) -> Iterator[Mock]:
+        mock = Mock(name=name)
+        yield mock
+        mock("shutdown")
+
+    class Container(di.Container):
+        selector_provider = di.Selector["opt_a"](
+            opt_a=di.Singleton[_service](name="A"),
+            opt_b=di.Singleton[_service](name="B"),
+        )
+
+    with di.inject():
+        service_a = di.provide(Container.selector_provider)
+
+        thread = threading.Thread(target=di.switch, args=(Container.selector_provider, "opt_b"))
+        thread.start()
+        thread.join(timeout=0.1)
+
+        assert thread.is_alive()
+        assert di.provide(Container.selector_provider) is service_a
+        service_a.assert_not_called()
+
+    thread.join()
+
+    service_a.assert_called_with("shutdown")
+    assert di.provide(Container.selector_provider) is not service_a
+
+
+def test_selector__switch_rebuilds_singleton_dependents() -> None:
+    def _repository(name: str) -> Iterator[Mock]:
+        mock = Mock(name=name)
+        yield mock
+        mock("shutdown")
+
+    class Container(di.Container):
+        repository = di.Selector["a"](
+            a=di.Singleton[_repository](name="A"),
+            b=di.Singleton[_repository](name="B"),
+        )
+        service = di.Singleton[Mock](repository=repository)
+
+    repository_a = di.provide(Container.service).repository
+
+    thread = threading.Thread(target=di.switch, args=(Container.repository, "b"))
+    thread.start()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+    repository_a.assert_called_with("shutdown")
+    assert di.provide(Container.service).repository is di.provide(Container.repository)
+    assert di.provide(Container.service).repository is not repository_a
+
+
+def test_selector__switch_after_provide_many() -> None:
+    def _service(name: str) -> Iterator[Mock]:
+        mock = Mock(name=name)
+        yield mock
+        mock("shutdown")
+
+    class Container(di.Container):
+        selector_provider = di.Selector["opt_a"](
+            opt_a=di.Singleton[_service](name="A"),
+            opt_b=di.Singleton[_service](name="B"),
+        )
+
+    # Temporary context of provide_many is not closed, so it does not hold the option
+    (service_a,) = di.provide_many([Container.selector_provider])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        di.switch(Container.selector_provider, "opt_b", timeout=1)
+
+    service_a.assert_called_with("shutdown")
+
+
+async def test_selector__aswitch() -> None:
+    class Container(di.Container):
+        selector_provider = di.Selector["opt_a"](
+            opt_a="A",
+            opt_b="B",
+        )
+
+    assert await di.aprovide(Container.selector_provider) == "A"
+
+    await di.aswitch(Container.selector_provider, "opt_b")
+
+    assert await di.aprovide(Container.selector_provider) == "B"
+
+
+async def test_selector__aswitch_after_context_is_closed() -> None:
+    closed = asyncio.Event()
+
+    async def _service(name: str) -> AsyncIterator[str]:
+        yield name
+        closed.set()
+
+    class Container(di.Container):
+        selector_provider = di.Selector["opt_a"](
+            opt_a=di.Singleton[_service](name="A"),
+            opt_b=di.Singleton[_service](name="B"),
+        )
+
+    async with di.inject():
+        assert await di.aprovide(Container.selector_provider) == "A"
+
+        switching = asyncio.create_task(di.aswitch(Container.selector_provider, "opt_b"))
+        await asyncio.sleep(0.01)
+
+        assert not switching.done()
+        assert await di.aprovide(Container.selector_provider) == "A"
+
+    # Drain is notified when the last context using the previous option is closed
+    await asyncio.wait_for(switching, timeout=5)
+
+    assert closed.is_set()
+    assert await di.aprovide(Container.selector_provider) == "B"
+
+
+def test_selector__dynamic_option_per_context() -> None:
+    variant: ContextVar[str] = ContextVar("variant")
+    mock_a = Mock()
+    mock_b = Mock()
+
+    selector_provider = di.Selector[variant](
+        a=di.Singleton[mock_a](),
+        b=di.Singleton[mock_b](),
+    )
+
+    def resolve(option: str) -> Any:
+        variant.set(option)
+        return di.provide(selector_provider)
+
+    assert copy_context().run(resolve, "a") is mock_a.return_value
+    assert copy_context().run(resolve, "b") is mock_b.return_value
+    assert copy_context().run(resolve, "a") is mock_a.return_value
+    mock_a.assert_called_once()
+
+    selected = [name for name, _ in di.travers(selector_provider, only_selected=True)]
+    assert selected == ["[a]", "[b]"]
+
+    with pytest.raises(DISelectorError):
+        di.switch(selector_provider, "b")
+
+    di.shutdown(selector_provider)
+
+    assert list(di.travers(selector_provider, only_selected=True)) == []
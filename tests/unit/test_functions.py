@@ -0,0 +1,246 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any
+from unittest.mock import Mock
+
+import diject as di
+from diject.utils.status import Status
+
+
+def test_start_for__start_only_required_providers() -> None:
+    mock_database = Mock()
+    mock_kafka = Mock()
+    mock_cache = Mock()
+
+    class Container(di.Container):
+        database: Mock = di.Singleton[mock_database]()
+        kafka: Mock = di.Singleton[mock_kafka]()
+        cache: Mock = di.Selector["memory"](
+            memory=di.Singleton[mock_cache](),
+            redis=di.Singleton[Mock](),
+        )
+        service: Mock = di.Transient[Mock](database=database)
+
+    @di.inject
+    def main(cache: Annotated[Mock, Container.cache], service: Mock = Container.service) -> None:
+        pass
+
+    skipped = di.start_for(main, container=Container)
+
+    mock_database.assert_called_once()
+    mock_cache.assert_called_once()
+    mock_kafka.assert_not_called()
+    assert skipped == ["Container.kafka"]
+
+
+async def test_astart_for__start_only_required_providers() -> None:
+    mock_database = Mock()
+    mock_kafka = Mock()
+
+    class Container(di.Container):
+        database: Mock = di.Singleton[mock_database]()
+        kafka: Mock = di.Singleton[mock_kafka]()
+
+    skipped = await di.astart_for(Container.database, container=Container)
+
+    mock_database.assert_called_once()
+    mock_kafka.assert_not_called()
+    assert skipped == ["Container.kafka"]
+
+
+def test_invalidate__rebuild_only_affected_singletons() -> None:
+    closed = []
+
+    def create_client(url: str) -> Iterator[str]:
+        yield f"client({url})"
+        closed.append(url)
+
+    mock_cache = Mock()
+
+    class Container(di.Container):
+        url = di.Object("a")
+        client: str = di.Singleton[create_client](url=url)
+        service: str = di.Singleton[str](client)
+        cache: Mock = di.Singleton[mock_cache]()
+
+    Container.start()
+
+    restarted = Container.update(url="b")
+
+    assert restarted == ["Container.client", "Container.service"]
+    assert closed == ["a"]
+    assert di.provide(Container.service) == "client(b)"
+    mock_cache.assert_called_once()
+
+
+async def test_ainvalidate__rebuild_only_affected_singletons() -> None:
+    mock_cache = Mock()
+
+    class Container(di.Container):
+        url = di.Object("a")
+        service: str = di.Singleton[str](url)
+        cache: Mock = di.Singleton[mock_cache]()
+
+    await Container.astart()
+
+    restarted = await Container.aupdate(url="b")
+
+    assert restarted == ["Container.service"]
+    assert await di.aprovide(Container.service) == "b"
+    mock_cache.assert_called_once()
+
+
+def test_invalidate__skip_idle_singletons() -> None:
+    class Container(di.Container):
+        url = di.Object("a")
+        service: str = di.Singleton[str](url)
+
+    restarted = Container.update(url="b")
+
+    assert restarted == []
+    assert di.status(Container.service) is Status.IDLE
+    assert di.provide(Container.service) == "b"
+
+
+def test_submit__share_scope_until_function_finishes() -> None:
+    release = threading.Event()
+    events: list[str] = []
+
+    def create_session() -> Iterator[object]:
+        yield object()
+        events.append("closed")
+
+    provider: Any = di.Scoped[create_session]()
+
+    def work(session: object) -> bool:
+        release.wait(timeout=5)
+        events.append("worked")
+        return di.provide(provider) is session
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with di.inject():
+            future = di.submit(executor, work, di.provide(provider))
+
+        assert events == []
+        release.set()
+        assert future.result(timeout=5)
+
+    di.shutdown(provider)
+
+    assert events == ["worked", "closed"]
+
+
+async def test_create_task__share_scope_until_task_finishes() -> None:
+    release = asyncio.Event()
+    events: list[str] = []
+
+    async def create_session() -> AsyncIterator[object]:
+        yield object()
+        events.append("closed")
+
+    provider: Any = di.Scoped[create_session]()
+
+    async def work(session: object) -> bool:
+        await release.wait()
+        events.append("worked")
+        return await di.aprovide(provider) is session
+
+    async with di.inject():
+        task = di.create_task(work(await di.aprovide(provider)))
+
+    assert events == []
+    release.set()
+    assert await task
+
+    await di.ashutdown(provider)
+
+    assert events == ["worked", "closed"]
+
+
+async def test_context_executor__share_scope_in_run_in_executor() -> None:
+    provider: Any = di.Scoped[object]()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        executor = di.ContextExecutor(pool)
+        async with di.inject():
+            session = await di.aprovide(provider)
+            loop = asyncio.get_running_loop()
+            sessions = await asyncio.gather(
+                *(loop.run_in_executor(executor, di.provide, provider) for _ in range(4)),
+            )
+
+    assert all(value is session for value in sessions)
+
+
+def _scale(item: int, factor: int = di.Object(10)) -> int:
+    return item * factor
+
+
+def test_map__share_scope_within_batch() -> None:
+    sessions: list[object] = []
+
+    def create_session() -> Iterator[object]:
+        session = object()
+        sessions.append(session)
+        yield session
+
+    def handle(item: int, session: object = di.Scoped[create_session]()) -> tuple[int, object]:
+        return item, session
+
+    results = list(di.map(handle, range(10), batch_size=4, workers=2))
+
+    assert [item for item, _ in results] == list(range(10))
+    batches = [{id(session) for _, session in results[i : i + 4]} for i in range(0, 10, 4)]
+    assert len(sessions) == 3
+    assert all(len(batch) == 1 for batch in batches)
+    assert len(set.union(*batches)) == 3
+
+
+def test_map__read_ahead_bounded_number_of_batches() -> None:
+    consumed: list[int] = []
+
+    def items() -> Iterator[int]:
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    results = di.map(_scale, items(), batch_size=10, workers=2)
+
+    assert next(results) == 0
+    assert len(consumed) <= 4 * 10 + 1
+
+    results.close()
+
+
+def test_map__process_executor() -> None:
+    assert list(di.map(_scale, range(5), batch_size=2, workers=2, executor="process")) == [0, 10, 20, 30, 40]
+
+
+def test_provide_many__share_scoped_dependencies() -> None:
+    session: Any = di.Scoped[object]()
+    first: Any = di.Transient[list]([session])
+    second: Any = di.Transient[list]([session])
+
+    values = di.provide_many({"first": first, "second": second})
+
+    assert list(values) == ["first", "second"]
+    assert values["first"][0] is values["second"][0]
+    assert di.provide(first)[0] is not values["first"][0]
+
+
+async def test_aprovide_many__resolve_concurrently() -> None:
+    # Every creation waits for the others, so sequential resolution would time out
+    barrier = asyncio.Barrier(4)
+
+    async def create_client(name: str) -> AsyncIterator[str]:
+        await asyncio.wait_for(barrier.wait(), 5)
+        yield name
+
+    providers: list[Any] = [di.Scoped[create_client](name=str(i)) for i in range(4)]
+
+    async with di.inject():
+        values = await di.aprovide_many(providers)
+
+    assert values == ("0", "1", "2", "3")
@@ -0,0 +1,94 @@
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import diject as di
+from diject.tools.profile import Recorder, load_profile
+
+
+def test_profile__record_and_start(tmp_path: Path) -> None:
+    mock_used = Mock()
+    mock_unused = Mock()
+
+    class Container(di.Container):
+        used: Mock = di.Singleton[mock_used]()
+        unused: Mock = di.Singleton[mock_unused]()
+
+    profile = tmp_path / "profile.json"
+
+    with di.record(profile):
+        di.provide(Container.used)
+
+    Container.shutdown()
+    mock_used.reset_mock()
+
+    assert load_profile(profile) == ["Container.used"]
+
+    Container.start(profile=profile)
+
+    mock_used.assert_called_once()
+    mock_unused.assert_not_called()
+
+
+def test_profile__stop_after_max_requests(tmp_path: Path) -> None:
+    class Container(di.Container):
+        first = di.Transient[Mock]()
+        second = di.Transient[Mock]()
+
+    profile = tmp_path / "profile.json"
+
+    di.record(profile, max_requests=1).start()
+
+    with di.inject():
+        di.provide(Container.first)
+
+    with di.inject():
+        di.provide(Container.second)
+
+    assert load_profile(profile) == ["Container.first"]
+
+
+async def test_profile__astart(tmp_path: Path) -> None:
+    mock = Mock()
+
+    class Container(di.Container):
+        singleton: Mock = di.Singleton[mock]()
+        transient = di.Transient[Mock](dep=singleton)
+
+    profile = tmp_path / "profile.json"
+    profile.write_text('{"providers": ["Container.transient"]}')
+
+    await Container.astart(profile=profile)
+
+    mock.assert_called_once()
+
+
+def test_profile__start_all_when_missing(tmp_path: Path) -> None:
+    mock = Mock()
+
+    class Container(di.Container):
+        singleton: Mock = di.Singleton[mock]()
+
+    with pytest.warns(UserWarning, match="does not exist"):
+        Container.start(profile=tmp_path / "profile.json")
+
+    mock.assert_called_once()
+
+
+def test_profile__stop_after_max_duration_without_requests(tmp_path: Path) -> None:
+    class Container(di.Container):
+        transient = di.Transient[Mock]()
+
+    profile = tmp_path / "profile.json"
+
+    di.record(profile, max_duration=0.05).start()
+
+    with di.inject():
+        di.provide(Container.transient)
+
+    time.sleep(0.5)
+
+    assert Recorder.get_active() is None
+    assert load_profile(profile) == ["Container.transient"]
@@ -0,0 +1,135 @@
+import asyncio
+import builtins
+import random
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+import diject as di
+from diject.injector import Injector
+from diject.providers.provider import Provider
+from diject.utils.tasks import gather
+
+
+async def test_gather__cancel_siblings_on_failure() -> None:
+    cancelled: list[str] = []
+
+    async def slow() -> None:
+        try:
+            # Never set, so it finishes only when it is cancelled
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def fail() -> None:
+        await asyncio.sleep(0)
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError, match="fail"):
+        async with asyncio.timeout(5):
+            await gather(slow(), fail())
+
+    assert cancelled == ["slow"]
+
+
+async def test_gather__close_created_states_on_failure_at_random_depth() -> None:
+    opened: set[int] = set()
+    rng = random.Random(0)
+
+    def create_tree(depth: int, failing: int) -> Provider[Any]:
+        async def create_node(*_: Any) -> AsyncIterator[int]:
+            node = rng.getrandbits(64)
+            opened.add(node)
+            try:
+                await asyncio.sleep(rng.random() / 1000)
+                if depth == failing:
+                    raise RuntimeError("failure injected")
+                yield node
+            finally:
+                opened.discard(node)
+
+        children = [create_tree(depth + 1, failing) for _ in range(2)] if depth < 4 else []
+        return di.Transient[create_node](*children)  # type: ignore[return-value]
+
+    async def request(failing: int) -> None:
+        provider = create_tree(0, failing)
+
+        async with Injector():
+            await di.aprovide(provider)
+
+    results = await asyncio.gather(
+        *(request(rng.randint(0, 5)) for _ in range(50)),
+        return_exceptions=True,
+    )
+
+    assert any(isinstance(result, RuntimeError) for result in results)
+    assert not any(isinstance(result, builtins.BaseExceptionGroup) for result in results)
+    assert opened == set()
+
+
+async def test_gather__close_dependencies_of_cancelled_singleton() -> None:
+    opened: set[str] = set()
+    started = asyncio.Event()
+
+    async def create_resource(name: str) -> AsyncIterator[str]:
+        opened.add(name)
+        try:
+            yield name
+        finally:
+            opened.discard(name)
+
+    async def create_service(*resources: Any) -> AsyncIterator[list[str]]:
+        started.set()
+        await asyncio.sleep(10)
+        yield list(resources)
+
+    provider = di.Singleton[create_service](
+        di.Scoped[create_resource]("first"),
+        di.Scoped[create_resource]("second"),
+    )
+
+    task = asyncio.create_task(di.aprovide(provider))
+    await started.wait()
+    assert opened == {"first", "second"}
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert opened == set()
+
+
+async def test_aprovide_all__resolve_ready_providers_inline() -> None:
+    created: list[Any] = []
+
+    def task_factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task:
+        created.append(coro)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    async def create_client() -> AsyncIterator[str]:
+        await asyncio.sleep(0)
+        yield "client"
+
+    singleton = di.Singleton[dict]()
+    await di.astart(singleton)
+
+    constants = di.List([*(di.Object(i) for i in range(100)), singleton])
+    provider: Any = di.Tuple(
+        (constants, di.Transient[create_client](), di.Transient[create_client]()),  # type: ignore[arg-type]
+    )
+
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    loop.set_task_factory(task_factory)
+    try:
+        async with Injector():
+            values, first, second = await di.aprovide(provider)
+            # Only providers which have to wait are run by tasks
+            assert len(created) == 2
+    finally:
+        loop.set_task_factory(previous)
+
+    assert values == [*range(100), {}]
+    assert (first, second) == ("client", "client")
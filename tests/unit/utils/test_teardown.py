@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
+
+import diject as di
+from diject.utils.context import Context
+from diject.utils.state import State
+from diject.utils.teardown import Teardown
+
+
+def test_inject__defer_close_in_background_thread() -> None:
+    release = threading.Event()
+    closed: list[str] = []
+
+    def create_client() -> Iterator[str]:
+        yield "client"
+        release.wait(timeout=5)
+        closed.append(threading.current_thread().name)
+
+    class Container(di.Container):
+        client = di.Scoped[create_client]()
+
+    @di.inject(defer_close=True)
+    def handler(client: str = Container.client) -> str:
+        return client
+
+    assert handler() == "client"
+    assert closed == []
+
+    release.set()
+    Container.shutdown()
+
+    assert closed == ["diject-teardown"]
+
+
+async def test_inject__defer_close_in_background_task() -> None:
+    release = asyncio.Event()
+    closed: list[str] = []
+
+    async def create_client() -> AsyncIterator[str]:
+        yield "client"
+        await release.wait()
+        closed.append("client")
+
+    class Container(di.Container):
+        client = di.Scoped[create_client]()
+
+    async with di.inject(defer_close=True):
+        assert await di.aprovide(Container.client) == "client"
+
+    await asyncio.sleep(0)
+    assert closed == []
+
+    release.set()
+    await Container.ashutdown()
+
+    assert closed == ["client"]
+
+
+async def test_teardown__wait_for_free_slot() -> None:
+    release = asyncio.Event()
+    events: list[str] = []
+
+    async def create_context(name: str) -> Context:
+        async def create_client() -> AsyncIterator[str]:
+            yield name
+            await release.wait()
+            events.append(f"closed {name}")
+
+        client = create_client()
+        state = State(object=client, instance=await anext(client))
+        return Context(exits=[state])
+
+    teardown = Teardown(maxsize=1)
+
+    async def submit(name: str) -> None:
+        await teardown.asubmit(await create_context(name))
+        events.append(f"submitted {name}")
+
+    await submit("first")
+    waiting = asyncio.create_task(submit("second"))
+    await asyncio.sleep(0.01)
+
+    assert events == ["submitted first"]
+
+    release.set()
+    await waiting
+    await teardown.aflush()
+
+    assert events == ["submitted first", "closed first", "submitted second", "closed second"]